@@ -28,40 +28,69 @@ import traceback
 import typing
 import uuid
 import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from inspect import signature, Signature, Parameter
 from typing import Any, Awaitable, Callable, Optional, Tuple
 
 import uvicorn
-from bittensor_wallet import Wallet, Keypair
+from bittensor_wallet import Wallet
 
-from fastapi import APIRouter, Depends, FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.routing import serialize_response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import Headers
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 from bittensor.core.chain_data import AxonInfo
+from bittensor.core import wire_format
 from bittensor.core.config import Config
 from bittensor.core.errors import (
     BlacklistedException,
     InvalidRequestNameError,
     NotVerifiedException,
+    PayloadTooLargeException,
     PostProcessException,
     PriorityException,
+    RateLimitedException,
     SynapseDendriteNoneException,
     SynapseException,
     SynapseParsingError,
     UnknownSynapseError,
+    UnsupportedMediaTypeException,
 )
-from bittensor.core.settings import DEFAULTS, version_as_int
+from bittensor.core.metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    METRICS_PATH,
+    AxonMetrics,
+)
+from bittensor.core.nonce_store import DiskNonceStore, MemoryNonceStore, NonceStore
+from bittensor.core.rate_limiter import TokenBucketRateLimiter
+from bittensor.core.scheduler import AdmissionController, PriorityScheduler
+from bittensor.core.settings import DEFAULTS, MINERS_DIR, version_as_int
 from bittensor.core.stream import StreamingSynapse
 from bittensor.core.synapse import Synapse, TerminalInfo
 from bittensor.core.threadpool import PriorityThreadPoolExecutor
 from bittensor.utils import networking, Certificate
-from bittensor.utils.axon_utils import allowed_nonce_window_ns, calculate_diff_seconds
+from bittensor.utils.axon_utils import (
+    allowed_nonce_window_ns,
+    calculate_diff_seconds,
+    NANOSECONDS_IN_SECOND,
+    verify_signature,
+)
 from bittensor.utils.btlogging import logging
+from bittensor.utils.compression import (
+    ACCEPT_ENCODING_HEADER,
+    CONTENT_ENCODING_HEADER,
+    DecompressedSizeError,
+    available_encodings,
+    compress,
+    decompress,
+    negotiate_encoding,
+    parse_encodings,
+)
 
 # Just for annotation checker
 if typing.TYPE_CHECKING:
@@ -280,6 +309,7 @@ class Axon:
         external_ip (Optional[str]): External IP address to broadcast.
         external_port (Optional[int]): External port to broadcast.
         max_workers (Optional[int]): Number of active threads for request handling.
+        nonce_store (Optional[bittensor.core.nonce_store.NonceStore]): Storage of the last processed nonce per dendrite, used for replay protection.
 
     Returns:
         bittensor.core.axon.Axon: An instance of the axon class configured as per the provided arguments.
@@ -316,6 +346,7 @@ class Axon:
         external_ip: Optional[str] = None,
         external_port: Optional[int] = None,
         max_workers: Optional[int] = None,
+        nonce_store: Optional["NonceStore"] = None,
     ):
         """Creates a new bittensor.Axon object from passed arguments.
 
@@ -327,6 +358,7 @@ class Axon:
             external_ip (:type:`Optional[str]`): The external ip of the server to broadcast to the network.
             external_port (:type:`Optional[int]`): The external port of the server to broadcast to the network.
             max_workers (:type:`Optional[int]`): Used to create the threadpool if not passed, specifies the number of active threads servicing requests.
+            nonce_store (:obj:`Optional[bittensor.core.nonce_store.NonceStore]`): Nonce store used for replay protection. If not passed, it is built from ``config.axon.nonce_store``.
         """
         # Build and check config.
         if config is None:
@@ -347,11 +379,8 @@ class Axon:
         self.uuid = str(uuid.uuid1())
         self.ip = self.config.axon.ip  # type: ignore
         self.port = self.config.axon.port  # type: ignore
-        self.external_ip = (
-            self.config.axon.external_ip  # type: ignore
-            if self.config.axon.external_ip is not None  # type: ignore
-            else networking.get_external_ip()
-        )
+        # Resolved on first use when not configured.
+        self._external_ip: Optional[str] = self.config.axon.external_ip  # type: ignore
         self.external_port = (
             self.config.axon.external_port  # type: ignore
             if self.config.axon.external_port is not None  # type: ignore
@@ -364,7 +393,39 @@ class Axon:
         self.thread_pool = PriorityThreadPoolExecutor(
             max_workers=self.config.axon.max_workers  # type: ignore
         )
-        self.nonces: dict[str, int] = {}
+        self.nonces: "NonceStore" = (
+            nonce_store if nonce_store is not None else self._build_nonce_store()
+        )
+        self.crypto_executor, self.signing_executor = self._build_crypto_executors()
+        self.scheduler: Optional["PriorityScheduler"] = None
+        self.forward_executor: Optional["Executor"] = None
+        if self.config.axon.priority_scheduling:  # type: ignore
+            self.scheduler = PriorityScheduler(
+                max_concurrency=self.config.axon.max_workers  # type: ignore
+            )
+            self.forward_executor = ThreadPoolExecutor(
+                max_workers=self.config.axon.max_workers,  # type: ignore
+                thread_name_prefix="axon-forward",
+            )
+        self.admission: Optional["AdmissionController"] = None
+        if self.config.axon.load_shedding:  # type: ignore
+            self.admission = AdmissionController(
+                concurrency=self.config.axon.max_workers  # type: ignore
+            )
+        self.hotkey_rate_limiter, self.ip_rate_limiter = self._build_rate_limiters()
+        self.metrics: Optional["AxonMetrics"] = (
+            AxonMetrics(self) if self.config.axon.metrics else None  # type: ignore
+        )
+        self.compression = bool(self.config.axon.compression)  # type: ignore
+        self.compression_threshold = (
+            self.config.axon.compression_threshold  # type: ignore
+            or DEFAULTS.axon.compression_threshold
+        )
+        self.max_decompressed_size = (
+            self.config.axon.max_decompressed_size  # type: ignore
+            or DEFAULTS.axon.max_decompressed_size
+        )
+        self.reject_legacy_nonces = bool(self.config.axon.reject_legacy_nonces)  # type: ignore
 
         # Request default functions.
         self.forward_class_types: dict[str, list[Signature]] = {}
@@ -381,6 +442,10 @@ class Axon:
         )
         self.fast_server = FastAPIThreadedServer(config=self.fast_config)
         self.router = APIRouter()
+        if self.metrics is not None:
+            self.router.add_api_route(
+                METRICS_PATH, self.metrics_endpoint, methods=["GET"]
+            )
         self.app.include_router(self.router)
 
         # Build ourselves as the middleware.
@@ -395,6 +460,20 @@ class Axon:
             forward_fn=ping, verify_fn=None, blacklist_fn=None, priority_fn=None
         )
 
+    @property
+    def external_ip(self) -> str:
+        """
+        The external IP address broadcast to the network, ``config.axon.external_ip`` if set, otherwise resolved on
+        first use with :func:`bittensor.utils.networking.get_cached_external_ip`.
+        """
+        if self._external_ip is None:
+            self._external_ip = networking.get_cached_external_ip()
+        return self._external_ip
+
+    @external_ip.setter
+    def external_ip(self, external_ip: Optional[str]):
+        self._external_ip = external_ip
+
     def info(self) -> "AxonInfo":
         """Returns the axon info object associated with this axon."""
         return AxonInfo(
@@ -409,6 +488,103 @@ class Axon:
             placeholder2=0,
         )
 
+    def _build_nonce_store(self) -> "NonceStore":
+        """Creates the nonce store configured by ``config.axon.nonce_store``."""
+        axon_config = self.config.axon  # type: ignore
+        max_size = (
+            axon_config.nonce_store_max_size or DEFAULTS.axon.nonce_store_max_size
+        )
+        if axon_config.nonce_store == "disk":
+            path = axon_config.nonce_store_path or str(
+                MINERS_DIR / f"nonces-{self.wallet.hotkey.ss58_address}-{self.port}.db"
+            )
+            return DiskNonceStore(path=path, max_size=max_size)
+        return MemoryNonceStore(max_size=max_size)
+
+    def _build_crypto_executors(
+        self,
+    ) -> tuple[Optional["Executor"], Optional["Executor"]]:
+        """
+        Creates the executors running signature verification and response signing off the event loop, as
+        configured by ``config.axon.crypto_workers`` and ``config.axon.crypto_executor``.
+
+        The hotkey never leaves this process, so signing always runs in a thread pool, even when verification
+        runs in a process pool.
+
+        Returns:
+            tuple: The verification executor and the signing executor, both ``None`` when crypto runs inline.
+        """
+        axon_config = self.config.axon  # type: ignore
+        workers = axon_config.crypto_workers or 0
+        if workers <= 0:
+            return None, None
+        signing_executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="axon-crypto"
+        )
+        if axon_config.crypto_executor == "process":
+            return ProcessPoolExecutor(max_workers=workers), signing_executor
+        return signing_executor, signing_executor
+
+    def _build_rate_limiters(
+        self,
+    ) -> tuple[Optional["TokenBucketRateLimiter"], Optional["TokenBucketRateLimiter"]]:
+        """
+        Creates the per hotkey and per ip address rate limiters configured by ``config.axon.rate_limit`` and
+        ``config.axon.ip_rate_limit``.
+
+        Returns:
+            tuple: The hotkey rate limiter and the ip rate limiter, each ``None`` when disabled.
+        """
+        axon_config = self.config.axon  # type: ignore
+        hotkey_rate_limiter = (
+            TokenBucketRateLimiter(
+                rate=axon_config.rate_limit, burst=axon_config.rate_limit_burst
+            )
+            if axon_config.rate_limit
+            else None
+        )
+        ip_rate_limiter = (
+            TokenBucketRateLimiter(
+                rate=axon_config.ip_rate_limit, burst=axon_config.ip_rate_limit_burst
+            )
+            if axon_config.ip_rate_limit
+            else None
+        )
+        return hotkey_rate_limiter, ip_rate_limiter
+
+    async def metrics_endpoint(self) -> "Response":
+        """Serves the request metrics of the axon in the Prometheus text format."""
+        return Response(
+            content=self.metrics.render(),  # type: ignore
+            media_type=METRICS_CONTENT_TYPE,
+        )
+
+    def compress_response(self, request: "Request", response: "Response") -> "Response":
+        """
+        Compresses the body of a response with the preferred encoding accepted by the dendrite, if compression is
+        enabled and the body is larger than ``compression_threshold``. The response also advertises the encodings
+        the axon can decode, so that the dendrite may compress its next requests.
+
+        Args:
+            request (Request): The request the response answers.
+            response (Response): The response, with its body fully rendered.
+
+        Returns:
+            Response: The response, compressed in place.
+        """
+        if not self.compression:
+            return response
+        response.headers[ACCEPT_ENCODING_HEADER] = ", ".join(available_encodings())
+        encoding = negotiate_encoding(
+            parse_encodings(request.headers.get(ACCEPT_ENCODING_HEADER))
+        )
+        if encoding is None or len(response.body) < self.compression_threshold:
+            return response
+        response.body = compress(response.body, encoding)
+        response.headers[CONTENT_ENCODING_HEADER] = encoding
+        response.headers["content-length"] = str(len(response.body))
+        return response
+
     def attach(
         self,
         forward_fn: Callable,
@@ -488,15 +664,51 @@ class Axon:
         ), "The first argument of forward_fn must inherit from bittensor.Synapse"
         request_name = param_class.__name__
 
-        async def endpoint(*args, **kwargs):
+        async def endpoint(request: "Request", **kwargs):
             start_time = time.time()
-            response = forward_fn(*args, **kwargs)
+            # The synapse decoded and processed by the middleware.
+            # The middleware consumed the body, it cannot be read again here.
+            synapse = getattr(request.state, "synapse", None)
+            if synapse is None:
+                raise RuntimeError(
+                    f"No synapse was decoded for the {request_name} request, the endpoints must be served "
+                    f"behind the {self.middleware_cls.__name__}"
+                )
+            forward_start = time.perf_counter()
+            if self.forward_executor is not None and not inspect.iscoroutinefunction(
+                forward_fn
+            ):
+                # Keep the event loop free to schedule the queued requests.
+                response = await asyncio.get_running_loop().run_in_executor(
+                    self.forward_executor, lambda: forward_fn(synapse, **kwargs)
+                )
+            else:
+                response = forward_fn(synapse, **kwargs)
             if isinstance(response, Awaitable):
                 response = await response
+            serialization_start = time.perf_counter()
+            if self.metrics is not None:
+                self.metrics.observe_stage(
+                    request_name, "forward", serialization_start - forward_start
+                )
             if isinstance(response, Synapse):
-                return await self.middleware_cls.synapse_to_response(
-                    synapse=response, start_time=start_time
+                response = self.compress_response(
+                    request,
+                    await self.middleware_cls.synapse_to_response(
+                        synapse=response,
+                        start_time=start_time,
+                        msgpack=wire_format.accepts_msgpack(
+                            request.headers.get("accept")
+                        ),
+                    ),
                 )
+                if self.metrics is not None:
+                    self.metrics.observe_stage(
+                        request_name,
+                        "serialization",
+                        time.perf_counter() - serialization_start,
+                    )
+                return response
             else:
                 response_synapse = getattr(response, "synapse", None)
                 if response_synapse is None:
@@ -507,7 +719,7 @@ class Axon:
                         DeprecationWarning,
                     )
                     # Replace with `return response` in next major version
-                    response_synapse = args[0]
+                    response_synapse = synapse
 
                 return await self.middleware_cls.synapse_to_response(
                     synapse=response_synapse,
@@ -531,8 +743,17 @@ class Axon:
             else:
                 return_annotation = JSONResponse
 
+        # The synapse is decoded once by the middleware, so FastAPI only gets the request,
+        # along with any additional parameter of the forward function.
         endpoint.__signature__ = Signature(  # type: ignore
-            parameters=list(forward_sig.parameters.values()),
+            parameters=[
+                Parameter(
+                    name="request",
+                    kind=Parameter.POSITIONAL_OR_KEYWORD,
+                    annotation=Request,
+                )
+            ]
+            + list(forward_sig.parameters.values())[1:],
             return_annotation=return_annotation,
         )
 
@@ -541,7 +762,6 @@ class Axon:
             path=f"/{request_name}",
             endpoint=endpoint,
             methods=["GET", "POST"],
-            dependencies=[Depends(self.verify_body_integrity)],
         )
         self.app.include_router(self.router)
 
@@ -652,6 +872,118 @@ class Axon:
                         The grpc server distributes new worker threads to service requests up to this number.""",
                 default=DEFAULTS.axon.max_workers,
             )
+            parser.add_argument(
+                "--" + prefix_str + "axon.nonce_store",
+                type=str,
+                choices=["memory", "disk"],
+                help="""Where the last processed nonce of each dendrite is stored for replay protection.
+                        Use 'disk' to keep the replay state across restarts.""",
+                default=DEFAULTS.axon.nonce_store,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.nonce_store_max_size",
+                type=int,
+                help="""The maximum number of dendrite nonces kept by the nonce store.
+                        Nonces are kept for about a minute, requests with new nonces are rejected while it is full.""",
+                default=DEFAULTS.axon.nonce_store_max_size,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.nonce_store_path",
+                type=str,
+                required=False,
+                help="""The database file of the 'disk' nonce store.
+                        Defaults to a file named after the hotkey and port in the miners directory.""",
+                default=DEFAULTS.axon.nonce_store_path,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.reject_legacy_nonces",
+                action="store_true",
+                help="""Reject the requests of the dendrites older than v7.2.0, whose nonces are not timestamps.
+                        Their nonces cannot be checked for freshness, so a request can be replayed once its nonce
+                        has expired from the nonce store.""",
+                default=DEFAULTS.axon.reject_legacy_nonces,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.crypto_workers",
+                type=int,
+                help="""The number of workers verifying request signatures and signing responses off the event loop.
+                        0 runs them inline.""",
+                default=DEFAULTS.axon.crypto_workers,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.crypto_executor",
+                type=str,
+                choices=["thread", "process"],
+                help="""The kind of pool verifying request signatures when axon.crypto_workers is set.""",
+                default=DEFAULTS.axon.crypto_executor,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.priority_scheduling",
+                action="store_true",
+                help="""Run the forward functions in the order given by their priority function, at most
+                        axon.max_workers at a time. Synchronous forward functions run in a thread pool.""",
+                default=DEFAULTS.axon.priority_scheduling,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.load_shedding",
+                action="store_true",
+                help="""Reject with a 503 (or 408 once expired) the requests which are not expected to complete
+                        before their timeout, based on the recent service times of each synapse type.""",
+                default=DEFAULTS.axon.load_shedding,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.metrics",
+                action="store_true",
+                help=f"""Serve the request metrics of the axon in the Prometheus format on {METRICS_PATH}.""",
+                default=DEFAULTS.axon.metrics,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.compression",
+                action="store_true",
+                help="""Compress the responses for the dendrites accepting it, with zstd if the zstandard package
+                        is installed and gzip otherwise.""",
+                default=DEFAULTS.axon.compression,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.compression_threshold",
+                type=int,
+                help="""The size in bytes from which response bodies are compressed.""",
+                default=DEFAULTS.axon.compression_threshold,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.max_decompressed_size",
+                type=int,
+                help="""The maximum size in bytes of a compressed request body once decompressed.
+                        Larger requests are rejected before their signature is verified.""",
+                default=DEFAULTS.axon.max_decompressed_size,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.rate_limit",
+                type=float,
+                help="""The number of requests per second allowed for each dendrite hotkey. 0 disables the limit.
+                        The limit can be weighted by stake, see TokenBucketRateLimiter.set_stake_weights.""",
+                default=DEFAULTS.axon.rate_limit,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.rate_limit_burst",
+                type=float,
+                required=False,
+                help="""The number of requests a dendrite hotkey can send at once. Defaults to axon.rate_limit.""",
+                default=DEFAULTS.axon.rate_limit_burst,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.ip_rate_limit",
+                type=float,
+                help="""The number of requests per second allowed for each ip address. 0 disables the limit.""",
+                default=DEFAULTS.axon.ip_rate_limit,
+            )
+            parser.add_argument(
+                "--" + prefix_str + "axon.ip_rate_limit_burst",
+                type=float,
+                required=False,
+                help="""The number of requests an ip address can send at once. Defaults to axon.ip_rate_limit.""",
+                default=DEFAULTS.axon.ip_rate_limit_burst,
+            )
 
         except argparse.ArgumentError:
             # Exception handling for re-parsing arguments
@@ -687,6 +1019,9 @@ class Axon:
 
         Note:
             The integrity verification is an essential step in ensuring the security of the data exchange within the Bittensor network. It helps prevent tampering and manipulation of data during transit, thereby maintaining the reliability and trust in the network communication.
+
+            The request pipeline verifies the body hash of the synapse decoded by :func:`AxonMiddleware.preprocess`
+            with :func:`AxonMiddleware.verify_body_hash` instead, without decoding the body a second time.
         """
         # Await and load the request body, so we can inspect it
         body = await request.body()
@@ -775,6 +1110,8 @@ class Axon:
         Note:
             After invoking this method, the Axon is ready to handle requests as per its configured endpoints and custom logic.
         """
+        if self.crypto_executor is None:
+            self.crypto_executor, self.signing_executor = self._build_crypto_executors()
         self.fast_server.start()
         self.started = True
         return self
@@ -787,7 +1124,8 @@ class Axon:
 
         By stopping the FastAPI server, the Axon ceases to listen for incoming requests, and any existing
         connections are gracefully terminated. This function is typically used when the neuron is being
-        shut down or needs to temporarily go offline.
+        shut down or needs to temporarily go offline. The crypto worker pools are shut down as well, and rebuilt if
+        the axon is started again.
 
         Returns:
             bittensor.core.axon.Axon: The Axon instance in the 'stopped' state.
@@ -804,6 +1142,9 @@ class Axon:
             It is advisable to ensure that all ongoing processes or requests are completed or properly handled before invoking this method.
         """
         self.fast_server.stop()
+        for executor in {self.crypto_executor, self.signing_executor} - {None}:
+            executor.shutdown(wait=False, cancel_futures=True)  # type: ignore
+        self.crypto_executor = self.signing_executor = None
         self.started = False
         return self
 
@@ -884,7 +1225,10 @@ class Axon:
 
         Raises:
             Exception: If the ``receiver_hotkey`` doesn't match with ``self.receiver_hotkey``.
+            Exception: If the dendrite is older than v7.2.0, whose nonces are not timestamps, and
+                ``axon.reject_legacy_nonces`` is set.
             Exception: If the nonce is not larger than the previous nonce for the same endpoint key.
+            bittensor.core.errors.NonceStoreFullError: If the nonce store is full of nonces which have not expired.
             Exception: If the signature verification fails.
 
         After successful verification, the nonce for the given endpoint key is updated.
@@ -894,9 +1238,10 @@ class Axon:
             where the sender signs the message with their private key and the receiver verifies the
             signature using the sender's public key.
         """
-        # Build the keypair from the dendrite_hotkey
         if synapse.dendrite is not None:
-            keypair = Keypair(ss58_address=synapse.dendrite.hotkey)
+            # The hotkey is decoded when the signature is verified, fail early without one.
+            if synapse.dendrite.hotkey is None:
+                raise Exception("No SS58 formatted address or public key provided.")
 
             # Build the signature messages.
             message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{self.wallet.hotkey.ss58_address}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
@@ -908,6 +1253,9 @@ class Axon:
             if synapse.dendrite.nonce is None:
                 raise Exception("Missing Nonce")
 
+            # Last nonce processed for this endpoint, None if unknown or expired.
+            last_nonce = self.nonces.get(endpoint_key)
+
             # Newer nonce structure post v7.2
             if (
                 synapse.dendrite.version is not None
@@ -920,43 +1268,85 @@ class Axon:
                     current_time_ns, synapse.timeout
                 )
 
-                if (
-                    self.nonces.get(endpoint_key) is None
-                    and synapse.dendrite.nonce <= allowed_window_ns
-                ):
+                if last_nonce is None and synapse.dendrite.nonce <= allowed_window_ns:
                     diff_seconds, allowed_delta_seconds = calculate_diff_seconds(
                         current_time_ns, synapse.timeout, synapse.dendrite.nonce
                     )
                     raise Exception(
                         f"Nonce is too old: acceptable delta is {allowed_delta_seconds:.2f} seconds but request was {diff_seconds:.2f} seconds old"
                     )
+            # Older nonce structure pre v7.2. Stored nonces expire and the version header is not signed, so these
+            # requests can be replayed once their nonce expired, unless they are rejected.
+            elif self.reject_legacy_nonces:
+                raise Exception(
+                    "Dendrite version is too old, nonces must be timestamps (v7.2.0 or newer)"
+                )
 
-                # If a nonce is stored, ensure the new nonce
-                # is greater than the previous nonce
-                if (
-                    self.nonces.get(endpoint_key) is not None
-                    and synapse.dendrite.nonce <= self.nonces[endpoint_key]
-                ):
-                    raise Exception("Nonce is too old, a newer one was last processed")
-            # Older nonce structure pre v7.2
-            else:
-                if (
-                    self.nonces.get(endpoint_key) is not None
-                    and synapse.dendrite.nonce <= self.nonces[endpoint_key]
-                ):
-                    raise Exception("Nonce is too old, a newer one was last processed")
-
-            if not keypair.verify(message, synapse.dendrite.signature):
+            # If a nonce is stored, ensure the new nonce
+            # is greater than the previous nonce
+            if last_nonce is not None and synapse.dendrite.nonce <= last_nonce:
+                raise Exception("Nonce is too old, a newer one was last processed")
+
+            if not await run_in_executor(
+                self.crypto_executor,
+                verify_signature,
+                synapse.dendrite.hotkey,
+                message,
+                synapse.dendrite.signature,
+            ):
                 raise Exception(
                     f"Signature mismatch with {message} and {synapse.dendrite.signature}"
                 )
 
-            # Success
-            self.nonces[endpoint_key] = synapse.dendrite.nonce  # type: ignore
+            # Success, remember the nonce for as long as it could still pass the freshness check. Concurrent copies
+            # of the request all passed the check above while the signature was verified, only one may get through.
+            if not self.nonces.advance(endpoint_key, synapse.dendrite.nonce):  # type: ignore
+                raise Exception("Nonce is too old, a newer one was last processed")
         else:
             raise SynapseDendriteNoneException(synapse=synapse)
 
 
+def merge_request_inputs(header_inputs: dict, body: dict) -> dict:
+    """
+    Merges the synapse inputs parsed from the headers of a request with its JSON body.
+
+    The body provides the synapse fields, covered by the body hash. The headers provide the name, timeout and body
+    hash, and their terminal information takes precedence over the one of the body, since it is what the dendrite
+    signature is verified against.
+
+    Args:
+        header_inputs (dict): The inputs returned by :func:`Synapse.parse_headers_to_inputs`.
+        body (dict): The decoded JSON body of the request.
+
+    Returns:
+        dict: The inputs of the synapse.
+    """
+    inputs = {**header_inputs, **body}
+    for key in ("axon", "dendrite"):
+        inputs[key] = {**(body.get(key) or {}), **header_inputs.get(key, {})}
+    for key in ("timeout", "name", "header_size", "total_size", "computed_body_hash"):
+        if header_inputs.get(key) is not None:
+            inputs[key] = header_inputs[key]
+    return inputs
+
+
+async def run_in_executor(executor: Optional["Executor"], fn: Callable, *args) -> Any:
+    """
+    Runs ``fn(*args)`` in the given executor without blocking the event loop, or inline if no executor is given.
+
+    Args:
+        executor (Optional[concurrent.futures.Executor]): The executor to run the function in.
+        fn (Callable): The function to run.
+        *args: The arguments passed to the function.
+
+    Returns:
+        Any: The result of the function.
+    """
+    if executor is None:
+        return fn(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
 def create_error_response(synapse: "Synapse") -> "JSONResponse":
     """Creates an error response based on the provided synapse object.
 
@@ -1026,6 +1416,12 @@ def log_and_handle_error(
                 status_code = 404
             elif isinstance(exception, BlacklistedException):
                 status_code = 403
+            elif isinstance(exception, RateLimitedException):
+                status_code = 429
+            elif isinstance(exception, UnsupportedMediaTypeException):
+                status_code = 415
+            elif isinstance(exception, PayloadTooLargeException):
+                status_code = 413
             elif isinstance(exception, NotVerifiedException):
                 status_code = 401
             elif isinstance(exception, (InvalidRequestNameError, SynapseParsingError)):
@@ -1048,7 +1444,10 @@ def log_and_handle_error(
     return synapse
 
 
-class AxonMiddleware(BaseHTTPMiddleware):
+CallNext = Callable[["Request"], Awaitable["Headers"]]
+
+
+class AxonMiddleware:
     """
     The `AxonMiddleware` class is a key component in the Axon server, responsible for processing all incoming requests.
 
@@ -1067,22 +1466,55 @@ class AxonMiddleware(BaseHTTPMiddleware):
     The middleware operates by intercepting incoming requests, performing necessary preprocessing
     (like verification and priority assessment), executing the request through the Axon's endpoints, and
     then handling any postprocessing steps such as response header updating and logging.
+
+    It is a plain ASGI middleware: the endpoint response is sent to the client as the endpoint produces it,
+    without the extra task and body stream wrapping of Starlette's ``BaseHTTPMiddleware``, which matters for
+    streaming synapses.
     """
 
-    def __init__(self, app: "AxonMiddleware", axon: "Axon"):
+    def __init__(self, app: "ASGIApp", axon: "Axon"):
         """
         Initialize the AxonMiddleware class.
 
         Args:
-            app (bittensor.core.axon.AxonMiddleware): An instance of the application where the middleware processor is used.
+            app (ASGIApp): The ASGI application wrapped by the middleware.
             axon (bittensor.core.axon.Axon): The axon instance used to process the requests.
         """
-        super().__init__(app)
+        self.app = app
         self.axon = axon
 
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send"):
+        """
+        ASGI entry point. HTTP requests go through :func:`dispatch`, any other scope (such as lifespan) is handed
+        to the wrapped application as is.
+        """
+        if scope["type"] != "http" or (
+            self.axon.metrics is not None and scope["path"] == METRICS_PATH
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        response_start: dict = {}
+
+        async def send_wrapper(message: "Message"):
+            if message["type"] == "http.response.start":
+                response_start.update(message)
+            await send(message)
+
+        async def call_next(request: "Request") -> "Headers":
+            await self.app(scope, request.receive, send_wrapper)
+            return Headers(raw=response_start.get("headers", []))
+
+        response = await self.dispatch(Request(scope, receive), call_next)
+        if response is not None:
+            if response_start:
+                # The endpoint failed after starting its response, it cannot be replaced anymore.
+                return
+            await response(scope, receive, send)
+
     async def dispatch(
-        self, request: "Request", call_next: "RequestResponseEndpoint"
-    ) -> Response:
+        self, request: "Request", call_next: "CallNext"
+    ) -> Optional["Response"]:
         """
         Asynchronously processes incoming HTTP requests and returns the corresponding responses. This
         method acts as the central processing unit of the AxonMiddleware, handling each step in the
@@ -1090,10 +1522,12 @@ class AxonMiddleware(BaseHTTPMiddleware):
 
         Args:
             request (Request): The incoming HTTP request to be processed.
-            call_next (RequestResponseEndpoint): A callable that processes the request and returns a response.
+            call_next (CallNext): A callable that runs the endpoint, which sends its response directly to the
+                client, and returns the headers of that response.
 
         Returns:
-            Response: The HTTP response generated after processing the request.
+            Optional[Response]: The error response to send if the request failed, ``None`` if the endpoint already
+            responded.
 
         This method performs several key functions:
 
@@ -1110,11 +1544,28 @@ class AxonMiddleware(BaseHTTPMiddleware):
         """
         # Records the start time of the request processing.
         start_time = time.time()
+        admitted = False
+        response: Optional["Response"] = None
+        response_headers = Headers()
+        metrics = self.axon.metrics
+        request_name = request.url.path.split("/")[1]
+        if metrics is not None:
+            metrics.in_flight += 1
 
         try:
             # Set up the synapse from its headers.
             try:
+                # Reject the excess traffic before any parsing or verification work.
+                self.rate_limit(request)
+
+                # Shed the request early if it cannot complete before its deadline.
+                admitted = self.admit(request, start_time)
+
+                stage_start = time.perf_counter()
                 synapse: "Synapse" = await self.preprocess(request)
+                stage_start = self._observe_stage(
+                    request_name, "preprocess", stage_start
+                )
             except Exception as exc:
                 if isinstance(exc, SynapseException) and exc.synapse is not None:
                     synapse = exc.synapse
@@ -1133,16 +1584,31 @@ class AxonMiddleware(BaseHTTPMiddleware):
                 )
 
             # Call the blacklist function
+            stage_start = time.perf_counter()
             await self.blacklist(synapse)
+            stage_start = self._observe_stage(request_name, "blacklist", stage_start)
 
             # Call verify and return the verified request
             await self.verify(synapse)
+            stage_start = self._observe_stage(request_name, "verify", stage_start)
 
             # Call the priority function
-            await self.priority(synapse)
+            priority = await self.priority(synapse)
+            self._observe_stage(request_name, "priority", stage_start)
+
+            # Check the integrity of the body before running the forward function
+            self.verify_body_hash(synapse)
 
             # Call the run function
-            response = await self.run(synapse, call_next, request)
+            response_headers = await self.run(
+                synapse,
+                call_next,
+                request,
+                priority=priority,
+                deadline=start_time + synapse.timeout
+                if synapse.timeout is not None
+                else None,
+            )
 
         # Handle errors related to preprocess.
         except InvalidRequestNameError as e:
@@ -1152,32 +1618,47 @@ class AxonMiddleware(BaseHTTPMiddleware):
             synapse.axon.status_message = str(e)
             synapse = log_and_handle_error(synapse, e, start_time=start_time)
             response = create_error_response(synapse)
+            response_headers = response.headers
 
         except SynapseException as e:
             synapse = e.synapse or synapse
             synapse = log_and_handle_error(synapse, e, start_time=start_time)
             response = create_error_response(synapse)
+            response_headers = response.headers
 
         # Handle all other errors.
         except Exception as e:
             synapse = log_and_handle_error(synapse, e, start_time=start_time)
             response = create_error_response(synapse)
+            response_headers = response.headers
 
         # Logs the end of request processing and returns the response
         finally:
+            if admitted:
+                self.axon.admission.release()  # type: ignore
+
+            if metrics is not None:
+                metrics.in_flight -= 1
+                metrics.observe_request(
+                    request_name,
+                    response.status_code
+                    if response is not None
+                    else int(response_headers.get("bt_header_axon_status_code", 200)),
+                )
+
             # Log the details of the processed synapse, including total size, name, hotkey, IP, port,
             # status code, and status message, using the debug level of the logger.
             if synapse.dendrite is not None and synapse.axon is not None:
                 logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port}  | {synapse.axon.status_code} | {synapse.axon.status_message}"
+                    f"axon     | --> | {response_headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port}  | {synapse.axon.status_code} | {synapse.axon.status_message}"
                 )
             elif synapse.axon is not None:
                 logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | {synapse.axon.status_code} | {synapse.axon.status_message}"
+                    f"axon     | --> | {response_headers.get('content-length', -1)} B | {synapse.name} | None | None | {synapse.axon.status_code} | {synapse.axon.status_message}"
                 )
             else:
                 logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
+                    f"axon     | --> | {response_headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
                 )
 
             # Return the response to the requester.
@@ -1222,35 +1703,93 @@ class AxonMiddleware(BaseHTTPMiddleware):
             )
 
         try:
-            synapse = request_synapse.from_headers(request.headers)  # type: ignore
+            inputs = request_synapse.parse_headers_to_inputs(request.headers)  # type: ignore
         except Exception:
             raise SynapseParsingError(
                 f"Improperly formatted request. Could not parse headers {request.headers} into synapse of type {request_name}."
             )
+
+        body = await request.body()
+        encoding = request.headers.get(CONTENT_ENCODING_HEADER)
+        if encoding:
+            # The request is not authenticated yet, only decompress it when compression is enabled, to a bounded size.
+            if not self.axon.compression:
+                raise UnsupportedMediaTypeException(
+                    f"Compressed requests are not accepted, got {CONTENT_ENCODING_HEADER} {encoding}."
+                )
+            if encoding not in available_encodings():
+                raise UnsupportedMediaTypeException(
+                    f"Unsupported {CONTENT_ENCODING_HEADER} {encoding}, available encodings {available_encodings()}."
+                )
+            try:
+                body = decompress(body, encoding, self.axon.max_decompressed_size)
+            except DecompressedSizeError as e:
+                raise PayloadTooLargeException(str(e))
+            except ValueError:
+                raise SynapseParsingError(
+                    f"Improperly formatted request. Could not decompress body of type {request_name}."
+                )
+
+        # Decodes and validates the body once, this synapse instance is used by every following step.
+        try:
+            if not body:
+                body_dict = {}
+            elif request.headers.get("content-type", "").startswith(
+                wire_format.MSGPACK_MEDIA_TYPE
+            ):
+                body_dict = wire_format.unpackb(body)
+            else:
+                body_dict = json.loads(body)
+            synapse = request_synapse.model_validate(  # type: ignore
+                merge_request_inputs(inputs, body_dict)
+            )
+        except Exception:
+            raise SynapseParsingError(
+                f"Improperly formatted request. Could not parse body into synapse of type {request_name}."
+            )
         synapse.name = request_name
 
         # Fills the local axon information into the synapse.
-        synapse.axon.__dict__.update(
-            {
-                "version": str(version_as_int),
-                "uuid": str(self.axon.uuid),
-                "nonce": time.time_ns(),
-                "status_code": 100,
-            }
-        )
+        synapse.axon.version = version_as_int
+        synapse.axon.uuid = str(self.axon.uuid)
+        synapse.axon.nonce = time.time_ns()
+        synapse.axon.status_code = 100
 
         # Fills the dendrite information into the synapse.
-        synapse.dendrite.__dict__.update(
-            {"port": str(request.client.port), "ip": str(request.client.host)}  # type: ignore
-        )
+        synapse.dendrite.port = request.client.port  # type: ignore
+        synapse.dendrite.ip = str(request.client.host)  # type: ignore
 
         # Signs the synapse from the axon side using the wallet hotkey.
         message = f"{synapse.axon.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.axon.uuid}"
-        synapse.axon.signature = f"0x{self.axon.wallet.hotkey.sign(message).hex()}"
+        signature = await run_in_executor(
+            self.axon.signing_executor, self.axon.wallet.hotkey.sign, message
+        )
+        synapse.axon.signature = f"0x{signature.hex()}"
+
+        # Hands the synapse over to the forward endpoint.
+        request.state.synapse = synapse
 
         # Return the setup synapse.
         return synapse
 
+    @staticmethod
+    def verify_body_hash(synapse: "Synapse"):
+        """
+        Verifies that the body of the request matches the ``computed_body_hash`` header signed by the dendrite.
+
+        Args:
+            synapse (bittensor.core.synapse.Synapse): The Synapse object decoded from the request.
+
+        Raises:
+            ValueError: If the hash of the body does not match the header.
+        """
+        body_hash = synapse.computed_body_hash or ""
+        parsed_body_hash = synapse.body_hash
+        if parsed_body_hash != body_hash:
+            raise ValueError(
+                f"Hash mismatch between header body hash {body_hash} and parsed body hash {parsed_body_hash}"
+            )
+
     async def verify(self, synapse: "Synapse"):
         """
         Verifies the authenticity and integrity of the request. This method ensures that the incoming
@@ -1308,6 +1847,104 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Not Verified with error: {str(e)}", synapse=synapse
                 )
 
+    def _observe_stage(self, name: str, stage: str, start: float) -> float:
+        """Records the duration of a pipeline stage started at ``start``, and returns the current time."""
+        now = time.perf_counter()
+        if self.axon.metrics is not None:
+            self.axon.metrics.observe_stage(name, stage, now - start)
+        return now
+
+    def rate_limit(self, request: "Request"):
+        """
+        Applies the per hotkey and per ip address rate limits of the axon, using only the dendrite hotkey header
+        and the client address of the request.
+
+        Args:
+            request (Request): The incoming request.
+
+        Raises:
+            RateLimitedException: If the hotkey or the ip address exceeded its rate limit.
+        """
+        hotkey_rate_limiter = self.axon.hotkey_rate_limiter
+        ip_rate_limiter = self.axon.ip_rate_limiter
+        if hotkey_rate_limiter is None and ip_rate_limiter is None:
+            return
+
+        ip = request.client.host if request.client is not None else None
+        if ip_rate_limiter is not None and ip is not None:
+            if not ip_rate_limiter.allow(ip):
+                raise RateLimitedException(
+                    f"Too many requests. Rate limit exceeded for ip {ip}.",
+                    synapse=Synapse(),
+                )
+
+        hotkey = request.headers.get("bt_header_dendrite_hotkey")
+        if hotkey_rate_limiter is not None and hotkey is not None:
+            if not hotkey_rate_limiter.allow(hotkey):
+                raise RateLimitedException(
+                    f"Too many requests. Rate limit exceeded for hotkey {hotkey}.",
+                    synapse=Synapse(),
+                )
+
+    def admit(self, request: "Request", start_time: float) -> bool:
+        """
+        Checks with the axon admission controller whether the request can complete before its deadline, which is
+        ``timeout`` seconds after the dendrite sent it. Only the route and the timeout and dendrite headers are read,
+        so that requests which cannot complete are rejected before their body is decoded, and before any blacklist,
+        verification or forward work is spent on them.
+
+        Args:
+            request (Request): The incoming request.
+            start_time (float): The timestamp at which the axon received the request.
+
+        Returns:
+            bool: ``True`` if the request was admitted and must be released once processed, ``False`` if load
+            shedding is disabled or the request is left to :func:`preprocess` to reject.
+
+        Raises:
+            PriorityException: If the request is shed, with status code 408 when its deadline has already passed
+                and 503 otherwise.
+        """
+        admission = self.axon.admission
+        request_name = request.url.path.split("/")[1]
+        request_synapse = self.axon.forward_class_types.get(request_name)
+        if admission is None or request_synapse is None:
+            return False
+
+        try:
+            timeout_header = request.headers.get("timeout")
+            timeout = float(timeout_header) if timeout_header is not None else None
+            dendrite = TerminalInfo.parse_headers(request.headers, "dendrite")
+        except ValueError:
+            return False
+        if timeout is None:
+            timeout = request_synapse.model_fields["timeout"].default  # type: ignore
+            if timeout is None:
+                return False
+
+        # Newer dendrites send the time of the request as nonce.
+        sent_time = start_time
+        version, nonce = dendrite.get("version"), dendrite.get("nonce")
+        if version is not None and version >= V_7_2_0 and nonce is not None:
+            sent_time = min(nonce / NANOSECONDS_IN_SECOND, start_time)
+        remaining = sent_time + timeout - time.time()
+
+        if admission.admit(request_name, remaining):
+            return True
+
+        synapse = Synapse(timeout=timeout)
+        if remaining <= 0:
+            synapse.axon.status_code = 408  # type: ignore
+            raise PriorityException(
+                f"Request expired before being processed, timeout: {timeout}s",
+                synapse=synapse,
+            )
+        synapse.axon.status_code = 503  # type: ignore
+        raise PriorityException(
+            f"Service unavailable. Request is not expected to complete within its remaining {remaining:.3f}s",
+            synapse=synapse,
+        )
+
     async def blacklist(self, synapse: "Synapse"):
         """
         Checks if the request should be blacklisted. This method ensures that requests from disallowed
@@ -1364,7 +2001,7 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Forbidden. Key is blacklisted: {reason}.", synapse=synapse
                 )
 
-    async def priority(self, synapse: "Synapse"):
+    async def priority(self, synapse: "Synapse") -> Optional[float]:
         """
         Executes the priority function for the request. This method assesses and assigns a priority
         level to the request, determining its urgency and importance in the processing queue.
@@ -1372,6 +2009,9 @@ class AxonMiddleware(BaseHTTPMiddleware):
         Args:
             synapse (bittensor.core.synapse.Synapse): The Synapse object representing the request.
 
+        Returns:
+            Optional[float]: The priority of the request, or ``None`` if no priority function is attached.
+
         Raises:
             Exception: If the priority assessment process encounters issues, such as timeouts.
 
@@ -1411,9 +2051,13 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     else priority_fn(synapse)
                 )
 
-                # Submit the task to the thread pool for execution with the given priority.
-                # The submit_task function will handle the execution and return the result.
-                _, result = await submit_task(self.axon.thread_pool, priority)
+                # With priority scheduling the request is queued by priority in `run` instead.
+                if self.axon.scheduler is None:
+                    # Submit the task to the thread pool for execution with the given priority.
+                    # The submit_task function will handle the execution and return the result.
+                    _, result = await submit_task(self.axon.thread_pool, priority)
+
+                return priority
 
             except TimeoutError as e:
                 # If the execution of the priority function exceeds the timeout,
@@ -1429,42 +2073,75 @@ class AxonMiddleware(BaseHTTPMiddleware):
                     f"Response timeout after: {synapse.timeout}s", synapse=synapse
                 )
 
+        return None
+
     async def run(
         self,
         synapse: "Synapse",
-        call_next: "RequestResponseEndpoint",
+        call_next: "CallNext",
         request: "Request",
-    ) -> "Response":
+        priority: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> "Headers":
         """
         Executes the requested function as part of the request processing pipeline. This method calls
         the next function in the middleware chain to process the request and generate a response.
 
+        When priority scheduling is enabled, the request first waits for a slot of the axon scheduler,
+        which admits the waiting requests in order of priority and drops the ones whose deadline passes.
+
         Args:
             synapse (bittensor.core.synapse.Synapse): The Synapse object representing the request.
-            call_next (RequestResponseEndpoint): The next function in the middleware chain to process requests.
+            call_next (CallNext): The next function in the middleware chain to process requests.
             request (Request): The original HTTP request.
+            priority (Optional[float]): The priority of the request. Defaults to the lowest priority.
+            deadline (Optional[float]): Unix timestamp after which the request is not worth running anymore.
 
         Returns:
-            Response: The HTTP response generated by processing the request.
+            Headers: The headers of the HTTP response sent by the endpoint.
 
         This method is a critical part of the request lifecycle, where the actual processing of the
         request takes place, leading to the generation of a response.
         """
         assert isinstance(synapse, Synapse)
 
+        scheduler = self.axon.scheduler
+        if scheduler is not None:
+            try:
+                await scheduler.acquire(
+                    priority=priority if priority is not None else float("-inf"),
+                    deadline=deadline,
+                )
+            except asyncio.TimeoutError as e:
+                logging.trace(f"TimeoutError: {str(e)}")
+                if synapse.axon is not None:
+                    synapse.axon.status_code = 408
+                raise PriorityException(
+                    f"Response timeout after: {synapse.timeout}s", synapse=synapse
+                )
+
         try:
             # The requested function is executed by calling the 'call_next' function,
             # passing the original request as an argument. This function processes the request
-            # and returns the response.
-            response = await call_next(request)
+            # and sends the response.
+            forward_start = time.time()
+            response_headers = await call_next(request)
+            if self.axon.admission is not None:
+                self.axon.admission.record(
+                    str(synapse.name), time.time() - forward_start
+                )
 
         except Exception as e:
             # Log the exception for debugging purposes.
             logging.trace(f"Run exception: {str(e)}")
             raise
 
-        # Return the starlet response
-        return response
+        finally:
+            if scheduler is not None:
+                scheduler.release()
+
+        # Return the headers of the starlet response
+        return response_headers
 
     @classmethod
     async def synapse_to_response(
@@ -1473,14 +2150,16 @@ class AxonMiddleware(BaseHTTPMiddleware):
         start_time: float,
         *,
         response_override: Optional["Response"] = None,
+        msgpack: bool = False,
     ) -> "Response":
         """
-        Converts the Synapse object into a JSON response with HTTP headers.
+        Converts the Synapse object into a JSON, or msgpack, response with HTTP headers.
 
         Args:
             synapse (bittensor.core.synapse.Synapse): The Synapse object representing the request.
             start_time (float): The timestamp when the request processing started.
             response_override: Instead of serializing the synapse, mutate the provided response object. This is only really useful for StreamingSynapse responses.
+            msgpack (bool): Encode the synapse with msgpack instead of JSON, see :mod:`bittensor.core.wire_format`.
 
         Returns:
             Response: The final HTTP response, with updated headers, ready to be sent back to the client.
@@ -1491,7 +2170,8 @@ class AxonMiddleware(BaseHTTPMiddleware):
         if synapse.axon is None:
             synapse.axon = TerminalInfo()
 
-        if synapse.axon.status_code is None:
+        # 100 is the in progress status set by the middleware.
+        if synapse.axon.status_code is None or synapse.axon.status_code == 100:
             synapse.axon.status_code = 200
 
         if synapse.axon.status_code == 200 and not synapse.axon.status_message:
@@ -1501,6 +2181,12 @@ class AxonMiddleware(BaseHTTPMiddleware):
 
         if response_override:
             response = response_override
+        elif msgpack:
+            response = Response(
+                content=wire_format.packb(synapse),
+                status_code=synapse.axon.status_code,
+                media_type=wire_format.MSGPACK_MEDIA_TYPE,
+            )
         else:
             serialized_synapse = await serialize_response(response_content=synapse)
             response = JSONResponse(
@@ -1509,7 +2195,10 @@ class AxonMiddleware(BaseHTTPMiddleware):
             )
 
         try:
-            updated_headers = synapse.to_headers()
+            # The serialized body length is the total size, streaming bodies are not known in advance.
+            updated_headers = synapse.to_headers(
+                body_size=None if response_override else len(response.body)
+            )
         except Exception as e:
             raise PostProcessException(
                 f"Error while parsing response headers. Postprocess exception: {str(e)}.",
@@ -0,0 +1,283 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""Latency and success rate statistics of the axons queried by the Dendrite, adaptive timeouts and circuit breaking."""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# One-sided z-score of the 95th percentile of a normal distribution.
+_P95_Z_SCORE = 1.645
+
+
+class AxonStats:
+    """
+    Statistics of the requests sent to one axon.
+
+    Attributes:
+        hotkey (Optional[str]): The hotkey of the axon.
+        requests (int): Number of requests sent.
+        successes (int): Number of successful requests.
+        latency (Optional[float]): Moving average latency of the successful and timed out requests, in seconds.
+        latency_variance (float): Moving variance of the latency.
+        success_rate (Optional[float]): Moving average of the success of the requests, between 0 and 1.
+        consecutive_failures (int): Number of connection failures since the last request which went through.
+        trips (int): Number of times the circuit was opened since the last request which went through.
+        open_until (float): Monotonic time until which the circuit is open, the axon is skipped until then.
+        probing (bool): Whether a probe request is in flight while the circuit is half open.
+    """
+
+    __slots__ = (
+        "hotkey",
+        "requests",
+        "successes",
+        "latency",
+        "latency_variance",
+        "success_rate",
+        "consecutive_failures",
+        "trips",
+        "open_until",
+        "probing",
+    )
+
+    def __init__(self, hotkey: Optional[str] = None):
+        self.hotkey = hotkey
+        self.requests = 0
+        self.successes = 0
+        self.latency: Optional[float] = None
+        self.latency_variance = 0.0
+        self.success_rate: Optional[float] = None
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.probing = False
+
+    @property
+    def latency_p95(self) -> Optional[float]:
+        """Estimated 95th percentile of the latency, assuming it is normally distributed."""
+        if self.latency is None:
+            return None
+        return self.latency + _P95_Z_SCORE * math.sqrt(self.latency_variance)
+
+    def to_dict(self) -> dict:
+        """Returns the statistics as a dictionary."""
+        return {
+            "hotkey": self.hotkey,
+            "requests": self.requests,
+            "successes": self.successes,
+            "latency": self.latency,
+            "latency_p95": self.latency_p95,
+            "success_rate": self.success_rate,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_open": self.open_until > time.monotonic(),
+        }
+
+
+class AxonStatsTracker:
+    """
+    Tracks the latency and success rate of the requests sent to each axon, keyed by ``ip:port``, as exponentially
+    weighted moving averages.
+
+    The statistics drive two optional behaviours of the Dendrite:
+
+    - Adaptive timeouts: once an axon answered ``min_samples`` requests, it is given ``timeout_multiplier`` times its
+      estimated 95th percentile latency instead of the requested timeout, clamped between ``min_timeout`` and the
+      requested timeout. Timed out requests count as lasting at least their timeout, so an axon slowing down past its
+      adaptive timeout widens it back up to the requested timeout.
+    - Circuit breaking: after ``failure_threshold`` consecutive connection failures, the axon is skipped for
+      ``backoff`` seconds. A single probe request is then let through; if it fails too, the axon is skipped again for
+      twice as long, up to ``max_backoff`` seconds.
+
+    At most ``max_keys`` axons are tracked, the least recently used ones are dropped first.
+
+    The tracker must be used from a single event loop and is not thread safe.
+
+    Args:
+        alpha (float): Weight of the latest observation in the moving averages.
+        timeout_multiplier (float): Multiple of the 95th percentile latency given as adaptive timeout.
+        min_timeout (float): Minimum adaptive timeout in seconds.
+        min_samples (int): Number of successful requests needed before adapting the timeout of an axon.
+        failure_threshold (int): Number of consecutive connection failures opening the circuit.
+        backoff (float): Seconds the circuit stays open the first time.
+        max_backoff (float): Maximum seconds the circuit stays open.
+        max_keys (int): Maximum number of axons tracked.
+
+    Example::
+
+        stats = dendrite.axon_stats.stats(axon)
+        if stats is not None and stats["success_rate"] is not None:
+            scores[uid] *= stats["success_rate"]
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        timeout_multiplier: float = 2.0,
+        min_timeout: float = 1.0,
+        min_samples: int = 5,
+        failure_threshold: int = 3,
+        backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        max_keys: int = 100_000,
+    ):
+        self.alpha = alpha
+        self.timeout_multiplier = timeout_multiplier
+        self.min_timeout = min_timeout
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_keys = max_keys
+        self._stats: "OrderedDict[str, AxonStats]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    @staticmethod
+    def key(axon) -> str:
+        """Returns the ``ip:port`` key of an axon info."""
+        return f"{axon.ip}:{axon.port}"
+
+    def _get_or_create(self, axon) -> AxonStats:
+        key = self.key(axon)
+        stats = self._stats.get(key)
+        if stats is None:
+            if len(self._stats) >= self.max_keys:
+                self._stats.popitem(last=False)
+            stats = self._stats[key] = AxonStats(getattr(axon, "hotkey", None))
+        else:
+            self._stats.move_to_end(key)
+        return stats
+
+    def timeout(self, axon, timeout: float) -> float:
+        """
+        Returns the adaptive timeout of an axon.
+
+        Args:
+            axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon queried.
+            timeout (float): The requested timeout, which the adaptive timeout never exceeds.
+
+        Returns:
+            float: The requested timeout until enough requests were answered by the axon, the adaptive timeout after.
+        """
+        stats = self._stats.get(self.key(axon))
+        if stats is None or stats.successes < self.min_samples:
+            return timeout
+        adaptive = self.timeout_multiplier * stats.latency_p95  # type: ignore
+        return min(timeout, max(self.min_timeout, adaptive))
+
+    def allow(self, axon) -> bool:
+        """
+        Decides whether a request can be sent to an axon given the state of its circuit. Once the circuit of an axon
+        is open, only one probe request is let through after the backoff, until :func:`record` is called for it.
+
+        Args:
+            axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon queried.
+
+        Returns:
+            bool: ``False`` if the axon must be skipped.
+        """
+        stats = self._stats.get(self.key(axon))
+        if stats is None or stats.consecutive_failures < self.failure_threshold:
+            return True
+        if stats.probing or time.monotonic() < stats.open_until:
+            return False
+        stats.probing = True
+        return True
+
+    def cancel(self, axon):
+        """
+        Releases the probe slot taken by :func:`allow` for a request which was cancelled before completing.
+
+        Args:
+            axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon queried.
+        """
+        stats = self._stats.get(self.key(axon))
+        if stats is not None:
+            stats.probing = False
+
+    def record(
+        self,
+        axon,
+        latency: float,
+        success: bool,
+        connection_failed: bool = False,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Accounts a completed request.
+
+        Args:
+            axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon queried.
+            latency (float): Seconds the request took, only accounted for successful and timed out requests.
+            success (bool): Whether the axon answered successfully.
+            connection_failed (bool): Whether the request failed to reach the axon, counted by the circuit breaker.
+            timeout (Optional[float]): The timeout of the request if it timed out, accounted as its minimum latency.
+        """
+        stats = self._get_or_create(axon)
+        stats.requests += 1
+        stats.probing = False
+        stats.success_rate = (
+            float(success)
+            if stats.success_rate is None
+            else self.alpha * success + (1 - self.alpha) * stats.success_rate
+        )
+
+        if success:
+            stats.successes += 1
+        elif timeout is not None:
+            latency = max(latency, timeout)
+        if success or timeout is not None:
+            if stats.latency is None:
+                stats.latency = latency
+            else:
+                delta = latency - stats.latency
+                stats.latency += self.alpha * delta
+                stats.latency_variance = (1 - self.alpha) * (
+                    stats.latency_variance + self.alpha * delta * delta
+                )
+
+        if not connection_failed:
+            stats.consecutive_failures = 0
+            stats.trips = 0
+            return
+        stats.consecutive_failures += 1
+        if stats.consecutive_failures >= self.failure_threshold:
+            # Each failed probe doubles the time the axon is skipped.
+            backoff = min(self.backoff * 2**stats.trips, self.max_backoff)
+            stats.trips += 1
+            stats.open_until = time.monotonic() + backoff
+
+    def stats(self, axon) -> Optional[dict]:
+        """
+        Returns the statistics of an axon.
+
+        Args:
+            axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon.
+
+        Returns:
+            Optional[dict]: The ``hotkey``, number of ``requests`` and ``successes``, moving average ``latency``, estimated
+            ``latency_p95``, moving average ``success_rate``, number of ``consecutive_failures``, and whether the
+            circuit is open (``circuit_open``), or ``None`` if the axon was never queried.
+        """
+        stats = self._stats.get(self.key(axon))
+        return None if stats is None else stats.to_dict()
+
+    def snapshot(self) -> dict[str, dict]:
+        """Returns the statistics of every tracked axon, keyed by ``ip:port``."""
+        return {key: stats.to_dict() for key, stats in self._stats.items()}
@@ -42,6 +42,7 @@ class NeuronInfoLite:
     Methods:
         get_null_neuron: Returns a NeuronInfoLite object representing a null neuron.
         list_from_vec_u8: Decodes a bytes object into a list of NeuronInfoLite instances.
+        from_vec_u8: Decodes a bytes object into a NeuronInfoLite instance.
     """
 
     hotkey: str
@@ -107,65 +108,78 @@ class NeuronInfoLite:
             list[NeuronInfoLite]: A list of NeuronInfoLite instances decoded from the provided bytes object.
         """
         decoded = bt_decode.NeuronInfoLite.decode_vec(vec_u8)
-        results = []
-        for item in decoded:
-            active = item.active
-            axon_info = item.axon_info
-            coldkey = decode_account_id(item.coldkey)
-            consensus = item.consensus
-            dividends = item.dividends
-            emission = item.emission
-            hotkey = decode_account_id(item.hotkey)
-            incentive = item.incentive
-            last_update = item.last_update
-            netuid = item.netuid
-            prometheus_info = item.prometheus_info
-            pruning_score = item.pruning_score
-            rank = item.rank
-            stake_dict = process_stake_data(item.stake)
-            stake = sum(stake_dict.values()) if stake_dict else Balance(0)
-            trust = item.trust
-            uid = item.uid
-            validator_permit = item.validator_permit
-            validator_trust = item.validator_trust
-            results.append(
-                NeuronInfoLite(
-                    active=active,
-                    axon_info=AxonInfo(
-                        version=axon_info.version,
-                        ip=str(netaddr.IPAddress(axon_info.ip)),
-                        port=axon_info.port,
-                        ip_type=axon_info.ip_type,
-                        placeholder1=axon_info.placeholder1,
-                        placeholder2=axon_info.placeholder2,
-                        protocol=axon_info.protocol,
-                        hotkey=hotkey,
-                        coldkey=coldkey,
-                    ),
-                    coldkey=coldkey,
-                    consensus=u16_normalized_float(consensus),
-                    dividends=u16_normalized_float(dividends),
-                    emission=emission / 1e9,
-                    hotkey=hotkey,
-                    incentive=u16_normalized_float(incentive),
-                    last_update=last_update,
-                    netuid=netuid,
-                    prometheus_info=PrometheusInfo(
-                        version=prometheus_info.version,
-                        ip=str(netaddr.IPAddress(prometheus_info.ip)),
-                        port=prometheus_info.port,
-                        ip_type=prometheus_info.ip_type,
-                        block=prometheus_info.block,
-                    ),
-                    pruning_score=pruning_score,
-                    rank=u16_normalized_float(rank),
-                    stake_dict=stake_dict,
-                    stake=stake,
-                    total_stake=stake,
-                    trust=u16_normalized_float(trust),
-                    uid=uid,
-                    validator_permit=validator_permit,
-                    validator_trust=u16_normalized_float(validator_trust),
-                )
-            )
-        return results
+        return [cls._from_decoded(item) for item in decoded]
+
+    @classmethod
+    def from_vec_u8(cls, vec_u8: bytes) -> "NeuronInfoLite":
+        """
+        Decodes a bytes object into a NeuronInfoLite instance.
+
+        Args:
+            vec_u8 (bytes): The bytes object to decode into a NeuronInfoLite instance.
+
+        Returns:
+            NeuronInfoLite: The NeuronInfoLite instance decoded from the provided bytes object.
+        """
+        return cls._from_decoded(bt_decode.NeuronInfoLite.decode(bytes(vec_u8)))
+
+    @staticmethod
+    def _from_decoded(item) -> "NeuronInfoLite":
+        """Converts a neuron decoded by ``bt_decode`` into a NeuronInfoLite instance."""
+        active = item.active
+        axon_info = item.axon_info
+        coldkey = decode_account_id(item.coldkey)
+        consensus = item.consensus
+        dividends = item.dividends
+        emission = item.emission
+        hotkey = decode_account_id(item.hotkey)
+        incentive = item.incentive
+        last_update = item.last_update
+        netuid = item.netuid
+        prometheus_info = item.prometheus_info
+        pruning_score = item.pruning_score
+        rank = item.rank
+        stake_dict = process_stake_data(item.stake)
+        stake = sum(stake_dict.values()) if stake_dict else Balance(0)
+        trust = item.trust
+        uid = item.uid
+        validator_permit = item.validator_permit
+        validator_trust = item.validator_trust
+        return NeuronInfoLite(
+            active=active,
+            axon_info=AxonInfo(
+                version=axon_info.version,
+                ip=str(netaddr.IPAddress(axon_info.ip)),
+                port=axon_info.port,
+                ip_type=axon_info.ip_type,
+                placeholder1=axon_info.placeholder1,
+                placeholder2=axon_info.placeholder2,
+                protocol=axon_info.protocol,
+                hotkey=hotkey,
+                coldkey=coldkey,
+            ),
+            coldkey=coldkey,
+            consensus=u16_normalized_float(consensus),
+            dividends=u16_normalized_float(dividends),
+            emission=emission / 1e9,
+            hotkey=hotkey,
+            incentive=u16_normalized_float(incentive),
+            last_update=last_update,
+            netuid=netuid,
+            prometheus_info=PrometheusInfo(
+                version=prometheus_info.version,
+                ip=str(netaddr.IPAddress(prometheus_info.ip)),
+                port=prometheus_info.port,
+                ip_type=prometheus_info.ip_type,
+                block=prometheus_info.block,
+            ),
+            pruning_score=pruning_score,
+            rank=u16_normalized_float(rank),
+            stake_dict=stake_dict,
+            stake=stake,
+            total_stake=stake,
+            trust=u16_normalized_float(trust),
+            uid=uid,
+            validator_permit=validator_permit,
+            validator_trust=u16_normalized_float(validator_trust),
+        )
@@ -18,25 +18,52 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+import json
+import random
+import socket
+import threading
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass
 from typing import Any, AsyncGenerator, Optional, Union, Type
 
 import aiohttp
 from bittensor_wallet import Keypair, Wallet
 
 from bittensor.core.axon import Axon
+from bittensor.core.axon_stats import AxonStatsTracker
 from bittensor.core.chain_data import AxonInfo
+from bittensor.core.errors import CircuitOpenError
 from bittensor.core.settings import version_as_int
 from bittensor.core.stream import StreamingSynapse
 from bittensor.core.synapse import Synapse, TerminalInfo
+from bittensor.core.wire_format import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    packb,
+    unpackb,
+)
 from bittensor.utils import networking
 from bittensor.utils.btlogging import logging
+from bittensor.utils.compression import (
+    ACCEPT_ENCODING_HEADER,
+    CONTENT_ENCODING_HEADER,
+    DEFAULT_COMPRESSION_THRESHOLD,
+    DEFAULT_MAX_DECOMPRESSED_SIZE,
+    available_encodings,
+    compress,
+    decompress,
+    negotiate_encoding,
+    parse_encodings,
+)
 from bittensor.utils.registration import torch, use_torch
 
 DENDRITE_ERROR_MAPPING: dict[Type[Exception], tuple] = {
     aiohttp.ClientConnectorError: ("503", "Service unavailable"),
     asyncio.TimeoutError: ("408", "Request timeout"),
+    CircuitOpenError: ("503", "Circuit breaker open"),
     aiohttp.ClientResponseError: (None, "Client response error"),
     aiohttp.ClientPayloadError: ("400", "Payload error"),
     aiohttp.ClientError: ("500", "Client error"),
@@ -44,9 +71,69 @@ DENDRITE_ERROR_MAPPING: dict[Type[Exception], tuple] = {
     aiohttp.ServerDisconnectedError: ("503", "Service disconnected"),
     aiohttp.ServerConnectionError: ("503", "Service connection error"),
 }
+# Raised since aiohttp 3.10 when connecting takes longer than the ``sock_connect`` timeout.
+if hasattr(aiohttp, "ConnectionTimeoutError"):
+    DENDRITE_ERROR_MAPPING[aiohttp.ConnectionTimeoutError] = (
+        "503",
+        "Connection timeout",
+    )
 DENDRITE_DEFAULT_ERROR = ("422", "Failed to parse response")
 
 
+@dataclass(frozen=True)
+class SynapseRecord:
+    """
+    Compact record of a request kept in :attr:`Dendrite.synapse_history`.
+
+    Attributes:
+        name (Optional[str]): The synapse name.
+        axon_hotkey (Optional[str]): The hotkey of the queried axon.
+        status_code (Optional[int]): The status code of the response.
+        process_time (Optional[float]): Seconds the request took.
+        header_size (Optional[int]): Size of the headers in bytes.
+        total_size (Optional[int]): Size of the body in bytes.
+        timestamp (float): Unix timestamp at which the request completed.
+    """
+
+    name: Optional[str]
+    axon_hotkey: Optional[str]
+    status_code: Optional[int]
+    process_time: Optional[float]
+    header_size: Optional[int]
+    total_size: Optional[int]
+    timestamp: float
+
+    @classmethod
+    def from_synapse(cls, synapse: "Synapse") -> "SynapseRecord":
+        """Records a completed synapse."""
+        return cls(
+            name=synapse.name,
+            axon_hotkey=synapse.axon.hotkey,  # type: ignore
+            status_code=synapse.dendrite.status_code,  # type: ignore
+            process_time=synapse.dendrite.process_time,  # type: ignore
+            header_size=synapse.header_size,
+            total_size=synapse.total_size,
+            timestamp=time.time(),
+        )
+
+
+class _BroadcastRequest:
+    """
+    The part of a request shared by every axon of a broadcast: the synapse, whose body hash is computed once, and its
+    encoded bodies and headers, serialized once per wire format and encoding. Only the timeout header and the axon and
+    dendrite terminal headers, which carry the signature, differ between the axons.
+
+    Args:
+        synapse (bittensor.core.synapse.Synapse): The synapse sent to every axon, with its timeout and the dendrite
+            information common to all requests already set.
+    """
+
+    def __init__(self, synapse: "Synapse"):
+        self.synapse = synapse
+        self.body_hash = synapse.body_hash
+        self.encoded: dict[tuple[bool, Optional[str]], tuple[bytes, dict]] = {}
+
+
 class DendriteMixin:
     """
     The Dendrite class represents the abstracted implementation of a network client module.
@@ -62,7 +149,7 @@ class DendriteMixin:
     Args:
         keypair (Option[Union[bittensor_wallet.Wallet, substrateinterface.Keypair]]): The wallet or keypair used for signing messages.
         external_ip (str): The external IP address of the local system.
-        synapse_history (list): A list of Synapse objects representing the historical responses.
+        synapse_history (deque): Records of the latest requests, see :class:`SynapseRecord`.
 
     Methods:
         __str__(): Returns a string representation of the Dendrite object.
@@ -71,7 +158,7 @@ class DendriteMixin:
         forward(self, axons, synapse=Synapse(), timeout=12, deserialize=True, run_async=True, streaming=False) -> Synapse: Asynchronously sends requests to one or multiple Axons and collates their responses.
         call(self, target_axon, synapse=Synapse(), timeout=12.0, deserialize=True) -> Synapse: Asynchronously sends a request to a specified Axon and processes the response.
         call_stream(self, target_axon, synapse=Synapse(), timeout=12.0, deserialize=True) -> AsyncGenerator[Synapse, None]: Sends a request to a specified Axon and yields an AsyncGenerator that contains streaming response chunks before finally yielding the filled Synapse as the final element.
-        preprocess_synapse_for_request(self, target_axon_info, synapse, timeout=12.0) -> Synapse: Preprocesses the synapse for making a request, including building headers and signing.
+        preprocess_synapse_for_request(self, target_axon_info, synapse, timeout=12.0, body_hash=None) -> Synapse: Preprocesses the synapse for making a request, including building headers and signing.
         process_server_response(self, server_response, json_response, local_synapse): Processes the server response, updates the local synapse state, and merges headers.
         close_session(self): Synchronously closes the internal aiohttp client session.
         aclose_session(self): Asynchronously closes the internal aiohttp client session.
@@ -98,31 +185,112 @@ class DendriteMixin:
         d( bittensor.core.axon.Axon, bittensor.core.synapse.Synapse )
     """
 
-    def __init__(self, wallet: Optional[Union["Wallet", "Keypair"]] = None):
+    def __init__(
+        self,
+        wallet: Optional[Union["Wallet", "Keypair"]] = None,
+        compression: bool = False,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        wire_format: str = "json",
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        ipv4_only: bool = False,
+        max_concurrency: Optional[int] = None,
+        history_size: int = 1000,
+        history_sample_rate: float = 1.0,
+        adaptive_timeout: bool = False,
+        circuit_breaker: bool = False,
+        max_decompressed_size: int = DEFAULT_MAX_DECOMPRESSED_SIZE,
+    ):
         """
         Initializes the Dendrite object, setting up essential properties.
 
         Args:
             wallet (Optional[Union[bittensor_wallet.Wallet, substrateinterface.Keypair]]): The user's wallet or keypair used for signing messages. Defaults to ``None``, in which case a new :func:`bittensor_wallet.Wallet().hotkey` is generated and used.
+            compression (bool): Accept compressed responses, and compress the requests sent to the axons advertising support for it. Defaults to ``False``.
+            compression_threshold (int): The size in bytes from which request bodies are compressed. Defaults to ``1024``.
+            wire_format (str): ``"json"``, or ``"msgpack"`` to exchange binary bodies with the axons supporting it, see :mod:`bittensor.core.wire_format`. Defaults to ``"json"``.
+            connection_limit (int): Maximum number of connections open at the same time, ``0`` for no limit. Defaults to ``100``.
+            connection_limit_per_host (int): Maximum number of connections open to the same axon, ``0`` for no limit. Defaults to ``0``.
+            keepalive_timeout (float): Seconds an idle connection is kept open for reuse. Defaults to ``15.0``.
+            dns_cache_ttl (Optional[int]): Seconds resolved host names are cached, ``None`` to cache them forever. Defaults to ``10``.
+            ipv4_only (bool): Only connect over IPv4, without racing IPv6 connections (happy eyeballs). Defaults to ``False``.
+            max_concurrency (Optional[int]): Maximum number of requests :func:`forward` and :func:`forward_iter` send at the same time. The timeout of a request starts once it is sent, so with more axons than ``max_concurrency`` a call may last several timeouts, but no request times out waiting for a connection. Defaults to ``None``: every request is sent at once and waits for a free connection within its timeout, so a call lasts at most one timeout.
+            history_size (int): Number of requests kept in :attr:`synapse_history`, ``0`` to disable it. Defaults to ``1000``.
+            history_sample_rate (float): Fraction of the requests recorded in :attr:`synapse_history`. Defaults to ``1.0``.
+            adaptive_timeout (bool): Give each axon a timeout derived from its latency, see :class:`bittensor.core.axon_stats.AxonStatsTracker`. The timeout passed to :func:`forward` remains the maximum. Defaults to ``False``.
+            circuit_breaker (bool): Skip the axons failing to connect repeatedly, see :class:`bittensor.core.axon_stats.AxonStatsTracker`. Connecting to an axon may then take at most half of the timeout, so that unreachable axons count as connection failures. Defaults to ``False``.
+            max_decompressed_size (int): The maximum size in bytes of a compressed response body once decompressed, larger responses fail. Defaults to 32 MiB.
         """
+        if wire_format not in ("json", "msgpack"):
+            raise ValueError(
+                f"Invalid wire format {wire_format}, expected 'json' or 'msgpack'"
+            )
+
         # Initialize the parent class
         super(DendriteMixin, self).__init__()
 
         # Unique identifier for the instance
         self.uuid = str(uuid.uuid1())
 
-        # Get the external IP
-        self.external_ip = networking.get_external_ip()
+        # The external IP, resolved on first use.
+        self._external_ip: Optional[str] = None
 
         # If a wallet or keypair is provided, use its hotkey. If not, generate a new one.
         self.keypair = (
             wallet.hotkey if isinstance(wallet, Wallet) else wallet
         ) or Wallet().hotkey
 
-        self.synapse_history: list = []
+        # Bounded, the oldest records are dropped first.
+        self.synapse_history: deque[SynapseRecord] = deque(maxlen=history_size)
+        self.history_sample_rate = history_sample_rate
+
+        # Latency and success rate of each axon queried, also available to score them.
+        self.axon_stats = AxonStatsTracker()
+        self.adaptive_timeout = adaptive_timeout
+        self.circuit_breaker = circuit_breaker
+
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.max_decompressed_size = max_decompressed_size
+        self.wire_format = wire_format
+        # Encodings advertised by each axon, and axons which answered in msgpack, keyed by "ip:port".
+        self._axon_encodings: dict[str, list[str]] = {}
+        self._msgpack_axons: set[str] = set()
+
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.ipv4_only = ipv4_only
+        self.max_concurrency = max_concurrency
+        # Connections created and reused by the sessions of the dendrite, see `pool_stats`.
+        self._connections_created = 0
+        self._connections_reused = 0
 
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # Event loop running the synchronous queries in a background thread, with its own session, see `query`.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._loop_session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def external_ip(self) -> str:
+        """
+        The external IP address of the local system, resolved on first use with
+        :func:`bittensor.utils.networking.get_cached_external_ip`.
+        """
+        if self._external_ip is None:
+            self._external_ip = networking.get_cached_external_ip()
+        return self._external_ip
+
+    @external_ip.setter
+    def external_ip(self, external_ip: Optional[str]):
+        self._external_ip = external_ip
+
     @property
     async def session(self) -> aiohttp.ClientSession:
         """
@@ -155,10 +323,141 @@ class DendriteMixin:
                 json_response = await response.json()       # Extract the JSON response from the server
 
         """
+        if self._loop is not None and asyncio.get_running_loop() is self._loop:
+            # The synchronous queries use a session bound to the background event loop.
+            if self._loop_session is None:
+                self._loop_session = self._create_session()
+            return self._loop_session
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            self._session = self._create_session()
         return self._session
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Creates a session with the connection pool settings of the dendrite."""
+        return aiohttp.ClientSession(
+            connector=self._create_connector(),
+            trace_configs=[self._create_trace_config()],
+        )
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Returns the background event loop running the synchronous queries, starting it on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name=f"dendrite-{self.uuid}",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _stop_loop(self, wait: bool = True):
+        """
+        Closes the session of the background event loop, then stops the loop and its thread.
+
+        Args:
+            wait (bool): Wait for the session to close and the thread to stop, then close the loop. Otherwise, as
+                from the destructor, the loop is only asked to close the session and stop.
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is None:
+            return
+        session, self._loop_session = self._loop_session, None
+        if not thread.is_alive():  # type: ignore
+            # At interpreter exit the thread may be gone while the loop is still flagged as running.
+            if not loop.is_running():
+                loop.close()
+            return
+        if not wait or thread is threading.current_thread():
+            # Called from the loop itself or from the destructor, the loop is not waited for.
+            if session is None:
+                loop.call_soon_threadsafe(loop.stop)
+            else:
+                asyncio.run_coroutine_threadsafe(
+                    session.close(), loop
+                ).add_done_callback(lambda _: loop.call_soon_threadsafe(loop.stop))
+            return
+        if session is not None and loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(
+                    timeout=5
+                )
+            except Exception as e:
+                logging.debug(f"Failed to close the dendrite session: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)  # type: ignore
+        if not thread.is_alive() and not loop.is_running():  # type: ignore
+            loop.close()
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Creates the connector of the session, configured with the connection pool settings of the dendrite."""
+        kwargs: dict[str, Any] = {}
+        if self.ipv4_only:
+            kwargs["family"] = socket.AF_INET
+            # Disables happy eyeballs, on aiohttp versions supporting it.
+            if (
+                "happy_eyeballs_delay"
+                in inspect.signature(aiohttp.TCPConnector).parameters
+            ):
+                kwargs["happy_eyeballs_delay"] = None
+        return aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            **kwargs,
+        )
+
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Creates the trace config counting the connections created and reused by the session."""
+
+        async def on_connection_create_end(session, context, params):
+            self._connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self._connections_reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def pool_stats(self) -> dict:
+        """
+        Returns a snapshot of the connection pool of the session.
+
+        Returns:
+            dict: The number of ``open`` connections, of which ``idle`` are kept alive for reuse, the number of
+            requests ``waiting`` for a connection, the number of connections ``created`` and ``reused`` since the
+            dendrite was created, and the ``reuse_ratio`` of the requests sent over an existing connection.
+        """
+        open_connections = idle = waiting = 0
+        for session in (self._session, self._loop_session):
+            if session is None or session.closed:
+                continue
+            connector = session.connector
+            # The connector does not expose its pool, read it from its internal state.
+            session_idle = sum(
+                len(conns) for conns in getattr(connector, "_conns", {}).values()
+            )
+            idle += session_idle
+            open_connections += session_idle + len(getattr(connector, "_acquired", ()))
+            waiting += sum(
+                len(waiters) for waiters in getattr(connector, "_waiters", {}).values()
+            )
+        requests = self._connections_created + self._connections_reused
+        return {
+            "open": open_connections,
+            "idle": idle,
+            "waiting": waiting,
+            "created": self._connections_created,
+            "reused": self._connections_reused,
+            "reuse_ratio": self._connections_reused / requests if requests else 0.0,
+        }
+
     def close_session(self):
         """
         Closes the internal `aiohttp <https://github.com/aio-libs/aiohttp>`_ client session synchronously.
@@ -169,11 +468,13 @@ class DendriteMixin:
 
         Note:
             This method utilizes asyncio's event loop to close the session asynchronously from a synchronous context. It is advisable to use this method only when asynchronous context management is not feasible.
+            It also stops the background event loop of the synchronous queries, and closes its session.
 
         Usage:
             When finished with dendrite in a synchronous context
             :func:`dendrite_instance.close_session()`.
         """
+        self._stop_loop()
         if self._session:
             loop = asyncio.get_event_loop()
             loop.run_until_complete(self._session.close())
@@ -226,6 +527,116 @@ class DendriteMixin:
         )
         return f"http://{endpoint}/{request_name}"
 
+    def _encode_request(
+        self, synapse: "Synapse", msgpack: bool, encoding: Optional[str]
+    ) -> tuple[bytes, dict]:
+        """
+        Serializes the body of a request and builds its headers.
+
+        Args:
+            synapse (bittensor.core.synapse.Synapse): The preprocessed synapse.
+            msgpack (bool): Encode the body with msgpack instead of JSON.
+            encoding (Optional[str]): The compression accepted by the axon, if any.
+
+        Returns:
+            tuple[bytes, dict]: The body and the headers.
+        """
+        if msgpack:
+            body = packb(synapse)
+        else:
+            body = json.dumps(synapse.model_dump()).encode()
+
+        # The body is serialized first, so that its length is reported as the total size of the synapse.
+        headers = synapse.to_headers(body_size=len(body))
+        headers["Content-Type"] = MSGPACK_MEDIA_TYPE if msgpack else JSON_MEDIA_TYPE
+        if encoding is not None and len(body) >= self.compression_threshold:
+            body = compress(body, encoding)
+            headers[CONTENT_ENCODING_HEADER] = encoding
+        return body, headers
+
+    def _build_request(
+        self,
+        target_axon: "AxonInfo",
+        synapse: "Synapse",
+        broadcast: Optional["_BroadcastRequest"] = None,
+    ) -> dict[str, Any]:
+        """
+        Builds the headers and body of a request. When compression is enabled, the dendrite advertises the encodings
+        it accepts, and compresses bodies larger than ``compression_threshold`` if the target axon previously
+        advertised an encoding in common. Likewise with the msgpack wire format, the dendrite asks for msgpack
+        responses, and sends msgpack bodies to the axons which already answered in msgpack.
+
+        Args:
+            target_axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon the request is sent to.
+            synapse (bittensor.core.synapse.Synapse): The preprocessed synapse.
+            broadcast (Optional[_BroadcastRequest]): The shared part of a broadcast request, whose body is reused
+                instead of serializing the synapse again.
+
+        Returns:
+            dict[str, Any]: The ``headers`` and ``data`` keyword arguments of the request.
+        """
+        endpoint = f"{target_axon.ip}:{target_axon.port}"
+        msgpack = endpoint in self._msgpack_axons
+        encoding = (
+            negotiate_encoding(self._axon_encodings.get(endpoint, []))
+            if self.compression
+            else None
+        )
+        if broadcast is None:
+            body, headers = self._encode_request(synapse, msgpack, encoding)
+        else:
+            encoded = broadcast.encoded.get((msgpack, encoding))
+            if encoded is None:
+                encoded = broadcast.encoded[(msgpack, encoding)] = self._encode_request(
+                    broadcast.synapse, msgpack, encoding
+                )
+            body, headers = encoded
+            headers = {
+                **headers,
+                # Adaptive timeouts differ between the axons, the axon reads the timeout from the headers.
+                "timeout": str(synapse.timeout),
+                **synapse.axon.to_headers("axon"),  # type: ignore
+                **synapse.dendrite.to_headers("dendrite"),  # type: ignore
+            }
+
+        if self.wire_format == "msgpack":
+            headers["Accept"] = f"{MSGPACK_MEDIA_TYPE}, {JSON_MEDIA_TYPE}"
+        if self.compression:
+            headers[ACCEPT_ENCODING_HEADER] = ", ".join(available_encodings())
+        return {"headers": headers, "data": body}
+
+    async def _read_response_json(
+        self, target_axon: "AxonInfo", response: "aiohttp.ClientResponse"
+    ) -> dict:
+        """
+        Reads the JSON, or msgpack, body of a response, decompressing it if the axon compressed it, and records the
+        encodings and wire format supported by the axon for the next requests.
+
+        Args:
+            target_axon (bittensor.core.chain_data.axon_info.AxonInfo): The axon the response comes from.
+            response (aiohttp.ClientResponse): The response.
+
+        Returns:
+            dict: The decoded JSON body.
+        """
+        endpoint = f"{target_axon.ip}:{target_axon.port}"
+        if self.compression and ACCEPT_ENCODING_HEADER in response.headers:
+            self._axon_encodings[endpoint] = parse_encodings(
+                response.headers[ACCEPT_ENCODING_HEADER]
+            )
+        encoding = response.headers.get(CONTENT_ENCODING_HEADER)
+        is_msgpack = response.content_type == MSGPACK_MEDIA_TYPE
+        if encoding is None and not is_msgpack:
+            return await response.json()
+
+        body = await response.read()
+        if encoding is not None:
+            body = decompress(body, encoding, self.max_decompressed_size)
+        if not is_msgpack:
+            return json.loads(body)
+        self._msgpack_axons.add(endpoint)
+        return unpackb(body)
+
     def log_exception(self, exception: Exception):
         """
         Logs an exception with a unique identifier.
@@ -241,7 +652,10 @@ class DendriteMixin:
         """
         error_id = str(uuid.uuid4())
         error_type = exception.__class__.__name__
-        if isinstance(exception, (aiohttp.ClientConnectorError, asyncio.TimeoutError)):
+        if isinstance(
+            exception,
+            (aiohttp.ClientConnectorError, asyncio.TimeoutError, CircuitOpenError),
+        ):
             logging.debug(f"{error_type}#{error_id}: {exception}")
         else:
             logging.error(f"{error_type}#{error_id}: {exception}")
@@ -308,11 +722,20 @@ class DendriteMixin:
         Args:
             synapse (bittensor.core.synapse.Synapse): The synapse object representing the request being sent.
         """
-        if synapse.axon is not None:
+        if synapse.axon is not None and logging.__trace_on__:
             logging.trace(
                 f"dendrite | --> | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | 0 | Success"
             )
 
+    def _record_history(self, synapse: "Synapse"):
+        """Records a completed request in :attr:`synapse_history`, subject to the history size and sample rate."""
+        if self.synapse_history.maxlen == 0 or (
+            self.history_sample_rate < 1.0
+            and random.random() >= self.history_sample_rate
+        ):
+            return
+        self.synapse_history.append(SynapseRecord.from_synapse(synapse))
+
     def _log_incoming_response(self, synapse: "Synapse"):
         """
         Logs information about incoming responses for debugging and monitoring.
@@ -324,7 +747,11 @@ class DendriteMixin:
         Args:
             synapse (bittensor.core.synapse.Synapse): The synapse object representing the received response.
         """
-        if synapse.axon is not None and synapse.dendrite is not None:
+        if (
+            synapse.axon is not None
+            and synapse.dendrite is not None
+            and logging.__trace_on__
+        ):
             logging.trace(
                 f"dendrite | <-- | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | {synapse.dendrite.status_code} | {synapse.dendrite.status_message}"
             )
@@ -335,7 +762,9 @@ class DendriteMixin:
         """
         Makes a synchronous request to multiple target Axons and returns the server responses.
 
-        Cleanup is automatically handled and sessions are closed upon completed requests.
+        The requests run on an event loop owned by the dendrite in a background thread, so that its session and
+        pooled connections are reused across queries, and queries from several threads can run concurrently. They
+        are released by :func:`close_session`.
 
         Args:
             axons (Union[list[Union[bittensor.core.chain_data.axon_info.AxonInfo, 'bittensor.core.axon.Axon']], Union['bittensor.core.chain_data.axon_info.AxonInfo', 'bittensor.core.axon.Axon']]): The list of target Axon information.
@@ -345,18 +774,9 @@ class DendriteMixin:
         Returns:
             Union[bittensor.core.synapse.Synapse, list[bittensor.core.synapse.Synapse]]: If a single target axon is provided, returns the response from that axon. If multiple target axons are provided, returns a list of responses from all target axons.
         """
-        result = None
-        try:
-            loop = asyncio.get_event_loop()
-            result = loop.run_until_complete(self.forward(*args, **kwargs))
-        except Exception:
-            new_loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(new_loop)
-            result = new_loop.run_until_complete(self.forward(*args, **kwargs))
-            new_loop.close()
-        finally:
-            self.close_session()
-            return result  # type: ignore
+        return asyncio.run_coroutine_threadsafe(
+            self.forward(*args, **kwargs), self._get_loop()
+        ).result()
 
     async def forward(
         self,
@@ -366,6 +786,7 @@ class DendriteMixin:
         deserialize: bool = True,
         run_async: bool = True,
         streaming: bool = False,
+        broadcast: bool = False,
     ) -> list[Union["AsyncGenerator[Any, Any]", "Synapse", "StreamingSynapse"]]:
         """
         Asynchronously sends requests to one or multiple Axons and collates their responses.
@@ -410,6 +831,11 @@ class DendriteMixin:
             deserialize (bool): Determines if the received response should be deserialized. Defaults to ``True``.
             run_async (bool): If ``True``, sends requests concurrently. Otherwise, sends requests sequentially. Defaults to ``True``.
             streaming (bool): Indicates if the response is expected to be in streaming format. Defaults to ``False``.
+            broadcast (bool): Serializes the body and computes the body hash of the synapse once for all the axons,
+                only the timeout, axon and dendrite headers and the signature are produced for each axon. The body then
+                carries the dendrite information common to all requests, without nonce and signature, and no axon
+                information; axons read them from the headers. Each response is still filled in its own shallow copy
+                of the synapse, made when its request is sent. Ignored in streaming mode. Defaults to ``False``.
 
         Returns:
             Union[AsyncGenerator, bittensor.core.synapse.Synapse, list[bittensor.core.synapse.Synapse]]: If a single `Axon` is targeted, returns its response.
@@ -429,6 +855,14 @@ class DendriteMixin:
             )
         streaming = is_streaming_subclass or streaming
 
+        broadcast_request = (
+            self._broadcast_request(synapse, timeout)
+            if broadcast and not streaming
+            else None
+        )
+        # Optionally bounds the requests sent at the same time, see `max_concurrency`.
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(axons))
+
         async def query_all_axons(
             is_stream: bool,
         ) -> Union["AsyncGenerator[Any, Any]", "Synapse", "StreamingSynapse"]:
@@ -469,14 +903,25 @@ class DendriteMixin:
                         timeout=timeout,
                         deserialize=deserialize,
                     )
+                elif broadcast_request is not None:
+                    # The body hash cached by the shared synapse is carried over by its copies.
+                    async with semaphore:
+                        return await self._call(
+                            target_axon,
+                            broadcast_request.synapse.model_copy(),
+                            timeout,
+                            deserialize,
+                            broadcast_request,
+                        )
                 else:
                     # If not in streaming mode, simply call the axon and get the response.
-                    return await self.call(
-                        target_axon=target_axon,
-                        synapse=synapse.model_copy(),  # type: ignore
-                        timeout=timeout,
-                        deserialize=deserialize,
-                    )
+                    async with semaphore:
+                        return await self.call(
+                            target_axon=target_axon,
+                            synapse=synapse.model_copy(),  # type: ignore
+                            timeout=timeout,
+                            deserialize=deserialize,
+                        )
 
             # If run_async flag is False, get responses one by one.
             if not run_async:
@@ -493,6 +938,125 @@ class DendriteMixin:
         # Return the single response if only one axon was targeted, else return all responses
         return responses[0] if len(responses) == 1 and not is_list else responses  # type: ignore
 
+    async def forward_iter(
+        self,
+        axons: list[Union["AxonInfo", "Axon"]],
+        synapse: "Synapse" = Synapse(),
+        timeout: float = 12,
+        deserialize: bool = True,
+        quorum: Optional[int] = None,
+        broadcast: bool = False,
+    ) -> AsyncGenerator[tuple[int, Union["AxonInfo", "Axon"], Any], None]:
+        """
+        Sends requests to multiple Axons concurrently and yields each response as soon as it completes, instead of
+        waiting for the slowest Axon like :func:`forward` does.
+
+        With a ``quorum``, the iteration stops once that many successful responses were yielded, and the requests
+        still outstanding are cancelled. Leaving the iteration early cancels the outstanding requests as well.
+
+        For example::
+
+            ...
+            async for uid, axon, response in dendrite.forward_iter(axons, synapse, quorum=10):
+                scores[uid] = score(response)
+
+        Streaming synapses are not supported, use :func:`forward` for them.
+
+        Args:
+            axons (list[Union[bittensor.core.chain_data.axon_info.AxonInfo, bittensor.core.axon.Axon]]): The target Axons to send requests to.
+            synapse (bittensor.core.synapse.Synapse): The Synapse object encapsulating the data. Defaults to a new :func:`Synapse` instance.
+            timeout (float): Maximum duration to wait for a response from an Axon in seconds. Defaults to ``12.0``.
+            deserialize (bool): Determines if the received responses should be deserialized. Defaults to ``True``.
+            quorum (Optional[int]): Number of successful responses after which the outstanding requests are cancelled.
+                Defaults to ``None``, waiting for every response.
+            broadcast (bool): Serializes the body of the synapse once for all the axons, see :func:`forward`.
+                Defaults to ``False``.
+
+        Yields:
+            tuple[int, Union[bittensor.core.chain_data.axon_info.AxonInfo, bittensor.core.axon.Axon], Any]: The index
+            of the Axon in ``axons``, the Axon, and its response, in order of completion.
+        """
+        if isinstance(synapse, StreamingSynapse):
+            raise ValueError(
+                "forward_iter does not support streaming synapses, use forward instead."
+            )
+        if quorum is not None and quorum <= 0:
+            raise ValueError("quorum must be greater than 0")
+
+        broadcast_request = (
+            self._broadcast_request(synapse, timeout) if broadcast else None
+        )
+        request_synapse = (
+            synapse if broadcast_request is None else broadcast_request.synapse
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(axons))
+
+        async def single_axon_response(target_axon) -> "Synapse":
+            async with semaphore:
+                return await self._call(
+                    target_axon,
+                    request_synapse.model_copy(),
+                    timeout,
+                    False,
+                    broadcast_request,
+                )
+
+        pending = {
+            asyncio.ensure_future(single_axon_response(target_axon)): index
+            for index, target_axon in enumerate(axons)
+        }
+
+        successes = 0
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # Yields the responses completed at the same time in the order of the axons.
+                for task in sorted(done, key=pending.__getitem__):
+                    index = pending.pop(task)
+                    response = task.result()
+                    successes += response.is_success
+                    yield (
+                        index,
+                        axons[index],
+                        response.deserialize() if deserialize else response,
+                    )
+                    if quorum is not None and successes >= quorum:
+                        return
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _broadcast_request(
+        self, synapse: "Synapse", timeout: float
+    ) -> "_BroadcastRequest":
+        """
+        Prepares the part of a broadcast request shared by every axon.
+
+        Args:
+            synapse (bittensor.core.synapse.Synapse): The synapse sent to every axon.
+            timeout (float): The timeout of the requests.
+
+        Returns:
+            _BroadcastRequest: A copy of the synapse with the timeout and the dendrite information common to all
+            requests set, and its body hash.
+        """
+        shared_synapse = synapse.model_copy()
+        shared_synapse.timeout = timeout
+        shared_synapse.dendrite = TerminalInfo(
+            ip=self.external_ip,
+            version=version_as_int,
+            uuid=self.uuid,
+            hotkey=self.keypair.ss58_address,
+        )
+        shared_synapse.axon = TerminalInfo()
+        # The copy carries the hashes cached by the synapse, which may have been modified in place since.
+        shared_synapse._invalidate_body_hash()
+        return _BroadcastRequest(shared_synapse)
+
     async def call(
         self,
         target_axon: Union["AxonInfo", "Axon"],
@@ -514,6 +1078,17 @@ class DendriteMixin:
         Returns:
             bittensor.core.synapse.Synapse: The Synapse object, updated with the response data from the Axon.
         """
+        return await self._call(target_axon, synapse, timeout, deserialize)
+
+    async def _call(
+        self,
+        target_axon: Union["AxonInfo", "Axon"],
+        synapse: "Synapse",
+        timeout: float,
+        deserialize: bool,
+        broadcast: Optional["_BroadcastRequest"] = None,
+    ) -> "Synapse":
+        """Implements :func:`call`, reusing the body serialized for a broadcast when ``broadcast`` is given."""
 
         # Record start time
         start_time = time.time()
@@ -521,43 +1096,79 @@ class DendriteMixin:
             target_axon.info() if isinstance(target_axon, Axon) else target_axon
         )
 
+        if self.adaptive_timeout:
+            timeout = self.axon_stats.timeout(target_axon, timeout)
+
         # Build request endpoint from the synapse class
         request_name = synapse.__class__.__name__
         url = self._get_endpoint_url(target_axon, request_name=request_name)
 
         # Preprocess synapse for making a request
-        synapse = self.preprocess_synapse_for_request(target_axon, synapse, timeout)
+        synapse = self.preprocess_synapse_for_request(
+            target_axon,
+            synapse,
+            timeout,
+            body_hash=broadcast.body_hash if broadcast is not None else None,
+        )
 
+        sent = connection_failed = timed_out = False
         try:
+            if self.circuit_breaker and not self.axon_stats.allow(target_axon):
+                raise CircuitOpenError(
+                    f"{target_axon.ip}:{target_axon.port} skipped after repeated connection failures"
+                )
+            sent = True
+
             # Log outgoing request
             self._log_outgoing_request(synapse)
 
             # Make the HTTP POST request
             async with (await self.session).post(
                 url=url,
-                headers=synapse.to_headers(),
-                json=synapse.model_dump(),
-                timeout=aiohttp.ClientTimeout(total=timeout),
+                timeout=aiohttp.ClientTimeout(
+                    total=timeout,
+                    # Bounded separately so that axons which cannot be reached count as connection failures.
+                    sock_connect=timeout / 2 if self.circuit_breaker else None,
+                ),
+                **self._build_request(target_axon, synapse, broadcast),
             ) as response:
                 # Extract the JSON response from the server
-                json_response = await response.json()
+                json_response = await self._read_response_json(target_axon, response)
                 # Process the server response and fill synapse
                 self.process_server_response(response, json_response, synapse)
 
             # Set process time and log the response
             synapse.dendrite.process_time = str(time.time() - start_time)  # type: ignore
 
+        except asyncio.CancelledError:
+            # Cancelled requests, for instance once a quorum is reached, say nothing about the axon.
+            if sent:
+                self.axon_stats.cancel(target_axon)
+            sent = False
+            raise
+
         except Exception as e:
+            # Connection timeouts are raised as connection errors, which are not timeouts of the axon.
+            connection_failed = isinstance(e, aiohttp.ClientConnectionError)
+            timed_out = not connection_failed and isinstance(e, asyncio.TimeoutError)
             synapse = self.process_error_message(synapse, request_name, e)
 
         finally:
+            if sent:
+                self.axon_stats.record(
+                    target_axon,
+                    time.time() - start_time,
+                    synapse.is_success,
+                    connection_failed,
+                    timeout if timed_out else None,
+                )
             self._log_incoming_response(synapse)
 
             # Log synapse event history
-            self.synapse_history.append(Synapse.from_headers(synapse.to_headers()))
+            self._record_history(synapse)
 
-            # Return the updated synapse object after deserializing if requested
-            return synapse.deserialize() if deserialize else synapse
+        # Return the updated synapse object after deserializing if requested
+        return synapse.deserialize() if deserialize else synapse
 
     async def call_stream(
         self,
@@ -610,9 +1221,8 @@ class DendriteMixin:
             # Make the HTTP POST request
             async with (await self.session).post(
                 url,
-                headers=synapse.to_headers(),
-                json=synapse.model_dump(),
                 timeout=aiohttp.ClientTimeout(total=timeout),
+                **self._build_request(target_axon, synapse),
             ) as response:
                 # Use synapse subclass' process_streaming_response method to yield the response chunks
                 async for chunk in synapse.process_streaming_response(response):  # type: ignore
@@ -632,7 +1242,7 @@ class DendriteMixin:
             self._log_incoming_response(synapse)
 
             # Log synapse event history
-            self.synapse_history.append(Synapse.from_headers(synapse.to_headers()))
+            self._record_history(synapse)
 
             # Return the updated synapse object after deserializing if requested
             if deserialize:
@@ -645,6 +1255,7 @@ class DendriteMixin:
         target_axon_info: "AxonInfo",
         synapse: "Synapse",
         timeout: float = 12.0,
+        body_hash: Optional[str] = None,
     ) -> "Synapse":
         """
         Preprocesses the synapse for making a request. This includes building headers for Dendrite and Axon and signing the request.
@@ -653,6 +1264,8 @@ class DendriteMixin:
             target_axon_info (bittensor.core.chain_data.axon_info.AxonInfo): The target axon information.
             synapse (bittensor.core.synapse.Synapse): The synapse object to be preprocessed.
             timeout (float): The request timeout duration in seconds. Defaults to ``12.0`` seconds.
+            body_hash (Optional[str]): The body hash to sign, already computed for a broadcast. Defaults to ``None``,
+                hashing the synapse anew, since its fields may have been modified in place since it was last hashed.
 
         Returns:
             bittensor.core.synapse.Synapse: The preprocessed synapse.
@@ -674,8 +1287,12 @@ class DendriteMixin:
             hotkey=target_axon_info.hotkey,
         )
 
+        if body_hash is None:
+            synapse._invalidate_body_hash()
+            body_hash = synapse.body_hash
+
         # Sign the request using the dendrite, axon info, and the synapse body hash
-        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{synapse.body_hash}"
+        message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{body_hash}"
         synapse.dendrite.signature = f"0x{self.keypair.sign(message).hex()}"
 
         return synapse
@@ -703,7 +1320,12 @@ class DendriteMixin:
             # server's state only if the protocol allows mutation. To prevent overwrites,
             # the protocol must set Frozen = True
             server_synapse = local_synapse.__class__(**json_response)
-            for key in local_synapse.model_dump().keys():
+            # The fields of the dump, without dumping the synapse.
+            for key in [
+                name
+                for name, field in local_synapse.__class__.model_fields.items()
+                if not field.exclude
+            ]:
                 try:
                     # Set the attribute in the local synapse from the corresponding
                     # attribute in the server synapse
@@ -718,23 +1340,13 @@ class DendriteMixin:
             local_synapse.axon.status_code = server_response.status
             local_synapse.axon.status_message = json_response.get("message")
 
-        # Extract server headers and overwrite None values in local synapse headers
-        server_headers = Synapse.from_headers(server_response.headers)  # type: ignore
-
-        # Merge dendrite headers
-        local_synapse.dendrite.__dict__.update(
-            {
-                **local_synapse.dendrite.model_dump(exclude_none=True),  # type: ignore
-                **server_headers.dendrite.model_dump(exclude_none=True),  # type: ignore
-            }
+        # Merge the terminal information of the server headers, the values the server did not send are kept. The
+        # values are read straight from the headers, without building a synapse from them.
+        local_synapse.dendrite.__dict__.update(  # type: ignore
+            TerminalInfo.parse_headers(server_response.headers, "dendrite")  # type: ignore
         )
-
-        # Merge axon headers
-        local_synapse.axon.__dict__.update(
-            {
-                **local_synapse.axon.model_dump(exclude_none=True),  # type: ignore
-                **server_headers.axon.model_dump(exclude_none=True),  # type: ignore
-            }
+        local_synapse.axon.__dict__.update(  # type: ignore
+            TerminalInfo.parse_headers(server_response.headers, "axon")  # type: ignore
         )
 
         # Update the status code and status message of the dendrite to match the axon
@@ -812,6 +1424,8 @@ class DendriteMixin:
             # ... some operations ...
             del dendrite  # This will implicitly invoke the __del__ method and close the session.
         """
+        # Nothing is waited for in the background thread, which may be gone at interpreter exit.
+        self._stop_loop(wait=False)
         self.close_session()
 
 
@@ -820,10 +1434,44 @@ BaseModel: Union["torch.nn.Module", object] = torch.nn.Module if use_torch() els
 
 
 class Dendrite(DendriteMixin, BaseModel):  # type: ignore
-    def __init__(self, wallet: Optional[Union["Wallet", "Keypair"]] = None):
+    def __init__(
+        self,
+        wallet: Optional[Union["Wallet", "Keypair"]] = None,
+        compression: bool = False,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        wire_format: str = "json",
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+        ipv4_only: bool = False,
+        max_concurrency: Optional[int] = None,
+        history_size: int = 1000,
+        history_sample_rate: float = 1.0,
+        adaptive_timeout: bool = False,
+        circuit_breaker: bool = False,
+        max_decompressed_size: int = DEFAULT_MAX_DECOMPRESSED_SIZE,
+    ):
         if use_torch():
             torch.nn.Module.__init__(self)
-        DendriteMixin.__init__(self, wallet)
+        DendriteMixin.__init__(
+            self,
+            wallet,
+            compression,
+            compression_threshold,
+            wire_format,
+            connection_limit=connection_limit,
+            connection_limit_per_host=connection_limit_per_host,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            ipv4_only=ipv4_only,
+            max_concurrency=max_concurrency,
+            history_size=history_size,
+            history_sample_rate=history_sample_rate,
+            adaptive_timeout=adaptive_timeout,
+            circuit_breaker=circuit_breaker,
+            max_decompressed_size=max_decompressed_size,
+        )
 
 
 if not use_torch():
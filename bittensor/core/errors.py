@@ -91,6 +91,14 @@ class UnknownSynapseError(SynapseException):
     """This exception is raised when the request name is not found in the Axon's forward_fns dictionary."""
 
 
+class CircuitOpenError(Exception):
+    """This exception is raised when a request is skipped because the circuit breaker of its axon is open."""
+
+
+class NonceStoreFullError(Exception):
+    """This exception is raised when a nonce cannot be stored because the nonce store is full of entries which have not expired yet."""
+
+
 class SynapseParsingError(Exception):
     """This exception is raised when the request headers are unable to be parsed into the synapse type."""
 
@@ -103,6 +111,18 @@ class BlacklistedException(SynapseException):
     """This exception is raised when the request is blacklisted."""
 
 
+class RateLimitedException(SynapseException):
+    """This exception is raised when the request exceeds the rate limit of its hotkey or ip address."""
+
+
+class UnsupportedMediaTypeException(SynapseException):
+    """This exception is raised when the request body is compressed but the axon does not accept compressed requests."""
+
+
+class PayloadTooLargeException(SynapseException):
+    """This exception is raised when the request body decompresses to more than the axon accepts."""
+
+
 class PriorityException(SynapseException):
     """This exception is raised when the request priority is not met."""
 
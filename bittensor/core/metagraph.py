@@ -5,7 +5,7 @@ import typing
 from abc import ABC, abstractmethod
 from os import listdir
 from os.path import join
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -65,6 +65,26 @@ This list defines the set of keys expected in the metagraph's state dictionary w
 - **uids** (`ndarray`): Unique identifiers for each node in the metagraph.
 """
 
+INCREMENTAL_SYNC_MAX_CHANGED_RATIO = 0.5
+"""Share of changed neurons above which an incremental sync downloads the whole subnet instead of each neuron."""
+
+# Neuron arrays of the metagraph, and the neuron value each holds, see `_set_metagraph_attributes`.
+_NEURON_ARRAY_VALUES: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("uids", lambda neuron: neuron.uid),
+    ("trust", lambda neuron: neuron.trust),
+    ("consensus", lambda neuron: neuron.consensus),
+    ("incentive", lambda neuron: neuron.incentive),
+    ("dividends", lambda neuron: neuron.dividends),
+    ("ranks", lambda neuron: neuron.rank),
+    ("emission", lambda neuron: neuron.emission),
+    ("active", lambda neuron: neuron.active),
+    ("last_update", lambda neuron: neuron.last_update),
+    ("validator_permit", lambda neuron: neuron.validator_permit),
+    ("validator_trust", lambda neuron: neuron.validator_trust),
+    ("total_stake", lambda neuron: neuron.total_stake.tao),
+    ("stake", lambda neuron: float(neuron.stake)),
+)
+
 
 def get_save_dir(network: str, netuid: int) -> str:
     """
@@ -527,6 +547,7 @@ class MetagraphMixin(ABC):
         block: Optional[int] = None,
         lite: bool = True,
         subtensor: Optional["Subtensor"] = None,
+        incremental: bool = False,
     ):
         """
         Synchronizes the metagraph with the Bittensor network's current state. It updates the metagraph's attributes to reflect the latest data from the network, ensuring the metagraph represents the most current state of the network.
@@ -535,6 +556,7 @@ class MetagraphMixin(ABC):
             block (Optional[int]): A specific block number to synchronize with. If None, the metagraph syncs with the latest block. This allows for historical analysis or specific state examination of the network.
             lite (bool): If True, a lite version of the metagraph is used for quicker synchronization. This is beneficial when full detail is not necessary, allowing for reduced computational and time overhead.
             subtensor (Optional[bittensor.core.subtensor.Subtensor]): An instance of the subtensor class from Bittensor, providing an interface to the underlying blockchain data. If provided, this instance is used for data retrieval during synchronization.
+            incremental (bool): If True, only the neurons which changed since the previously synced block are downloaded, and patched into the existing arrays. Falls back to a full sync when there is no previous sync with the same ``lite`` flag, when the subnet ran its epoch or changed size in the meantime, or when too many neurons changed. See :func:`_sync_incremental`.
 
         Example:
             Sync the metagraph with the latest block from the subtensor, using the lite version for efficiency::
@@ -551,6 +573,10 @@ class MetagraphMixin(ABC):
                 subtensor = Subtensor()
                 metagraph.sync(block=12345, lite=False, subtensor=subtensor)
 
+            Validators syncing every few blocks only download what changed since their previous sync::
+
+                metagraph.sync(subtensor=subtensor, incremental=True)
+
         NOTE:
             If attempting to access data beyond the previous 300 blocks, you **must** use the ``archive`` network for subtensor. Light nodes are configured only to store the previous 300 blocks if connecting to finney or test networks.
 
@@ -579,6 +605,13 @@ class MetagraphMixin(ABC):
                     "network for subtensor and retry."
                 )
 
+        if incremental:
+            # The changes are detected and, if need be, fully synced at the same block.
+            if block is None:
+                block = subtensor.get_current_block()
+            if self._sync_incremental(block, lite, subtensor):
+                return
+
         # Assign neurons based on 'lite' flag
         self._assign_neurons(block, lite, subtensor)
 
@@ -589,6 +622,139 @@ class MetagraphMixin(ABC):
         if not lite:
             self._set_weights_and_bonds(subtensor=subtensor)
 
+    def _sync_incremental(self, block: int, lite: bool, subtensor: "Subtensor") -> bool:
+        """
+        Synchronizes the metagraph by downloading only the neurons which changed since the previously synced block,
+        and patching them into the existing arrays in place.
+
+        Between two epochs of the subnet, a neuron only changes when it sets weights, serves its axon or prometheus
+        endpoint, is registered, or when its stake changes. These changes are detected with the ``LastUpdate`` and
+        ``BlockAtRegistration`` storages, the block the axons and prometheus endpoints were served at and the total
+        stakes of the hotkeys, which are much smaller than the neurons themselves.
+
+        Args:
+            block (int): The block number to synchronize with.
+            lite (bool): Whether the neurons are synchronized without their weights and bonds.
+            subtensor (bittensor.core.subtensor.Subtensor): The subtensor instance used for fetching the data.
+
+        Returns:
+            bool: ``True`` if the metagraph was synchronized, ``False`` if a full sync is needed instead.
+        """
+        neurons = getattr(self, "neurons", None)
+        previous_block = int(self.block.item())
+        if (
+            not neurons
+            or lite != getattr(self, "lite", None)
+            or (not lite and self.netuid == 0)
+        ):
+            return False
+        if block < previous_block:
+            return False
+
+        changed_uids = self._get_changed_uids(previous_block, block, subtensor)
+        if changed_uids is None or len(
+            changed_uids
+        ) > INCREMENTAL_SYNC_MAX_CHANGED_RATIO * len(neurons):
+            logging.debug(
+                f"Metagraph of netuid {self.netuid} falls back to a full sync at block {block}."
+            )
+            return False
+
+        changed_neurons = [
+            subtensor.neuron_for_uid_lite(uid=uid, netuid=self.netuid, block=block)
+            if lite
+            else subtensor.neuron_for_uid(uid=uid, netuid=self.netuid, block=block)
+            for uid in sorted(changed_uids)
+        ]
+        if any(neuron.is_null for neuron in changed_neurons):
+            return False
+
+        for neuron in changed_neurons:
+            self._patch_neuron(neuron)
+        self.block[...] = block
+        logging.debug(
+            f"Metagraph of netuid {self.netuid} synced {len(changed_neurons)} changed neurons at block {block}."
+        )
+        return True
+
+    def _get_changed_uids(
+        self, previous_block: int, block: int, subtensor: "Subtensor"
+    ) -> Optional[set[int]]:
+        """
+        Finds the neurons which changed between two blocks.
+
+        Args:
+            previous_block (int): The block the metagraph was synchronized with.
+            block (int): The block to synchronize with.
+            subtensor (bittensor.core.subtensor.Subtensor): The subtensor instance used for fetching the data.
+
+        Returns:
+            Optional[set[int]]: The uids of the changed neurons, or ``None`` if every neuron may have changed, because
+            the subnet ran its epoch or changed size.
+        """
+        # The epoch updates the ranks, trusts, emissions and stakes of every neuron.
+        blocks_since_epoch = getattr(
+            subtensor.query_subtensor("BlocksSinceLastStep", block, [self.netuid]),
+            "value",
+            None,
+        )
+        if blocks_since_epoch is None or block - blocks_since_epoch > previous_block:
+            return None
+
+        last_update = getattr(
+            subtensor.query_subtensor("LastUpdate", block, [self.netuid]),
+            "value",
+            None,
+        )
+        if not last_update or len(last_update) != len(self.neurons):
+            return None
+        changed_uids = {
+            uid for uid, updated in enumerate(last_update) if updated > previous_block
+        }
+
+        for uid, registered in subtensor.query_map_subtensor(
+            "BlockAtRegistration", block, [self.netuid]
+        ):
+            if registered.value > previous_block:
+                changed_uids.add(uid.value)
+
+        hotkeys = [neuron.hotkey for neuron in self.neurons]
+        uids = {hotkey: uid for uid, hotkey in enumerate(hotkeys)}
+        for storage in ("Axons", "Prometheus"):
+            for hotkey, served in subtensor.query_map_subtensor(
+                storage, block, [self.netuid]
+            ):
+                uid = uids.get(hotkey.value)
+                if uid is not None and served.value["block"] > previous_block:
+                    changed_uids.add(uid)
+
+        stakes = subtensor.get_total_stake_for_hotkeys(*hotkeys, block=block)
+        changed_uids.update(
+            uid
+            for uid, neuron in enumerate(self.neurons)
+            if neuron.hotkey not in stakes
+            or stakes[neuron.hotkey].rao != neuron.total_stake.rao
+        )
+        return changed_uids
+
+    def _patch_neuron(self, neuron):
+        """
+        Replaces a neuron of the metagraph, updating its entry in each array in place.
+
+        Args:
+            neuron (Union[NeuronInfo, NeuronInfoLite]): The new state of the neuron.
+        """
+        uid = neuron.uid
+        self.neurons[uid] = neuron
+        self.axons[uid] = neuron.axon_info
+        for attribute, value in _NEURON_ARRAY_VALUES:
+            getattr(self, attribute)[uid] = value(neuron)
+        if not self.lite:
+            self.weights[uid] = self._process_weights_or_bonds(
+                [neuron.weights], "weights"
+            )[0]
+            self.bonds[uid] = self._process_weights_or_bonds([neuron.bonds], "bonds")[0]
+
     def _initialize_subtensor(self, subtensor: "Subtensor"):
         """
         Initializes the subtensor to be used for syncing the metagraph.
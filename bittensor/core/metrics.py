@@ -0,0 +1,260 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""
+Request metrics of the Axon, exposed in the Prometheus text format.
+
+The metrics are only updated from the event loop serving the axon, so plain integer and float updates are enough
+and no lock is taken on the request path.
+"""
+
+import bisect
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    from bittensor.core.axon import Axon
+
+METRICS_PATH = "/metrics"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds of the stage duration buckets, from sub millisecond header checks to long forwards.
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+STAGES = ("preprocess", "blacklist", "verify", "priority", "forward", "serialization")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+class Counter:
+    """
+    A monotonically increasing counter, with one series per combination of label values.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): Help text of the metric.
+        labelnames (tuple[str, ...]): Names of the labels.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = defaultdict(float)
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        """Increments the series of the given label values."""
+        self._values[labelvalues] += amount
+
+    def value(self, *labelvalues: str) -> float:
+        """Returns the current value of a series."""
+        return self._values.get(labelvalues, 0.0)
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} counter",
+        ]
+        for labelvalues, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_labels(self.labelnames, labelvalues)} {value}")
+        return lines
+
+
+class Histogram:
+    """
+    A histogram of observed values with fixed bucket boundaries, with one series per combination of label values.
+
+    Args:
+        name (str): Metric name.
+        documentation (str): Help text of the metric.
+        labelnames (tuple[str, ...]): Names of the labels.
+        buckets (tuple[float, ...]): Sorted upper bounds of the buckets, ``+Inf`` is implied.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        # Per series: the count of each bucket (not cumulative, the last one is +Inf) and the sum of the values.
+        self._counts: dict[tuple, list[int]] = {}
+        self._sums: dict[tuple, float] = defaultdict(float)
+
+    def observe(self, value: float, *labelvalues: str):
+        """Records a value in the series of the given label values."""
+        counts = self._counts.get(labelvalues)
+        if counts is None:
+            counts = self._counts[labelvalues] = [0] * (len(self.buckets) + 1)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[labelvalues] += value
+
+    def count(self, *labelvalues: str) -> int:
+        """Returns the number of values observed in a series."""
+        return sum(self._counts.get(labelvalues, ()))
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram",
+        ]
+        names = self.labelnames + ("le",)
+        for labelvalues, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f"{self.name}_bucket{_labels(names, labelvalues + (le,))} {cumulative}"
+                )
+            labels = _labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {self._sums[labelvalues]}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def _gauge(name: str, documentation: str, samples: dict[str, float]) -> list[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    lines.extend(f"{name}{labels} {value}" for labels, value in samples.items())
+    return lines
+
+
+class AxonMetrics:
+    """
+    Collects the request metrics of an :class:`bittensor.core.axon.Axon`.
+
+    The counters and histograms are updated by the request pipeline, while the gauges (requests in flight, scheduler
+    and thread pool queues) are read from the axon when the metrics are rendered.
+
+    Args:
+        axon (bittensor.core.axon.Axon): The axon to report on.
+    """
+
+    def __init__(self, axon: "Axon"):
+        self.axon = axon
+        self.in_flight = 0
+        self.requests = Counter(
+            "bittensor_axon_requests_total",
+            "Requests served by the axon, by synapse and status code.",
+            ("synapse", "status_code"),
+        )
+        self.stage_duration = Histogram(
+            "bittensor_axon_stage_duration_seconds",
+            "Time spent in each stage of the request pipeline, by synapse.",
+            ("synapse", "stage"),
+        )
+
+    def synapse_label(self, name: Optional[str]) -> str:
+        """Returns the label of a synapse name, any name not attached to the axon is reported as ``unknown``."""
+        return name if name in self.axon.forward_class_types else "unknown"
+
+    def observe_stage(self, name: Optional[str], stage: str, duration: float):
+        """
+        Records the time spent in a stage of the request pipeline.
+
+        Args:
+            name (Optional[str]): The synapse name.
+            stage (str): One of :data:`STAGES`.
+            duration (float): The duration in seconds.
+        """
+        self.stage_duration.observe(duration, self.synapse_label(name), stage)
+
+    def observe_request(self, name: Optional[str], status_code: int):
+        """
+        Counts a served request.
+
+        Args:
+            name (Optional[str]): The synapse name.
+            status_code (int): The status code of the response.
+        """
+        self.requests.inc(self.synapse_label(name), str(status_code))
+
+    def render(self) -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, ready to be served on :data:`METRICS_PATH`.
+        """
+        lines = self.requests.render() + self.stage_duration.render()
+        lines += _gauge(
+            "bittensor_axon_requests_in_flight",
+            "Requests currently processed by the axon.",
+            {"": self.in_flight},
+        )
+
+        queue_depths = {'{pool="priority"}': self.axon.thread_pool._work_queue.qsize()}
+        forward_executor = getattr(self.axon, "forward_executor", None)
+        if forward_executor is not None:
+            queue_depths['{pool="forward"}'] = forward_executor._work_queue.qsize()
+        lines += _gauge(
+            "bittensor_axon_thread_pool_queue_depth",
+            "Tasks waiting for a thread of the axon thread pools.",
+            queue_depths,
+        )
+
+        scheduler = getattr(self.axon, "scheduler", None)
+        if scheduler is not None:
+            lines += _gauge(
+                "bittensor_axon_scheduler_queue_depth",
+                "Requests waiting for a slot of the priority scheduler.",
+                {"": scheduler.queue_depth},
+            )
+            lines += _gauge(
+                "bittensor_axon_scheduler_in_flight",
+                "Requests holding a slot of the priority scheduler.",
+                {"": scheduler.in_flight},
+            )
+
+        admission = getattr(self.axon, "admission", None)
+        if admission is not None:
+            stats = admission.stats()
+            lines += [
+                "# HELP bittensor_axon_requests_shed_total Requests rejected by the load shedding.",
+                "# TYPE bittensor_axon_requests_shed_total counter",
+                f"bittensor_axon_requests_shed_total {stats['shed']}",
+            ]
+        return "\n".join(lines) + "\n"
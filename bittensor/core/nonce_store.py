@@ -0,0 +1,300 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""Bounded, expiring storage of the last processed dendrite nonce per endpoint key, used by the Axon to prevent replays."""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+from bittensor.core.errors import NonceStoreFullError
+from bittensor.utils.axon_utils import NONCE_TTL_NS
+
+
+class NonceStore(ABC):
+    """
+    Base class for the storage of the last processed nonce per endpoint key (``"{hotkey}:{uuid}"``).
+
+    Every entry expires once its nonce can no longer pass the freshness check of :func:`Axon.default_verify`, so the
+    store only has to remember nonces which are still inside the allowed nonce window. Implementations keep the
+    ``dict``-like ``get``/``[]`` interface of the former ``Axon.nonces`` attribute.
+
+    Entries which have not expired are never evicted, since a replay of their nonce would pass again. Once the store
+    is full of them, new keys are refused with :class:`bittensor.core.errors.NonceStoreFullError` until some expire.
+
+    Args:
+        max_size (int): Maximum number of entries kept in the store.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        self.max_size = max_size
+
+    @abstractmethod
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """Returns the last nonce stored for ``key``, or ``default`` if it is unknown or expired."""
+
+    @abstractmethod
+    def set(self, key: str, nonce: int, ttl_ns: Optional[int] = None):
+        """
+        Stores ``nonce`` as the last processed nonce for ``key``.
+
+        Args:
+            key (str): The endpoint key.
+            nonce (int): The nonce of the verified request.
+            ttl_ns (Optional[int]): How long the entry is kept in nanoseconds. Defaults to ``NONCE_TTL_NS``, the widest nonce window the axon accepts.
+
+        Raises:
+            bittensor.core.errors.NonceStoreFullError: If ``key`` is new and the store is full of entries which have not expired.
+        """
+
+    @abstractmethod
+    def advance(self, key: str, nonce: int, ttl_ns: Optional[int] = None) -> bool:
+        """
+        Atomically stores ``nonce`` as the last processed nonce for ``key`` if it is greater than the stored one, or
+        if no unexpired nonce is stored. Concurrent requests carrying the same nonce are thus accepted only once.
+
+        Args:
+            key (str): The endpoint key.
+            nonce (int): The nonce of the verified request.
+            ttl_ns (Optional[int]): How long the entry is kept in nanoseconds. Defaults to ``NONCE_TTL_NS``.
+
+        Returns:
+            bool: ``True`` if the nonce was stored, ``False`` if a greater or equal nonce was already processed.
+
+        Raises:
+            bittensor.core.errors.NonceStoreFullError: If ``key`` is new and the store is full of entries which have not expired.
+        """
+
+    @abstractmethod
+    def keys(self) -> list[str]:
+        """Returns the keys of all entries which are not expired."""
+
+    def close(self):
+        """Releases the resources held by the store."""
+
+    def __getitem__(self, key: str) -> int:
+        nonce = self.get(key)
+        if nonce is None:
+            raise KeyError(key)
+        return nonce
+
+    def __setitem__(self, key: str, nonce: int):
+        self.set(key, nonce)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+
+class MemoryNonceStore(NonceStore):
+    """
+    In-memory nonce store split into independently locked shards, so concurrent verifications of different hotkeys do
+    not contend on a single lock. Each shard is ordered by last update, and expired entries are evicted lazily.
+
+    Args:
+        max_size (int): Maximum number of entries kept across all shards.
+        shards (int): Number of shards the keys are distributed over.
+    """
+
+    def __init__(self, max_size: int = 100_000, shards: int = 16):
+        super().__init__(max_size)
+        if shards <= 0:
+            raise ValueError("shards must be greater than 0")
+        self._shard_max_size = -(-max_size // shards)
+        self._shards: list[OrderedDict[str, tuple[int, int]]] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _shard(self, key: str) -> int:
+        return hash(key) % len(self._shards)
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        index = self._shard(key)
+        with self._locks[index]:
+            entry = self._shards[index].get(key)
+            if entry is None:
+                return default
+            nonce, expires_at = entry
+            if expires_at <= time.time_ns():
+                del self._shards[index][key]
+                return default
+            return nonce
+
+    def set(self, key: str, nonce: int, ttl_ns: Optional[int] = None):
+        self._store(key, nonce, ttl_ns, only_if_greater=False)
+
+    def advance(self, key: str, nonce: int, ttl_ns: Optional[int] = None) -> bool:
+        return self._store(key, nonce, ttl_ns, only_if_greater=True)
+
+    def _store(
+        self, key: str, nonce: int, ttl_ns: Optional[int], only_if_greater: bool
+    ) -> bool:
+        now = time.time_ns()
+        expires_at = now + (ttl_ns if ttl_ns is not None else NONCE_TTL_NS)
+        index = self._shard(key)
+        with self._locks[index]:
+            shard = self._shards[index]
+            entry = shard.get(key)
+            if only_if_greater and entry is not None:
+                if entry[1] > now and nonce <= entry[0]:
+                    return False
+            # Entries are ordered by last update, so the expired ones are at the front.
+            while shard:
+                oldest_key, (_, oldest_expires_at) = next(iter(shard.items()))
+                if oldest_expires_at > now:
+                    break
+                del shard[oldest_key]
+            if key not in shard and len(shard) >= self._shard_max_size:
+                # Entries stored with a shorter time to live may have expired behind the front.
+                for expired_key in [k for k, (_, e) in shard.items() if e <= now]:
+                    del shard[expired_key]
+            if key not in shard and len(shard) >= self._shard_max_size:
+                raise NonceStoreFullError(
+                    f"Nonce store is full with {len(shard)} live entries in the shard of {key}"
+                )
+            shard[key] = (nonce, expires_at)
+            shard.move_to_end(key)
+            return True
+
+    def keys(self) -> list[str]:
+        now = time.time_ns()
+        keys = []
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                keys.extend(k for k, (_, exp) in shard.items() if exp > now)
+        return keys
+
+
+class DiskNonceStore(NonceStore):
+    """
+    SQLite backed nonce store, so the replay protection state survives axon restarts. The database is memory-mapped
+    and runs in WAL mode; expired entries are purged periodically, or when the table reaches ``max_size`` rows.
+
+    Args:
+        path (str): Path of the database file. Parent directories are created if needed.
+        max_size (int): Maximum number of entries kept in the database.
+        purge_interval (int): Number of writes between two purges of expired entries.
+        mmap_size (int): Number of bytes of the database file to memory-map.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 100_000,
+        purge_interval: int = 1_000,
+        mmap_size: int = 64 * 1024 * 1024,
+    ):
+        super().__init__(max_size)
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.purge_interval = purge_interval
+        self._writes = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nonces "
+            "(key TEXT PRIMARY KEY, nonce INTEGER NOT NULL, expires_at INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS nonces_expires_at ON nonces (expires_at)"
+        )
+        with self._lock:
+            self._purge(time.time_ns())
+            (self._count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM nonces"
+            ).fetchone()
+
+    def _purge(self, now: int):
+        cursor = self._conn.execute("DELETE FROM nonces WHERE expires_at <= ?", (now,))
+        self._count -= cursor.rowcount
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT nonce FROM nonces WHERE key = ? AND expires_at > ?",
+                (key, time.time_ns()),
+            ).fetchone()
+        return row[0] if row is not None else default
+
+    def set(self, key: str, nonce: int, ttl_ns: Optional[int] = None):
+        self._store(key, nonce, ttl_ns, only_if_greater=False)
+
+    def advance(self, key: str, nonce: int, ttl_ns: Optional[int] = None) -> bool:
+        return self._store(key, nonce, ttl_ns, only_if_greater=True)
+
+    def _store(
+        self, key: str, nonce: int, ttl_ns: Optional[int], only_if_greater: bool
+    ) -> bool:
+        now = time.time_ns()
+        expires_at = now + (ttl_ns if ttl_ns is not None else NONCE_TTL_NS)
+        with self._lock:
+            if only_if_greater:
+                row = self._conn.execute(
+                    "SELECT nonce FROM nonces WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is not None and nonce <= row[0]:
+                    return False
+            self._writes += 1
+            if self._writes % self.purge_interval == 0:
+                self._purge(now)
+            cursor = self._conn.execute(
+                "UPDATE nonces SET nonce = ?, expires_at = ? WHERE key = ?",
+                (nonce, expires_at, key),
+            )
+            if cursor.rowcount:
+                return True
+            if self._count >= self.max_size:
+                self._purge(now)
+                if self._count >= self.max_size:
+                    raise NonceStoreFullError(
+                        f"Nonce store is full with {self._count} live entries"
+                    )
+            self._conn.execute(
+                "INSERT INTO nonces (key, nonce, expires_at) VALUES (?, ?, ?)",
+                (key, nonce, expires_at),
+            )
+            self._count += 1
+            return True
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key FROM nonces WHERE expires_at > ?", (time.time_ns(),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
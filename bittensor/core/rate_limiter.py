@@ -0,0 +1,135 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""Token bucket rate limiting of the requests received by the Axon."""
+
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+
+class TokenBucketRateLimiter:
+    """
+    Keeps one token bucket per key (a hotkey or an ip address). Each bucket holds up to ``burst`` tokens and is
+    refilled at ``rate`` tokens per second; a request is allowed if its bucket holds a token, which it consumes.
+
+    The rate and burst of a key can be scaled by a weight, for instance to give validators with more stake larger
+    buckets, see :func:`set_stake_weights`. Keys without a weight use a weight of 1.
+
+    At most ``max_keys`` buckets are kept, the least recently used ones are dropped first. A dropped key starts
+    again with a full bucket.
+
+    The limiter must be used from a single event loop and is not thread safe.
+
+    Args:
+        rate (float): Tokens added to each bucket per second.
+        burst (Optional[float]): Size of each bucket. Defaults to ``rate``, with a minimum of 1.
+        max_keys (int): Maximum number of buckets kept.
+
+    Example::
+
+        limiter = TokenBucketRateLimiter(rate=10, burst=20)
+        limiter.set_stake_weights(metagraph.hotkeys, metagraph.S)
+        if not limiter.allow(hotkey):
+            ...  # reject the request
+    """
+
+    def __init__(
+        self, rate: float, burst: Optional[float] = None, max_keys: int = 100_000
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = burst if burst else max(rate, 1.0)
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._weights: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def weight(self, key: str) -> float:
+        """Returns the weight scaling the bucket of a key."""
+        return self._weights.get(key, 1.0)
+
+    def set_weights(self, weights: dict[str, float]):
+        """
+        Replaces the weights scaling the rate and burst of the buckets.
+
+        Args:
+            weights (dict[str, float]): The weight of each key, keys not listed use a weight of 1.
+        """
+        self._weights = dict(weights)
+
+    def set_stake_weights(
+        self,
+        hotkeys: Sequence[str],
+        stakes: Union[Sequence[float], "np.ndarray"],
+        max_weight: float = 100.0,
+    ):
+        """
+        Weights the buckets by stake, typically with ``metagraph.hotkeys`` and ``metagraph.S``. A hotkey with the
+        mean stake keeps the base rate and burst, hotkeys with more stake get proportionally larger buckets, up to
+        ``max_weight`` times the base ones. Hotkeys with less stake keep the base buckets.
+
+        Args:
+            hotkeys (Sequence[str]): The hotkeys, aligned with ``stakes``.
+            stakes (Union[Sequence[float], np.ndarray]): The stake of each hotkey.
+            max_weight (float): Maximum weight of a hotkey.
+        """
+        stakes = np.asarray(stakes, dtype=np.float64)
+        mean_stake = stakes.mean() if stakes.size else 0.0
+        if mean_stake <= 0:
+            self.set_weights({})
+            return
+        weights = np.clip(stakes / mean_stake, 1.0, max_weight)
+        self.set_weights(
+            {
+                hotkey: float(weight)
+                for hotkey, weight in zip(hotkeys, weights)
+                if weight > 1.0
+            }
+        )
+
+    def allow(self, key: str) -> bool:
+        """
+        Consumes a token from the bucket of a key.
+
+        Args:
+            key (str): The hotkey or ip address the request comes from.
+
+        Returns:
+            bool: ``True`` if the request is allowed, ``False`` if the bucket is empty.
+        """
+        now = time.monotonic()
+        weight = self._weights.get(key, 1.0)
+        burst = self.burst * weight
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = burst
+            if len(self._buckets) >= self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            tokens, last_time = bucket
+            tokens = min(burst, tokens + (now - last_time) * self.rate * weight)
+            self._buckets.move_to_end(key)
+
+        allowed = tokens >= 1.0
+        self._buckets[key] = (tokens - 1.0 if allowed else tokens, now)
+        return allowed
@@ -0,0 +1,277 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""Priority ordering and deadline aware admission of the requests served by the Axon."""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from typing import AsyncIterator, Optional
+
+
+class PriorityScheduler:
+    """
+    Limits the number of concurrently running forward calls and, once that limit is reached, admits the waiting
+    calls in order of decreasing priority instead of arrival order. Calls with equal priority are admitted first in,
+    first out.
+
+    Each waiting call may carry a deadline (typically derived from ``synapse.timeout``); a call which is still queued
+    when its deadline passes is dropped from the queue with an :class:`asyncio.TimeoutError`, since the dendrite has
+    given up on it anyway.
+
+    The scheduler must be used from a single event loop and is not thread safe.
+
+    Args:
+        max_concurrency (int): Maximum number of calls running at the same time.
+
+    Example::
+
+        scheduler = PriorityScheduler(max_concurrency=4)
+        async with scheduler.slot(priority=stake, deadline=time.time() + synapse.timeout):
+            response = await forward(synapse)
+    """
+
+    def __init__(self, max_concurrency: int):
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+        self.max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._waiters: list[tuple[float, int, asyncio.Future]] = []
+        # Number of waiters in the heap which were neither admitted nor cancelled.
+        self._queued = 0
+        self._counter = itertools.count()
+
+        # Metrics
+        self._admitted = 0
+        self._expired = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls currently waiting for a slot."""
+        return self._queued
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._in_flight
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the scheduler metrics.
+
+        Returns:
+            dict: ``queue_depth``, ``in_flight``, the number of ``admitted`` and ``expired`` calls, and the
+            ``mean_wait_time`` and ``max_wait_time`` in seconds of the admitted calls.
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self._in_flight,
+            "admitted": self._admitted,
+            "expired": self._expired,
+            "mean_wait_time": self._total_wait_time / self._admitted
+            if self._admitted
+            else 0.0,
+            "max_wait_time": self._max_wait_time,
+        }
+
+    def _record_admission(self, wait_time: float):
+        self._admitted += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+
+    async def acquire(self, priority: float = 0.0, deadline: Optional[float] = None):
+        """
+        Waits until a slot is available for a call with the given priority.
+
+        Args:
+            priority (float): Priority of the call, higher values are admitted first.
+            deadline (Optional[float]): Unix timestamp after which the call is no longer worth running.
+
+        Raises:
+            asyncio.TimeoutError: If the deadline passes before a slot is available.
+        """
+        if self._in_flight < self.max_concurrency and not self.queue_depth:
+            self._in_flight += 1
+            self._record_admission(0.0)
+            return
+
+        start_time = time.time()
+        waiter = asyncio.get_running_loop().create_future()
+        waiter.add_done_callback(self._discard_cancelled)
+        heapq.heappush(self._waiters, (-priority, next(self._counter), waiter))
+        self._queued += 1
+        timeout = None if deadline is None else max(deadline - start_time, 0.0)
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        except asyncio.CancelledError:
+            # The slot may already have been handed over by `release`, pass it on.
+            if waiter.done():
+                self.release()
+            else:
+                self._cancel(waiter)
+            raise
+        if not waiter.done():
+            self._cancel(waiter)
+        if waiter.cancelled():
+            self._expired += 1
+            raise asyncio.TimeoutError(
+                f"Call was not scheduled before its deadline, {self.queue_depth} calls are queued"
+            )
+        self._record_admission(time.time() - start_time)
+
+    def _cancel(self, waiter: asyncio.Future):
+        waiter.cancel()
+        self._queued -= 1
+
+    def _discard_cancelled(self, waiter: asyncio.Future):
+        # Cancelled waiters are skipped when popped, the heap is only compacted once they make up most of it.
+        if waiter.cancelled() and len(self._waiters) > 2 * self._queued:
+            self._waiters = [entry for entry in self._waiters if not entry[2].done()]
+            heapq.heapify(self._waiters)
+
+    def release(self):
+        """Frees a slot and hands it over to the highest priority waiting call, if any."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                self._queued -= 1
+                return
+        self._in_flight -= 1
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, priority: float = 0.0, deadline: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        """Holds a slot for the duration of the context. See :func:`acquire`."""
+        await self.acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class AdmissionController:
+    """
+    Estimates how long a new request would take to complete given the recent service times of each synapse type and
+    the number of requests already in flight, so that requests which cannot finish before their deadline are rejected
+    before any work is spent on them.
+
+    The service time of each synapse type is tracked as an exponentially weighted moving average. The estimated
+    completion time of a request is the work already in flight spread over ``concurrency`` workers, plus the service
+    time of the request itself.
+
+    Args:
+        concurrency (int): Number of requests served in parallel.
+        alpha (float): Weight of the latest observation in the moving averages.
+    """
+
+    def __init__(self, concurrency: int, alpha: float = 0.2):
+        if concurrency <= 0:
+            raise ValueError("concurrency must be greater than 0")
+        self.concurrency = concurrency
+        self.alpha = alpha
+        self._service_times: dict[str, float] = {}
+        self._mean_service_time: Optional[float] = None
+        self._in_flight = 0
+
+        # Metrics
+        self._admitted = 0
+        self._shed = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted requests which have not finished yet."""
+        return self._in_flight
+
+    def service_time(self, name: str) -> float:
+        """Returns the moving average service time of a synapse type in seconds, or 0 if it was never served."""
+        return self._service_times.get(name, 0.0)
+
+    def estimated_delay(self, name: str) -> float:
+        """
+        Estimates the time in seconds a request of the given synapse type would need to complete if admitted now.
+
+        Args:
+            name (str): The synapse name.
+
+        Returns:
+            float: The estimated queueing delay plus service time.
+        """
+        queued = self._in_flight * (self._mean_service_time or 0.0) / self.concurrency
+        return queued + self.service_time(name)
+
+    def admit(self, name: str, remaining: float) -> bool:
+        """
+        Decides whether a request can complete in the time remaining before its deadline, and counts it as in
+        flight if so. Every admitted request must be followed by a call to :func:`release`.
+
+        Args:
+            name (str): The synapse name.
+            remaining (float): Seconds left before the deadline of the request.
+
+        Returns:
+            bool: ``True`` if the request is admitted.
+        """
+        if remaining <= 0 or self.estimated_delay(name) > remaining:
+            self._shed += 1
+            return False
+        self._in_flight += 1
+        self._admitted += 1
+        return True
+
+    def release(self):
+        """Marks an admitted request as finished."""
+        self._in_flight -= 1
+
+    def record(self, name: str, service_time: float):
+        """
+        Accounts the time spent serving a request.
+
+        Args:
+            name (str): The synapse name.
+            service_time (float): Seconds the request took to serve, excluding any queueing.
+        """
+        previous = self._service_times.get(name)
+        self._service_times[name] = (
+            service_time
+            if previous is None
+            else self.alpha * service_time + (1 - self.alpha) * previous
+        )
+        self._mean_service_time = (
+            service_time
+            if self._mean_service_time is None
+            else self.alpha * service_time + (1 - self.alpha) * self._mean_service_time
+        )
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the admission metrics.
+
+        Returns:
+            dict: ``in_flight``, the number of ``admitted`` and ``shed`` requests, and the moving average
+            ``service_times`` of each synapse type in seconds.
+        """
+        return {
+            "in_flight": self._in_flight,
+            "admitted": self._admitted,
+            "shed": self._shed,
+            "service_times": dict(self._service_times),
+        }
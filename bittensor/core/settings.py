@@ -270,6 +270,14 @@ TYPE_REGISTRY: dict[str, dict] = {
 
 _BT_AXON_PORT = os.getenv("BT_AXON_PORT")
 _BT_AXON_MAX_WORKERS = os.getenv("BT_AXON_MAX_WORKERS")
+_BT_AXON_NONCE_STORE_MAX_SIZE = os.getenv("BT_AXON_NONCE_STORE_MAX_SIZE")
+_BT_AXON_CRYPTO_WORKERS = os.getenv("BT_AXON_CRYPTO_WORKERS")
+_BT_AXON_COMPRESSION_THRESHOLD = os.getenv("BT_AXON_COMPRESSION_THRESHOLD")
+_BT_AXON_MAX_DECOMPRESSED_SIZE = os.getenv("BT_AXON_MAX_DECOMPRESSED_SIZE")
+_BT_AXON_RATE_LIMIT = os.getenv("BT_AXON_RATE_LIMIT")
+_BT_AXON_RATE_LIMIT_BURST = os.getenv("BT_AXON_RATE_LIMIT_BURST")
+_BT_AXON_IP_RATE_LIMIT = os.getenv("BT_AXON_IP_RATE_LIMIT")
+_BT_AXON_IP_RATE_LIMIT_BURST = os.getenv("BT_AXON_IP_RATE_LIMIT_BURST")
 _BT_PRIORITY_MAX_WORKERS = os.getenv("BT_PRIORITY_MAX_WORKERS")
 _BT_PRIORITY_MAXSIZE = os.getenv("BT_PRIORITY_MAXSIZE")
 
@@ -281,6 +289,36 @@ DEFAULTS = munchify(
             "external_port": os.getenv("BT_AXON_EXTERNAL_PORT") or None,
             "external_ip": os.getenv("BT_AXON_EXTERNAL_IP") or None,
             "max_workers": int(_BT_AXON_MAX_WORKERS) if _BT_AXON_MAX_WORKERS else 10,
+            "nonce_store": os.getenv("BT_AXON_NONCE_STORE") or "memory",
+            "nonce_store_max_size": int(_BT_AXON_NONCE_STORE_MAX_SIZE)
+            if _BT_AXON_NONCE_STORE_MAX_SIZE
+            else 100_000,
+            "nonce_store_path": os.getenv("BT_AXON_NONCE_STORE_PATH") or None,
+            "reject_legacy_nonces": os.getenv("BT_AXON_REJECT_LEGACY_NONCES") or False,
+            "crypto_workers": int(_BT_AXON_CRYPTO_WORKERS)
+            if _BT_AXON_CRYPTO_WORKERS
+            else 0,
+            "crypto_executor": os.getenv("BT_AXON_CRYPTO_EXECUTOR") or "thread",
+            "priority_scheduling": os.getenv("BT_AXON_PRIORITY_SCHEDULING") or False,
+            "load_shedding": os.getenv("BT_AXON_LOAD_SHEDDING") or False,
+            "metrics": os.getenv("BT_AXON_METRICS") or False,
+            "compression": os.getenv("BT_AXON_COMPRESSION") or False,
+            "compression_threshold": int(_BT_AXON_COMPRESSION_THRESHOLD)
+            if _BT_AXON_COMPRESSION_THRESHOLD
+            else 1024,
+            "max_decompressed_size": int(_BT_AXON_MAX_DECOMPRESSED_SIZE)
+            if _BT_AXON_MAX_DECOMPRESSED_SIZE
+            else 32 * 1024 * 1024,
+            "rate_limit": float(_BT_AXON_RATE_LIMIT) if _BT_AXON_RATE_LIMIT else 0.0,
+            "rate_limit_burst": float(_BT_AXON_RATE_LIMIT_BURST)
+            if _BT_AXON_RATE_LIMIT_BURST
+            else None,
+            "ip_rate_limit": float(_BT_AXON_IP_RATE_LIMIT)
+            if _BT_AXON_IP_RATE_LIMIT
+            else 0.0,
+            "ip_rate_limit_burst": float(_BT_AXON_IP_RATE_LIMIT_BURST)
+            if _BT_AXON_IP_RATE_LIMIT_BURST
+            else None,
         },
         "logging": {
             "debug": os.getenv("BT_LOGGING_DEBUG") or False,
@@ -988,6 +988,39 @@ class Subtensor:
 
         return NeuronInfo.from_vec_u8(result)
 
+    @networking.ensure_connected
+    def neuron_for_uid_lite(
+        self, uid: Optional[int], netuid: int, block: Optional[int] = None
+    ) -> "NeuronInfoLite":
+        """
+        Retrieves the information about a specific neuron identified by its unique identifier (UID) within a specified subnet (netuid), without its weights and bonds. This is the single neuron counterpart of :func:`neurons_lite`.
+
+        Args:
+            uid (Optional[int]): The unique identifier of the neuron.
+            netuid (int): The unique identifier of the subnet.
+            block (Optional[int]): The blockchain block number for the query.
+
+        Returns:
+            bittensor.core.chain_data.neuron_info_lite.NeuronInfoLite: Information about the neuron if found, a null neuron otherwise.
+        """
+        if uid is None:
+            return NeuronInfoLite.get_null_neuron()
+
+        block_hash = None if block is None else self.substrate.get_block_hash(block)
+        params = [netuid, uid]
+        if block_hash:
+            params = params + [block_hash]
+
+        json_body = self.substrate.rpc_request(
+            method="neuronInfo_getNeuronLite",
+            params=params,  # custom rpc method
+        )
+
+        if not (result := json_body.get("result", None)):
+            return NeuronInfoLite.get_null_neuron()
+
+        return NeuronInfoLite.from_vec_u8(result)
+
     def get_subnet_hyperparameters(
         self, netuid: int, block: Optional[int] = None
     ) -> Optional[Union[list, "SubnetHyperparameters"]]:
@@ -1567,6 +1600,37 @@ class Subtensor:
             else Balance.from_rao(result.value)
         )
 
+    @networking.ensure_connected
+    def get_total_stake_for_hotkeys(
+        self, *ss58_addresses: str, block: Optional[int] = None
+    ) -> dict[str, "Balance"]:
+        """
+        Returns the total stake held on each of the given hotkeys, in a single request.
+
+        Args:
+            ss58_addresses (tuple[str]): The SS58 addresses of the hotkeys.
+            block (Optional[int]): The block number to retrieve the stakes from. If ``None``, the latest block is used. Default is ``None``.
+
+        Returns:
+            dict[str, Balance]: The total stake of each hotkey.
+        """
+        if not ss58_addresses:
+            return {}
+        storage_keys = [
+            self.substrate.create_storage_key(
+                "SubtensorModule", "TotalHotkeyStake", [address]
+            )
+            for address in ss58_addresses
+        ]
+        results = self.substrate.query_multi(
+            storage_keys,
+            block_hash=None if block is None else self.substrate.get_block_hash(block),
+        )
+        return {
+            storage_key.params[0]: Balance.from_rao(getattr(value, "value", None) or 0)
+            for storage_key, value in results
+        }
+
     def does_hotkey_exist(self, hotkey_ss58: str, block: Optional[int] = None) -> bool:
         """
         Returns true if the hotkey is known by the chain and there are accounts.
@@ -19,12 +19,15 @@ import base64
 import json
 import sys
 import warnings
-from typing import cast, Any, ClassVar, Optional, Union
+from typing import cast, Any, Callable, ClassVar, Iterable, Mapping, Optional, Union
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PlainSerializer,
+    PrivateAttr,
+    WrapSerializer,
     field_validator,
     model_validator,
 )
@@ -66,6 +69,84 @@ def get_size(obj: Any, seen: Optional[set] = None) -> int:
     return size
 
 
+def _sample(items: list, sample_size: int) -> list:
+    """Returns ``sample_size`` evenly spaced items, or all the items if there are not more."""
+    if len(items) <= sample_size:
+        return items
+    step = len(items) / sample_size
+    return [items[int(i * step)] for i in range(sample_size)]
+
+
+def estimate_size(obj: Any, sample_size: int = 16) -> int:
+    """
+    Estimates the length in bytes of the JSON serialization of an object, without serializing it.
+
+    The size of the collections with more than ``sample_size`` items is extrapolated from evenly spaced samples of
+    their items, and strings are counted as one byte per character, without escape sequences.
+
+    Args:
+        obj (Any): The object to estimate the size of.
+        sample_size (int): The number of items sampled in each collection.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    if obj is None or obj is True:
+        return 4
+    if obj is False:
+        return 5
+    if isinstance(obj, (int, float)):
+        return len(repr(obj))
+    if isinstance(obj, (str, bytes, bytearray)):
+        return len(obj) + 2
+    if isinstance(obj, BaseModel):
+        obj = {name: getattr(obj, name) for name in obj.__class__.model_fields}
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        sample = _sample(items, sample_size)
+        # Quoted key, colon and value.
+        size = sum(len(str(k)) + 3 + estimate_size(v, sample_size) for k, v in sample)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = list(obj)
+        sample = _sample(items, sample_size)
+        size = sum(estimate_size(item, sample_size) for item in sample)
+    else:
+        return len(str(obj)) + 2
+    if not items:
+        return 2
+    # Brackets and separators.
+    return 2 + len(items) - 1 + size * len(items) // len(sample)
+
+
+# Field values whose string is the same as the string of their dump, and can be hashed without dumping them.
+_PLAIN_HASH_TYPES = (str, bytes, int, float, bool, type(None))
+
+# Encoded dummy header values, by type.
+_DUMMY_HEADER_VALUES: dict[type, str] = {}
+
+
+def _dummy_header_value(value_type: type) -> str:
+    """
+    Encodes an empty (dummy) instance of a type, sent in the headers in place of a required field to pass pydantic
+    validation on the axon side.
+
+    Args:
+        value_type (type): The type of the field value.
+
+    Returns:
+        str: The base64 encoded JSON of the dummy instance.
+
+    Raises:
+        TypeError: If the dummy instance is not JSON serializable.
+    """
+    encoded_value = _DUMMY_HEADER_VALUES.get(value_type)
+    if encoded_value is None:
+        serialized_value = json.dumps(value_type())
+        encoded_value = base64.b64encode(serialized_value.encode()).decode("utf-8")
+        _DUMMY_HEADER_VALUES[value_type] = encoded_value
+    return encoded_value
+
+
 def cast_int(raw: str) -> int:
     """
     Converts a string to an integer, if the string is not ``None``.
@@ -259,6 +340,89 @@ class TerminalInfo(BaseModel):
     # Extract the HTTP status code as an int
     _extract_status_code = field_validator("status_code", mode="before")(cast_int)
 
+    def to_headers(self, terminal: str) -> dict:
+        """
+        Converts the terminal information into HTTP headers, omitting the unset values.
+
+        Args:
+            terminal (str): The role of the terminal, ``"axon"`` or ``"dendrite"``.
+
+        Returns:
+            dict: The ``bt_header_{terminal}_{field}`` headers.
+        """
+        return {
+            f"bt_header_{terminal}_{k}": str(v)
+            for k, v in self.model_dump().items()
+            if v is not None
+        }
+
+    @staticmethod
+    def parse_headers(headers: Mapping[str, str], terminal: str) -> dict:
+        """
+        Reads the terminal information from HTTP headers, the inverse of :func:`to_headers`.
+
+        The values are cast with the casts compiled from the field types, without building a model: every field being
+        an optional string or number, the values are the ones validation would produce, and an invalid number raises a
+        ``ValueError`` all the same.
+
+        Args:
+            headers (Mapping[str, str]): The headers.
+            terminal (str): The role of the terminal, ``"axon"`` or ``"dendrite"``.
+
+        Returns:
+            dict: The values of the fields present in the headers.
+        """
+        values = {}
+        for header, name, cast_value in _TERMINAL_HEADER_FIELDS[terminal]:
+            value = headers.get(header)
+            if value is not None:
+                values[name] = cast_value(value) if cast_value else value
+        return values
+
+
+# Casts of the header values, by field type.
+_HEADER_CASTS: dict[Any, Callable[[str], Any]] = {
+    Optional[int]: cast_int,
+    Optional[float]: cast_float,
+}
+
+# Header name, field name and cast of each terminal information field, by terminal role.
+_TERMINAL_HEADER_FIELDS: dict[str, tuple[tuple[str, str, Optional[Callable]], ...]] = {
+    terminal: tuple(
+        (f"bt_header_{terminal}_{name}", name, _HEADER_CASTS.get(field.annotation))
+        for name, field in TerminalInfo.model_fields.items()
+    )
+    for terminal in ("axon", "dendrite")
+}
+
+
+def _compile_header_decoder(
+    fields: Iterable[str],
+) -> dict[str, tuple[Optional[str], str]]:
+    """
+    Compiles the lookup table of :func:`Synapse.parse_headers_to_inputs`, from header name to the terminal role, or
+    ``None`` for the ``input_obj`` headers, and the field the header holds.
+
+    Args:
+        fields (Iterable[str]): The fields of the synapse, which may be sent as ``input_obj`` headers.
+
+    Returns:
+        dict: The lookup table.
+    """
+    decoder: dict[str, tuple[Optional[str], str]] = {
+        header: (terminal, name)
+        for terminal, header_fields in _TERMINAL_HEADER_FIELDS.items()
+        for header, name, _ in header_fields
+    }
+    for name in fields:
+        if name in ("axon", "dendrite"):
+            continue
+        header = f"bt_header_input_obj_{name}"
+        decoder[header] = (None, name)
+        # HTTP servers may lower case the header names.
+        decoder.setdefault(header.lower(), (None, name))
+    return decoder
+
 
 class Synapse(BaseModel):
     """
@@ -488,6 +652,51 @@ class Synapse(BaseModel):
 
     required_hash_fields: ClassVar[tuple[str, ...]] = ()
 
+    # How `get_total_size` measures the size: "serialized", "sampled" or "deep".
+    size_accounting: ClassVar[str] = "serialized"
+
+    # Required fields sent as dummy values in the headers by `to_headers`, compiled once per subclass.
+    _required_header_fields: ClassVar[tuple[str, ...]] = ()
+
+    # Fields without custom serializer, whose plain values can be hashed as is, compiled once per subclass.
+    _plain_hash_fields: ClassVar[frozenset[str]] = frozenset()
+
+    # Lookup table of `parse_headers_to_inputs`, compiled once per subclass.
+    _header_decoder: ClassVar[dict[str, tuple[Optional[str], str]]] = (
+        _compile_header_decoder(())
+    )
+
+    # Hashes of the required hash fields and body hash, invalidated when a required hash field is assigned.
+    _field_hashes: dict[str, str] = PrivateAttr(default_factory=dict)
+    _body_hash: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any):
+        super().__pydantic_init_subclass__(**kwargs)
+        # Matches the "required" list of the JSON schema, which lists the fields by their alias.
+        cls._required_header_fields = tuple(
+            name
+            for name, field in cls.model_fields.items()
+            if field.is_required() and field.alias in (None, name)
+        )
+        decorators = cls.__pydantic_decorators__
+        serialized_fields = {
+            name
+            for serializer in decorators.field_serializers.values()
+            for name in serializer.info.fields
+        }
+        cls._plain_hash_fields = frozenset(
+            name
+            for name, field in cls.model_fields.items()
+            if not decorators.model_serializers
+            and name not in serialized_fields
+            and not any(
+                isinstance(metadata, (PlainSerializer, WrapSerializer))
+                for metadata in field.metadata
+            )
+        )
+        cls._header_decoder = _compile_header_decoder(cls.model_fields)
+
     _extract_total_size = field_validator("total_size", mode="before")(cast_int)
 
     _extract_header_size = field_validator("header_size", mode="before")(cast_int)
@@ -500,24 +709,99 @@ class Synapse(BaseModel):
 
         This is a security mechanism such that the ``required_hash_fields`` property cannot be
         overridden by the user or malicious code.
+
+        Assigning one of the required hash fields also invalidates the cached :func:`body_hash`.
         """
         if name == "body_hash":
             raise AttributeError(
                 "body_hash property is read-only and cannot be overridden."
             )
         super().__setattr__(name, value)
+        model_fields = self.__class__.model_fields
+        if name in model_fields and (
+            name in self.__class__.required_hash_fields
+            or "required_hash_fields" in model_fields
+        ):
+            self._invalidate_body_hash(name)
+
+    def _invalidate_body_hash(self, *fields: str):
+        """Drops the cached body hash, along with the hashes of the given fields, or of every field if none is given."""
+        if getattr(self, "__pydantic_private__", None) is None:
+            # Assigned by a validator, before the private attributes are initialized.
+            return
+        self._body_hash = None
+        if not fields:
+            self._field_hashes.clear()
+        for field in fields:
+            self._field_hashes.pop(field, None)
+
+    def __eq__(self, other: Any) -> bool:
+        # Compares as the model would, leaving the cached hashes out.
+        if not isinstance(other, Synapse):
+            return NotImplemented
+
+        def private(synapse: "Synapse") -> Optional[dict[str, Any]]:
+            attributes = synapse.__pydantic_private__
+            if attributes is None:
+                return None
+            return {
+                name: value
+                for name, value in attributes.items()
+                if name not in ("_field_hashes", "_body_hash")
+            }
 
-    def get_total_size(self) -> int:
+        return (
+            self.__class__ is other.__class__
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+            and private(self) == private(other)
+        )
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Synapse":
+        copied = super().model_copy(update=update, deep=deep)
+        if getattr(copied, "__pydantic_private__", None) is not None:
+            # The cached hashes are shared with the original instance unless the copy is deep.
+            copied._field_hashes = dict(self._field_hashes)
+            if update:
+                copied._invalidate_body_hash(*update)
+        return copied
+
+    def get_total_size(self, body_size: Optional[int] = None) -> int:
         """
         Get the total size of the current object.
 
         This method first calculates the size of the current object, then assigns it
         to the instance variable :func:`self.total_size` and finally returns this value.
 
+        The size is measured according to the ``size_accounting`` class variable:
+
+        - ``"serialized"`` (default): the length of the serialized body, ``body_size`` if the body was already
+          serialized, otherwise the length of the JSON serialization of the object.
+        - ``"sampled"``: ``body_size`` if given, otherwise an estimate of the serialized length, see
+          :func:`estimate_size`.
+        - ``"deep"``: the recursive in-memory size of the object, see :func:`get_size`.
+
+        Args:
+            body_size (Optional[int]): The length in bytes of the serialized body, if already known.
+
         Returns:
             int: The total size of the current object.
         """
-        self.total_size = get_size(self)
+        if self.size_accounting == "deep":
+            size = get_size(self)
+        elif body_size is not None:
+            size = body_size
+        elif self.size_accounting == "sampled":
+            size = estimate_size(self)
+        else:
+            try:
+                size = len(self.__pydantic_serializer__.to_json(self))
+            except Exception:
+                # Not JSON serializable, fall back to the in-memory size.
+                size = get_size(self)
+        self.total_size = size
         return self.total_size
 
     @property
@@ -587,12 +871,11 @@ class Synapse(BaseModel):
 
     def get_required_fields(self):
         """
-        Get the required fields from the model's JSON schema.
+        Get the required fields of the model, as listed in the model's JSON schema.
         """
-        schema = self.__class__.model_json_schema()
-        return schema.get("required", [])
+        return list(self._required_header_fields)
 
-    def to_headers(self) -> dict:
+    def to_headers(self, body_size: Optional[int] = None) -> dict:
         """
         Converts the state of a Synapse instance into a dictionary of HTTP headers.
 
@@ -613,6 +896,10 @@ class Synapse(BaseModel):
             headers = synapse.to_headers()
             # headers now contains a dictionary representing the Synapse instance
 
+        Args:
+            body_size (Optional[int]): The length in bytes of the serialized body, if already known. Reported as the
+                total size instead of measuring it again, see :func:`get_total_size`.
+
         Returns:
             dict: A dictionary containing key-value pairs representing the Synapse's properties, suitable for HTTP communication.
         """
@@ -621,50 +908,34 @@ class Synapse(BaseModel):
 
         # Adding headers for 'axon' and 'dendrite' if they are not None
         if self.axon:
-            headers.update(
-                {
-                    f"bt_header_axon_{k}": str(v)
-                    for k, v in self.axon.model_dump().items()
-                    if v is not None
-                }
-            )
+            headers.update(self.axon.to_headers("axon"))
         if self.dendrite:
-            headers.update(
-                {
-                    f"bt_header_dendrite_{k}": str(v)
-                    for k, v in self.dendrite.model_dump().items()
-                    if v is not None
-                }
-            )
-
-        # Getting the fields of the instance
-        instance_fields = self.model_dump()
+            headers.update(self.dendrite.to_headers("dendrite"))
 
-        # Iterating over the fields of the instance
-        for field, value in instance_fields.items():
-            # If the object is not optional, serializing it, encoding it, and adding it to the headers
-            required = self.get_required_fields()
+        # Iterating over the required fields, the non-optional objects are sent as dummy values in the headers
+        for field in self._required_header_fields:
+            value = getattr(self, field)
 
             # Skipping the field if it's already in the headers or its value is None
             if field in headers or value is None:
                 continue
 
-            elif required and field in required:
-                try:
-                    # create an empty (dummy) instance of type(value) to pass pydantic validation on the axon side
-                    serialized_value = json.dumps(value.__class__.__call__())
-                    encoded_value = base64.b64encode(serialized_value.encode()).decode(
-                        "utf-8"
-                    )
-                    headers[f"bt_header_input_obj_{field}"] = encoded_value
-                except TypeError as e:
-                    raise ValueError(
-                        f"Error serializing {field} with value {value}. Objects must be json serializable."
-                    ) from e
+            # Models are dumped to dictionaries in the body
+            value_type: type = type(value)
+            if isinstance(value, BaseModel):
+                value_type = dict
+            try:
+                headers[f"bt_header_input_obj_{field}"] = _dummy_header_value(
+                    value_type
+                )
+            except TypeError as e:
+                raise ValueError(
+                    f"Error serializing {field} with value {value}. Objects must be json serializable."
+                ) from e
 
         # Adding the size of the headers and the total size to the headers
         headers["header_size"] = str(sys.getsizeof(headers))
-        headers["total_size"] = str(self.get_total_size())
+        headers["total_size"] = str(self.get_total_size(body_size))
         headers["computed_body_hash"] = self.body_hash
 
         return headers
@@ -684,6 +955,10 @@ class Synapse(BaseModel):
         2. Concatenates the string representation of these fields.
         3. Applies SHA3-256 hashing to the concatenated string to produce a unique fingerprint of the data.
 
+        The hash is cached on the instance, and invalidated when one of the ``required_hash_fields`` is assigned.
+        Mutating a field value in place, such as appending to a list, is not detected: assign the field again to
+        refresh the hash. The dendrite always hashes the synapse anew before signing a request.
+
         Example::
 
             synapse = Synapse(name="ExampleRoute", timeout=10)
@@ -693,10 +968,10 @@ class Synapse(BaseModel):
         Returns:
             str: The SHA3-256 hash as a hexadecimal string, providing a fingerprint of the Synapse instance's data for integrity checks.
         """
-        hashes = []
+        if self._body_hash is not None:
+            return self._body_hash
 
-        hash_fields_field = self.model_fields.get("required_hash_fields")
-        instance_fields = None
+        hash_fields_field = self.__class__.model_fields.get("required_hash_fields")
         if hash_fields_field:
             warnings.warn(
                 "The 'required_hash_fields' field handling deprecated and will be removed. "
@@ -706,25 +981,39 @@ class Synapse(BaseModel):
             required_hash_fields = hash_fields_field.default
 
             if required_hash_fields:
-                instance_fields = self.model_dump()
                 # Preserve backward compatibility in which fields will added in .model_dump() order
                 # instead of the order one from `self.required_hash_fields`
                 required_hash_fields = [
-                    field for field in instance_fields if field in required_hash_fields
+                    field
+                    for field in self.__class__.model_fields
+                    if field in required_hash_fields
                 ]
 
                 # Hack to cache the required hash fields names
-                if len(required_hash_fields) == len(required_hash_fields):
-                    self.__class__.required_hash_fields = tuple(required_hash_fields)
+                self.__class__.required_hash_fields = tuple(required_hash_fields)
         else:
             required_hash_fields = self.__class__.required_hash_fields
 
+        hashes = []
         if required_hash_fields:
-            instance_fields = instance_fields or self.model_dump()
+            field_hashes = self._field_hashes
+            dumped = None
             for field in required_hash_fields:
-                hashes.append(get_hash(str(instance_fields[field])))
-
-        return get_hash("".join(hashes))
+                field_hash = field_hashes.get(field)
+                if field_hash is None:
+                    value = getattr(self, field)
+                    if field not in self._plain_hash_fields or not isinstance(
+                        value, _PLAIN_HASH_TYPES
+                    ):
+                        # Dump the models and containers as the JSON body would.
+                        if dumped is None:
+                            dumped = self.model_dump(include=set(required_hash_fields))
+                        value = dumped[field]
+                    field_hash = field_hashes[field] = get_hash(str(value))
+                hashes.append(field_hash)
+
+        self._body_hash = get_hash("".join(hashes))
+        return self._body_hash
 
     @classmethod
     def parse_headers_to_inputs(cls, headers: dict) -> dict:
@@ -740,6 +1029,9 @@ class Synapse(BaseModel):
         2. Decodes and deserializes ``input_obj`` headers into their original objects.
         3. Assigns simple fields directly from the headers to the input dictionary.
 
+        The headers are looked up in a table compiled once per class, the headers of unknown terminal information or
+        synapse fields are ignored.
+
         Example::
 
             received_headers = {
@@ -766,47 +1058,30 @@ class Synapse(BaseModel):
             "dendrite": {},
         }
 
-        # Iterate over each item in the headers
+        decoder = cls._header_decoder
         for key, value in headers.items():
-            # Handle 'axon' headers
-            if "bt_header_axon_" in key:
-                try:
-                    new_key = key.split("bt_header_axon_")[1]
-                    axon_dict = cast(dict, inputs_dict["axon"])
-                    axon_dict[new_key] = value
-                except Exception as e:
-                    logging.error(f"Error while parsing 'axon' header {key}: {str(e)}")
-                    continue
-            # Handle 'dendrite' headers
-            elif "bt_header_dendrite_" in key:
-                try:
-                    new_key = key.split("bt_header_dendrite_")[1]
-                    dendrite_dict = cast(dict, inputs_dict["dendrite"])
-                    dendrite_dict[new_key] = value
-                except Exception as e:
-                    logging.error(f"Error while parsing 'dendrite' header {key}: {e}")
-                    continue
-            # Handle 'input_obj' headers
-            elif "bt_header_input_obj" in key:
-                try:
-                    new_key = key.split("bt_header_input_obj_")[1]
-                    # Skip if the key already exists in the dictionary
-                    if new_key in inputs_dict:
-                        continue
-                    # Decode and load the serialized object
-                    inputs_dict[new_key] = json.loads(
-                        base64.b64decode(value.encode()).decode("utf-8")
-                    )
-                except json.JSONDecodeError as e:
-                    logging.error(
-                        f"Error while json decoding 'input_obj' header {key}: {e}"
-                    )
-                    continue
-                except Exception as e:
-                    logging.error(f"Error while parsing 'input_obj' header {key}: {e}")
-                    continue
-            else:
-                pass  # TODO: log unexpected keys
+            target = decoder.get(key)
+            if target is None:
+                continue
+            terminal, new_key = target
+            # Handle 'axon' and 'dendrite' headers
+            if terminal is not None:
+                cast(dict, inputs_dict[terminal])[new_key] = value
+                continue
+            # Handle 'input_obj' headers, skip if the key already exists in the dictionary
+            if new_key in inputs_dict:
+                continue
+            try:
+                # Decode and load the serialized object
+                inputs_dict[new_key] = json.loads(
+                    base64.b64decode(value.encode()).decode("utf-8")
+                )
+            except json.JSONDecodeError as e:
+                logging.error(
+                    f"Error while json decoding 'input_obj' header {key}: {e}"
+                )
+            except Exception as e:
+                logging.error(f"Error while parsing 'input_obj' header {key}: {e}")
 
         # Assign the remaining known headers directly
         inputs_dict["timeout"] = headers.get("timeout", None)
@@ -16,13 +16,20 @@
 # DEALINGS IN THE SOFTWARE.
 
 import base64
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-import msgpack
-import msgpack_numpy
 import numpy as np
-from pydantic import ConfigDict, BaseModel, Field, field_validator
-
+from pydantic import (
+    AfterValidator,
+    ConfigDict,
+    BaseModel,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_serializer,
+)
+
+from bittensor.core import tensor_codecs
 from bittensor.utils.registration import torch, use_torch
 
 
@@ -133,6 +140,48 @@ def cast_shape(raw: Union[None, list[int], str]) -> Optional[Union[str, list]]:
         )
 
 
+def cast_codec(raw: Optional[str]) -> Optional[str]:
+    """
+    Checks the codec of a tensor, see :mod:`bittensor.core.tensor_codecs`.
+
+    Args:
+        raw (Optional[str]): The codec.
+
+    Returns:
+        Optional[str]: The codec, ``None`` for the plain encoding.
+
+    Raises:
+        ValueError: If the codec is unknown.
+    """
+    tensor_codecs.parse_codec(raw)
+    return raw or None
+
+
+def with_codec(codec: Optional[str]) -> AfterValidator:
+    """
+    Makes a synapse field encode its tensor with the given codec, whatever the codec it was serialized with.
+
+    Example::
+
+        class Embeddings(bittensor.Synapse):
+            embeddings: Annotated[Optional[Tensor], with_codec("fp16+zstd")] = None
+
+    Args:
+        codec (Optional[str]): The codec, see :mod:`bittensor.core.tensor_codecs`.
+
+    Returns:
+        pydantic.AfterValidator: The validator to annotate the field with.
+    """
+    codec = cast_codec(codec)
+
+    def encode(value: Optional["Tensor"]) -> Optional["Tensor"]:
+        if isinstance(value, Tensor) and value.codec != codec:
+            return Tensor.serialize(value._decode_as_dtype(), codec=codec)
+        return value
+
+    return AfterValidator(encode)
+
+
 class tensor:
     def __new__(cls, tensor: Union[list, "np.ndarray", "torch.Tensor"]):
         if isinstance(tensor, list) or isinstance(tensor, np.ndarray):
@@ -148,6 +197,7 @@ class Tensor(BaseModel):
         buffer (Optional[str]): Tensor buffer data.
         dtype (str): Tensor data type.
         shape (list[int]): Tensor shape.
+        codec (Optional[str]): Codec of the buffer data, see :mod:`bittensor.core.tensor_codecs`.
     """
 
     model_config = ConfigDict(validate_assignment=True)
@@ -163,40 +213,77 @@ class Tensor(BaseModel):
             self.deserialize().detach().numpy() if use_torch() else self.deserialize()
         )
 
+    def __eq__(self, other: Any) -> bool:
+        # Compares the serialized fields only, not the cached array.
+        if not isinstance(other, Tensor):
+            return NotImplemented
+        return (self.buffer, self.dtype, self.shape, self.codec) == (
+            other.buffer,
+            other.dtype,
+            other.shape,
+            other.codec,
+        )
+
+    @model_serializer(mode="wrap")
+    def _serialize_fields(self, handler):
+        # Without codec, the dump is the one of the versions predating codecs, hence the same body hash.
+        data = handler(self)
+        if isinstance(data, dict) and data.get("codec") is None:
+            data.pop("codec", None)
+        return data
+
+    def _decode(self) -> "np.ndarray":
+        """
+        Decodes the buffer into an array, once. The array is read-only and reshaped to the tensor shape. It is a view
+        of the decoded bytes unless the codec is lossy, and keeps the encoded data type.
+        """
+        if self._array is None:
+            shape = tuple(self.shape)
+            buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
+            itemsize = np.dtype(self.dtype.removeprefix("torch.")).itemsize
+            array = tensor_codecs.decode(buffer_bytes, self.codec, shape, itemsize)
+            # Reshape does not work for (0) or [0]
+            if not (len(shape) == 1 and shape[0] == 0):
+                array = array.reshape(shape)
+            array.flags.writeable = False
+            self._array = array
+        return self._array
+
     def deserialize(self) -> Union["np.ndarray", "torch.Tensor"]:
         """
         Deserializes the Tensor object.
 
+        The buffer is decoded on the first call only. Numpy arrays are read-only views of the same data, shared
+        between the calls: copy them before modifying them in place. Torch tensors are copies of the data.
+
         Returns:
             np.array or torch.Tensor: The deserialized tensor object.
 
         Raises:
             Exception: If the deserialization process encounters an error.
         """
-        shape = tuple(self.shape)
-        buffer_bytes = base64.b64decode(self.buffer.encode("utf-8"))
-        numpy_object = msgpack.unpackb(
-            buffer_bytes, object_hook=msgpack_numpy.decode
-        ).copy()
+        array = self._decode()
         if use_torch():
-            torch_object = torch.as_tensor(numpy_object)
-            # Reshape does not work for (0) or [0]
-            if not (len(shape) == 1 and shape[0] == 0):
-                torch_object = torch_object.reshape(shape)
-            return torch_object.type(dtypes[self.dtype])
-        else:
-            # Reshape does not work for (0) or [0]
-            if not (len(shape) == 1 and shape[0] == 0):
-                numpy_object = numpy_object.reshape(shape)
-            return numpy_object.astype(dtypes[self.dtype])
+            # Torch tensors cannot be read-only, each call gets its own copy of the cached array.
+            return torch.from_numpy(array.copy()).type(dtypes[self.dtype])
+        return self._decode_as_dtype()
+
+    def _decode_as_dtype(self) -> "np.ndarray":
+        # Only copies the data if the tensor data type differs from the encoded one.
+        return self._decode().astype(dtypes[self.dtype], copy=False)
 
     @staticmethod
-    def serialize(tensor_: Union["np.ndarray", "torch.Tensor"]) -> "Tensor":
+    def serialize(
+        tensor_: Union["np.ndarray", "torch.Tensor"], codec: Optional[str] = None
+    ) -> "Tensor":
         """
         Serializes the given tensor.
 
         Args:
             tensor_ (np.array or torch.Tensor): The tensor to serialize.
+            codec (Optional[str]): Codec of the buffer data, such as ``"fp16"`` or ``"int8+zstd"``, see
+                :mod:`bittensor.core.tensor_codecs`. The tensor keeps its data type once deserialized. Defaults to
+                ``None``, the plain encoding which every version decodes.
 
         Returns:
             :func:`Tensor`: The serialized tensor.
@@ -208,11 +295,12 @@ class Tensor(BaseModel):
         shape = list(tensor_.shape)
         if len(shape) == 0:
             shape = [0]
-        tensor__ = tensor_.cpu().detach().numpy().copy() if use_torch() else tensor_
+        # The buffer is packed right away, the array does not need to outlive the tensor.
+        tensor__ = tensor_.cpu().detach().numpy() if use_torch() else tensor_
         data_buffer = base64.b64encode(
-            msgpack.packb(tensor__, default=msgpack_numpy.encode)
+            tensor_codecs.encode(np.asarray(tensor__), codec)
         ).decode("utf-8")
-        return Tensor(buffer=data_buffer, shape=shape, dtype=dtype)
+        return Tensor(buffer=data_buffer, shape=shape, dtype=dtype, codec=codec)
 
     # Represents the tensor buffer data.
     buffer: Optional[str] = Field(
@@ -242,8 +330,24 @@ class Tensor(BaseModel):
         repr=True,
     )
 
+    # Represents the codec of the tensor buffer data.
+    codec: Optional[str] = Field(
+        default=None,
+        title="codec",
+        description="Codec of the tensor buffer data, such as fp16 or int8+zstd. None for the plain msgpack encoding.",
+        examples=["fp16+zstd"],
+        frozen=True,
+        repr=True,
+    )
+
+    # The decoded buffer, see `_decode`.
+    _array: Optional["np.ndarray"] = PrivateAttr(default=None)
+
     # Extract the represented shape of the tensor.
     _extract_shape = field_validator("shape", mode="before")(cast_shape)
 
     # Extract the represented data type of the tensor.
     _extract_dtype = field_validator("dtype", mode="before")(cast_dtype)
+
+    # Check the codec of the tensor buffer data.
+    _extract_codec = field_validator("codec", mode="before")(cast_codec)
@@ -0,0 +1,206 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""
+Codecs of the :class:`bittensor.core.tensor.Tensor` buffers.
+
+A codec is a lossy encoding, a lossless compression, or a lossy encoding followed by a lossless compression joined by
+``+``, such as ``"int8+zstd"``:
+
+- ``fp16`` casts floating point data to float16, halving the size of float32 tensors.
+- ``bf16`` rounds floating point data to bfloat16, which keeps the range of float32 with less precision.
+- ``int8`` quantizes floating point data to int8 with a per-tensor scale, dividing the size of float32 tensors by 4.
+- ``gzip``, ``zstd`` and ``lz4`` compress the encoded buffer, see :mod:`bittensor.utils.compression`. ``zstd`` and
+  ``lz4`` need the ``zstandard`` and ``lz4`` packages respectively.
+
+Without codec, the buffer holds the array as packed by ``msgpack_numpy``, which every version of Bittensor decodes.
+"""
+
+import math
+from typing import Optional, Sequence
+
+import msgpack
+import msgpack_numpy
+import numpy as np
+
+from bittensor.utils import compression
+
+LOSSY_CODECS = ("fp16", "bf16", "int8")
+LOSSLESS_CODECS = ("gzip", "zstd", "lz4")
+
+# Bytes per element of the data encoded by the lossy codecs.
+_LOSSY_ITEMSIZES = {"fp16": 2, "bf16": 2, "int8": 1}
+# Upper bound of the msgpack framing around the data: the header of the array, and the scale of int8.
+_FRAMING_SIZE = 256
+
+
+def parse_codec(codec: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    Splits a codec into its lossy encoding and lossless compression.
+
+    Args:
+        codec (Optional[str]): The codec, such as ``"fp16"``, ``"zstd"`` or ``"int8+zstd"``.
+
+    Returns:
+        tuple[Optional[str], Optional[str]]: The lossy encoding and the lossless compression, each ``None`` if absent.
+
+    Raises:
+        ValueError: If the codec is unknown.
+    """
+    if not codec:
+        return None, None
+    lossy = lossless = None
+    for part in codec.split("+"):
+        if part in LOSSY_CODECS and lossy is None and lossless is None:
+            lossy = part
+        elif part in LOSSLESS_CODECS and lossless is None:
+            lossless = part
+        else:
+            raise ValueError(
+                f"Unknown tensor codec {codec}, expected one of {LOSSY_CODECS}, one of {LOSSLESS_CODECS}, or "
+                f"both joined by '+'"
+            )
+    return lossy, lossless
+
+
+def _to_bf16_bits(array: "np.ndarray") -> "np.ndarray":
+    """Rounds float32 data to the nearest bfloat16, returned as the upper 16 bits of the float32 values."""
+    bits = array.astype(np.float32).view(np.uint32)
+    # Rounds half to even, NaNs are kept as is since rounding could carry them over to infinity.
+    rounded = (bits + 0x7FFF + ((bits >> 16) & 1)) >> 16
+    rounded = np.where(np.isnan(array), bits >> 16, rounded)
+    return rounded.astype(np.uint16)
+
+
+def _from_bf16_bits(bits: "np.ndarray") -> "np.ndarray":
+    return (bits.astype(np.uint32) << 16).view(np.float32)
+
+
+def _quantize_int8(array: "np.ndarray") -> tuple[float, "np.ndarray"]:
+    """Quantizes data symmetrically to int8, with the scale mapping the largest magnitude to 127."""
+    if array.size and not np.isfinite(array).all():
+        raise ValueError("The int8 codec does not support non finite values")
+    max_abs = float(np.abs(array).max()) if array.size else 0.0
+    scale = max_abs / 127 if max_abs > 0 else 1.0
+    quantized = np.clip(np.rint(array / scale), -127, 127).astype(np.int8)
+    return scale, quantized
+
+
+def encode(array: "np.ndarray", codec: Optional[str] = None) -> bytes:
+    """
+    Encodes an array with a codec.
+
+    Args:
+        array (np.ndarray): The array.
+        codec (Optional[str]): The codec, ``None`` for the plain ``msgpack_numpy`` encoding.
+
+    Returns:
+        bytes: The encoded array.
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable, or a lossy codec is applied to non floating point data.
+    """
+    lossy, lossless = parse_codec(codec)
+    if lossy is not None and not np.issubdtype(array.dtype, np.floating):
+        raise ValueError(
+            f"The {lossy} codec only applies to floating point data, not {array.dtype}"
+        )
+
+    if lossy == "fp16":
+        payload = array.astype(np.float16, copy=False)
+    elif lossy == "bf16":
+        payload = _to_bf16_bits(array)
+    elif lossy == "int8":
+        payload = list(_quantize_int8(array))
+    else:
+        payload = array
+    data = msgpack.packb(payload, default=msgpack_numpy.encode)
+
+    if lossless is not None:
+        data = compression.compress(data, lossless)
+    return data
+
+
+def max_encoded_size(
+    shape: Sequence[int], itemsize: int = 8, codec: Optional[str] = None
+) -> int:
+    """
+    Returns the maximum size of an array encoded with a codec, before its lossless compression.
+
+    Args:
+        shape (Sequence[int]): The shape of the array.
+        itemsize (int): The bytes per element of the array. Defaults to ``8``, the widest data type.
+        codec (Optional[str]): The codec.
+
+    Returns:
+        int: The maximum size in bytes.
+    """
+    lossy, _ = parse_codec(codec)
+    if lossy is not None:
+        itemsize = _LOSSY_ITEMSIZES[lossy]
+    # Scalars have the shape [0], and a single element.
+    count = max(math.prod(shape), 1)
+    return count * itemsize + _FRAMING_SIZE + 9 * len(shape)
+
+
+def decode(
+    data: bytes,
+    codec: Optional[str] = None,
+    shape: Optional[Sequence[int]] = None,
+    itemsize: int = 8,
+) -> "np.ndarray":
+    """
+    Decodes an array encoded by :func:`encode`. The array of the lossless codecs and of ``fp16`` is a read-only view
+    of the decoded bytes, the other lossy codecs produce a new array.
+
+    Args:
+        data (bytes): The encoded array.
+        codec (Optional[str]): The codec the array was encoded with.
+        shape (Optional[Sequence[int]]): The shape of the array. The data is then rejected if it decompresses to more
+            than :func:`max_encoded_size`, or does not hold as many elements as the shape.
+        itemsize (int): The bytes per element of the array. Defaults to ``8``, the widest data type.
+
+    Returns:
+        np.ndarray: The array, in the data type of the encoding (float16 for ``fp16``, float32 for ``bf16`` and
+        ``int8``), which may differ from the original one.
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable, or the data is invalid or does not match the shape.
+    """
+    lossy, lossless = parse_codec(codec)
+    if lossless is not None:
+        if shape is None:
+            data = compression.decompress(data, lossless)
+        else:
+            max_size = max_encoded_size(shape, itemsize, codec)
+            data = compression.decompress(data, lossless, max_size)
+    payload = msgpack.unpackb(data, object_hook=msgpack_numpy.decode)
+
+    if lossy == "bf16":
+        array = _from_bf16_bits(np.asarray(payload))
+    elif lossy == "int8":
+        scale, quantized = payload
+        array = np.asarray(quantized).astype(np.float32) * np.float32(scale)
+    else:
+        array = np.asarray(payload)
+
+    if shape is not None and array.size != math.prod(shape):
+        # Scalars have the shape [0], and a single element.
+        if not (array.ndim == 0 and list(shape) == [0]):
+            raise ValueError(
+                f"The tensor data holds {array.size} elements, expected the shape {list(shape)}"
+            )
+    return array
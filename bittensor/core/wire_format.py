@@ -0,0 +1,148 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""
+Binary msgpack encoding of the synapse bodies exchanged between Dendrite and Axon.
+
+The format is negotiated with the standard HTTP headers: a dendrite asks for msgpack responses with
+``Accept: application/msgpack``, and marks msgpack request bodies with ``Content-Type: application/msgpack``. The body
+is the msgpack encoding of ``synapse.model_dump(mode="json")``, except that :class:`bittensor.core.tensor.Tensor` values travel as
+a msgpack extension holding the raw tensor buffer instead of its base64 string.
+
+Decoding returns the same dictionary as the JSON body would, so that the synapse, and thus its ``body_hash``, does not
+depend on the wire format.
+"""
+
+import base64
+from typing import Any, Optional
+
+import msgpack
+from pydantic import BaseModel
+
+from bittensor.core.tensor import Tensor
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# msgpack extension type code of the tensors.
+TENSOR_EXT_TYPE = 1
+
+
+def accepts_msgpack(accept: Optional[str]) -> bool:
+    """
+    Checks whether an ``Accept`` header value lists the msgpack media type.
+
+    Args:
+        accept (Optional[str]): The ``Accept`` header value.
+
+    Returns:
+        bool: ``True`` if msgpack is accepted.
+    """
+    if not accept:
+        return False
+    return any(
+        media_range.split(";")[0].strip().lower() == MSGPACK_MEDIA_TYPE
+        for media_range in accept.split(",")
+    )
+
+
+def _pack_tensor(tensor: "Tensor") -> msgpack.ExtType:
+    buffer = base64.b64decode(tensor.buffer) if tensor.buffer is not None else None
+    fields = [buffer, tensor.dtype, tensor.shape]
+    # The codec is only appended when set, so that plain tensors keep the layout of the previous versions.
+    if tensor.codec is not None:
+        fields.append(tensor.codec)
+    return msgpack.ExtType(TENSOR_EXT_TYPE, msgpack.packb(fields))
+
+
+def _replace_tensors(value: Any, dumped: Any) -> Any:
+    """Walks a value along with its dump, replacing the dump of the tensors with msgpack extensions."""
+    if isinstance(value, Tensor):
+        return _pack_tensor(value)
+    if isinstance(value, BaseModel) and isinstance(dumped, dict):
+        return {
+            key: _replace_tensors(getattr(value, key, None), item)
+            for key, item in dumped.items()
+        }
+    if (
+        isinstance(value, dict)
+        and isinstance(dumped, dict)
+        and len(value) == len(dumped)
+    ):
+        # The keys of the dump may have been converted to strings, the order of the items is kept.
+        return {
+            key: _replace_tensors(v, item)
+            for v, (key, item) in zip(value.values(), dumped.items())
+        }
+    if (
+        isinstance(value, (list, tuple))
+        and isinstance(dumped, (list, tuple))
+        and len(value) == len(dumped)
+    ):
+        return [_replace_tensors(v, item) for v, item in zip(value, dumped)]
+    return dumped
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == TENSOR_EXT_TYPE:
+        buffer, dtype, shape, *codec = msgpack.unpackb(data)
+        tensor = {
+            "buffer": base64.b64encode(buffer).decode("utf-8")
+            if buffer is not None
+            else None,
+            "dtype": dtype,
+            "shape": shape,
+        }
+        if codec:
+            tensor["codec"] = codec[0]
+        return tensor
+    return msgpack.ExtType(code, data)
+
+
+def packb(model: "BaseModel") -> bytes:
+    """
+    Encodes a synapse, or any pydantic model, to msgpack. The model is dumped in JSON mode, so that the values
+    msgpack has no type for, such as ``datetime``, ``UUID`` or ``set``, are encoded as in the JSON body.
+
+    Args:
+        model (pydantic.BaseModel): The model to encode.
+
+    Returns:
+        bytes: The msgpack body.
+    """
+    return msgpack.packb(_replace_tensors(model, model.model_dump(mode="json")))
+
+
+def unpackb(data: bytes) -> dict:
+    """
+    Decodes a msgpack body into the dictionary the JSON body would decode to.
+
+    Args:
+        data (bytes): The msgpack body.
+
+    Returns:
+        dict: The decoded body, ready to be validated by the synapse class.
+
+    Raises:
+        ValueError: If the body is not valid msgpack, or does not encode a dictionary.
+    """
+    try:
+        body = msgpack.unpackb(data, ext_hook=_ext_hook, strict_map_key=False)
+    except Exception as e:
+        raise ValueError(f"Invalid msgpack body: {e}") from e
+    if not isinstance(body, dict):
+        raise ValueError("The msgpack body does not encode a dictionary")
+    return body
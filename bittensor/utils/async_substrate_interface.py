@@ -641,6 +641,7 @@ class Websocket:
         self.max_connections = max_connections
         self.shutdown_timer = shutdown_timer
         self._received = {}
+        self._received_waiters: dict[Union[int, str], asyncio.Future] = {}
         self._in_use = 0
         self._receiving_task = None
         self._attempts = 0
@@ -707,11 +708,16 @@ class Websocket:
             async with self._lock:
                 self._open_subscriptions -= 1
             if "id" in response:
-                self._received[response["id"]] = response
+                item_id = response["id"]
             elif "params" in response:
-                self._received[response["params"]["subscription"]] = response
+                item_id = response["params"]["subscription"]
             else:
                 raise KeyError(response)
+            self._received[item_id] = response
+            # Wake up the caller waiting on this item, if any
+            waiter = self._received_waiters.pop(item_id, None)
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
         except ConnectionClosed:
             raise
         except KeyError as e:
@@ -723,10 +729,25 @@ class Websocket:
                 await self._recv()
         except asyncio.CancelledError:
             pass
-        except ConnectionClosed:
+        except ConnectionClosed as e:
+            # Fail pending retrievals instead of leaving them waiting forever
+            self._fail_waiters(e)
             # TODO try reconnect, but only if it's needed
             raise
 
+    def _fail_waiters(self, exc: BaseException):
+        """
+        Propagates an exception to every caller currently waiting in `retrieve`.
+
+        Args:
+            exc: the exception to set on the pending waiters
+        """
+        waiters = list(self._received_waiters.values())
+        self._received_waiters.clear()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(exc)
+
     async def send(self, payload: dict) -> int:
         """
         Sends a payload to the websocket connection.
@@ -744,21 +765,25 @@ class Websocket:
         except ConnectionClosed:
             raise
 
-    async def retrieve(self, item_id: int) -> Optional[dict]:
+    async def retrieve(self, item_id: Union[int, str]) -> Optional[dict]:
         """
-        Retrieves a single item from received responses dict queue
+        Retrieves a single item from received responses dict queue. Rather than polling, the caller waits on a
+        future which the receiving task resolves as soon as the response for `item_id` arrives.
 
         Args:
-            item_id: id of the item to retrieve
+            item_id: id of the item to retrieve (request id or subscription id)
 
         Returns:
              retrieved item
         """
         while True:
-            async with self._lock:
-                if item_id in self._received:
-                    return self._received.pop(item_id)
-            await asyncio.sleep(0.1)
+            if item_id in self._received:
+                return self._received.pop(item_id)
+            waiter = self._received_waiters.get(item_id)
+            if waiter is None or waiter.done():
+                waiter = asyncio.get_running_loop().create_future()
+                self._received_waiters[item_id] = waiter
+            await waiter
 
 
 class AsyncSubstrateInterface:
@@ -15,10 +15,23 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+from functools import lru_cache
 from typing import Optional
 
+from bittensor_wallet import Keypair
+
 ALLOWED_DELTA = 4_000_000_000  # Delta of 4 seconds for nonce validation
 NANOSECONDS_IN_SECOND = 1_000_000_000
+# Largest synapse timeout accounted in the nonce window, in seconds. The timeout header is not signed, so it must not
+# widen the window beyond a bound chosen by the axon.
+MAX_NONCE_TIMEOUT = 60
+# How long a processed nonce is remembered. Past this time, any nonce is outside the nonce window and a replayed
+# request carrying it is rejected by the freshness check alone, whatever its timeout header.
+NONCE_TTL_NS = ALLOWED_DELTA + MAX_NONCE_TIMEOUT * NANOSECONDS_IN_SECOND
+
+
+def _nonce_timeout_ns(synapse_timeout: Optional[float]) -> float:
+    return min(synapse_timeout or 0, MAX_NONCE_TIMEOUT) * NANOSECONDS_IN_SECOND
 
 
 def allowed_nonce_window_ns(current_time_ns: int, synapse_timeout: Optional[float]):
@@ -27,12 +40,12 @@ def allowed_nonce_window_ns(current_time_ns: int, synapse_timeout: Optional[floa
 
     Args:
         current_time_ns (int): The current time in nanoseconds.
-        synapse_timeout (Optional[float]): The optional timeout for the synapse in seconds. If None, it defaults to 0.
+        synapse_timeout (Optional[float]): The optional timeout for the synapse in seconds. If None, it defaults to 0. It is capped at ``MAX_NONCE_TIMEOUT``.
 
     Returns:
         int: The allowed nonce window in nanoseconds.
     """
-    synapse_timeout_ns = (synapse_timeout or 0) * NANOSECONDS_IN_SECOND
+    synapse_timeout_ns = _nonce_timeout_ns(synapse_timeout)
     allowed_window_ns = current_time_ns - ALLOWED_DELTA - synapse_timeout_ns
     return allowed_window_ns
 
@@ -52,7 +65,38 @@ def calculate_diff_seconds(
     Returns:
         tuple: A tuple containing the difference in seconds (float) and the allowed delta in seconds (float).
     """
-    synapse_timeout_ns = (synapse_timeout or 0) * NANOSECONDS_IN_SECOND
+    synapse_timeout_ns = _nonce_timeout_ns(synapse_timeout)
     diff_seconds = (current_time - synapse_nonce) / NANOSECONDS_IN_SECOND
     allowed_delta_seconds = (ALLOWED_DELTA + synapse_timeout_ns) / NANOSECONDS_IN_SECOND
     return diff_seconds, allowed_delta_seconds
+
+
+@lru_cache(maxsize=4096)
+def keypair_from_ss58(ss58_address: str) -> "Keypair":
+    """
+    Returns the public keypair for an ss58 address, decoding each address only once.
+
+    Args:
+        ss58_address (str): The ss58 encoded hotkey address.
+
+    Returns:
+        Keypair: A public-key only keypair which can be used to verify signatures.
+    """
+    return Keypair(ss58_address=ss58_address)
+
+
+def verify_signature(ss58_address: str, message: str, signature: str) -> bool:
+    """
+    Verifies that ``signature`` is a valid signature of ``message`` by the owner of ``ss58_address``.
+
+    This is a module level function so that it can be submitted to a process pool.
+
+    Args:
+        ss58_address (str): The ss58 encoded hotkey address of the signer.
+        message (str): The signed message.
+        signature (str): The hex encoded signature.
+
+    Returns:
+        bool: ``True`` if the signature is valid.
+    """
+    return keypair_from_ss58(ss58_address).verify(message, signature)
@@ -0,0 +1,191 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+"""
+Compression of the synapse bodies exchanged between Dendrite and Axon.
+
+The encodings are negotiated with dedicated headers rather than the standard ``Content-Encoding`` ones, so that HTTP
+clients, servers and proxies in between leave the bodies untouched:
+
+- ``bt_accept_encoding`` lists the encodings a peer can decode, the dendrite sends it with its requests and the axon
+  with its responses.
+- ``bt_content_encoding`` gives the encoding of a compressed body.
+"""
+
+import functools
+import gzip
+import zlib
+from typing import Iterable, Optional
+
+ACCEPT_ENCODING_HEADER = "bt_accept_encoding"
+CONTENT_ENCODING_HEADER = "bt_content_encoding"
+
+# Bodies smaller than this are not worth compressing.
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+# Protects against bodies decompressing to an unreasonable size.
+MAX_DECOMPRESSED_SIZE = 512 * 1024 * 1024
+
+# Limit of the bodies received from untrusted peers, well below MAX_DECOMPRESSED_SIZE.
+DEFAULT_MAX_DECOMPRESSED_SIZE = 32 * 1024 * 1024
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+class DecompressedSizeError(ValueError):
+    """Raised when data decompresses to more than the allowed size."""
+
+
+@functools.cache
+def _get_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        zstandard = None
+    return zstandard
+
+
+@functools.cache
+def _get_lz4():
+    try:
+        import lz4.frame
+    except ImportError:
+        return None
+    return lz4.frame
+
+
+def available_encodings() -> list[str]:
+    """
+    Returns the supported encodings, in order of preference. ``zstd`` requires the ``zstandard`` package, and ``lz4``
+    the ``lz4`` package.
+    """
+    encodings = []
+    if _get_zstandard() is not None:
+        encodings.append("zstd")
+    if _get_lz4() is not None:
+        encodings.append("lz4")
+    encodings.append("gzip")
+    return encodings
+
+
+def parse_encodings(header: Optional[str]) -> list[str]:
+    """
+    Parses an encodings header value.
+
+    Args:
+        header (Optional[str]): A comma separated list of encodings, such as ``"zstd, gzip"``.
+
+    Returns:
+        list[str]: The encodings, in the order of the header.
+    """
+    if not header:
+        return []
+    return [
+        encoding.strip().lower() for encoding in header.split(",") if encoding.strip()
+    ]
+
+
+def negotiate_encoding(accepted: Iterable[str]) -> Optional[str]:
+    """
+    Picks the preferred encoding supported by both peers.
+
+    Args:
+        accepted (Iterable[str]): The encodings the other peer can decode.
+
+    Returns:
+        Optional[str]: The encoding to use, or ``None`` if there is no common encoding.
+    """
+    accepted = set(accepted)
+    for encoding in available_encodings():
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compresses data with the given encoding.
+
+    Args:
+        data (bytes): The data to compress.
+        encoding (str): ``"gzip"``, ``"zstd"`` or ``"lz4"``.
+
+    Returns:
+        bytes: The compressed data.
+
+    Raises:
+        ValueError: If the encoding is not supported.
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    zstandard = _get_zstandard()
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    lz4_frame = _get_lz4()
+    if encoding == "lz4" and lz4_frame is not None:
+        return lz4_frame.compress(data)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+def decompress(
+    data: bytes, encoding: str, max_size: int = MAX_DECOMPRESSED_SIZE
+) -> bytes:
+    """
+    Decompresses data with the given encoding.
+
+    Args:
+        data (bytes): The compressed data.
+        encoding (str): ``"gzip"``, ``"zstd"`` or ``"lz4"``.
+        max_size (int): Maximum size of the decompressed data.
+
+    Returns:
+        bytes: The decompressed data.
+
+    Raises:
+        ValueError: If the encoding is not supported or the data is truncated.
+        DecompressedSizeError: If the data decompresses to more than ``max_size`` bytes.
+    """
+    if encoding == "gzip":
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+        result = decompressor.decompress(data, max_size)
+        if decompressor.unconsumed_tail:
+            raise DecompressedSizeError(f"Decompressed data exceeds {max_size} bytes")
+        if not decompressor.eof:
+            raise ValueError("Truncated gzip data")
+        return result
+    zstandard = _get_zstandard()
+    if encoding == "zstd" and zstandard is not None:
+        chunks, size = [], 0
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            while chunk := reader.read(1024 * 1024):
+                size += len(chunk)
+                if size > max_size:
+                    raise DecompressedSizeError(
+                        f"Decompressed data exceeds {max_size} bytes"
+                    )
+                chunks.append(chunk)
+        return b"".join(chunks)
+    lz4_frame = _get_lz4()
+    if encoding == "lz4" and lz4_frame is not None:
+        decompressor = lz4_frame.LZ4FrameDecompressor()
+        result = decompressor.decompress(data, max_length=max_size)
+        if not decompressor.eof:
+            if decompressor.needs_input:
+                raise ValueError("Truncated lz4 data")
+            raise DecompressedSizeError(f"Decompressed data exceeds {max_size} bytes")
+        return result
+    raise ValueError(f"Unsupported encoding: {encoding}")
@@ -3,6 +3,8 @@
 import json
 import os
 import socket
+import threading
+import time
 import urllib
 from functools import wraps
 from typing import Optional
@@ -141,6 +143,86 @@ def get_external_ip() -> str:
     raise ExternalIPNotFound
 
 
+# Environment variable overriding the external ip, which is then never resolved.
+EXTERNAL_IP_ENV = "BT_EXTERNAL_IP"
+# Seconds a resolved external ip is reused, in memory and across processes through the cache file.
+EXTERNAL_IP_CACHE_TTL = 3600.0
+EXTERNAL_IP_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"), ".bittensor", "external_ip.json"
+)
+
+_external_ip_cache: Optional[tuple[str, float]] = None
+_external_ip_lock = threading.Lock()
+
+
+def _read_external_ip_cache_file(cache_file: str) -> Optional[tuple[str, float]]:
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+        ip, timestamp = str(cached["ip"]), float(cached["timestamp"])
+        ip_to_int(ip)
+        return ip, timestamp
+    except Exception:
+        return None
+
+
+def _write_external_ip_cache_file(cache_file: str, ip: str, timestamp: float):
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        # Written to a temporary file first, so that concurrent readers never see a partial file.
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"ip": ip, "timestamp": timestamp}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logging.debug(f"Could not write the external ip cache file {cache_file}: {e}")
+
+
+def get_cached_external_ip(
+    ttl: float = EXTERNAL_IP_CACHE_TTL, use_cache_file: bool = True
+) -> str:
+    """Returns the external ip, resolving it with :func:`get_external_ip` at most once per ``ttl`` seconds.
+
+    The ``BT_EXTERNAL_IP`` environment variable takes precedence over any resolution. Otherwise, the ip resolved by
+    this process is reused, then the one saved in :data:`EXTERNAL_IP_CACHE_FILE` by any process, as long as they are
+    younger than ``ttl`` seconds.
+
+    Args:
+        ttl (float): Seconds a resolved ip is reused.
+        use_cache_file (bool): Share the resolved ip with other processes through the cache file.
+
+    Returns:
+        external_ip (str): Your routers external facing ip as a string.
+
+    Raises:
+        ExternalIPNotFound (Exception):
+            Raised if the ip is not cached and all external ip attempts fail.
+    """
+    global _external_ip_cache
+
+    override = os.getenv(EXTERNAL_IP_ENV)
+    if override:
+        return override
+
+    with _external_ip_lock:
+        now = time.time()
+        if _external_ip_cache is not None and now - _external_ip_cache[1] < ttl:
+            return _external_ip_cache[0]
+
+        cache_file = EXTERNAL_IP_CACHE_FILE if use_cache_file else None
+        if cache_file is not None:
+            cached = _read_external_ip_cache_file(cache_file)
+            if cached is not None and now - cached[1] < ttl:
+                _external_ip_cache = cached
+                return cached[0]
+
+        external_ip = get_external_ip()
+        _external_ip_cache = (external_ip, now)
+        if cache_file is not None:
+            _write_external_ip_cache_file(cache_file, external_ip, now)
+        return external_ip
+
+
 def get_formatted_ws_endpoint_url(endpoint_url: Optional[str]) -> Optional[str]:
     """
     Returns a formatted websocket endpoint url.
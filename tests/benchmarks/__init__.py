@@ -0,0 +1,4 @@
+"""
+Timing benchmarks of the hot paths of the SDK. They are not part of the unit test suite, since wall-clock timings
+are unreliable on shared CI machines; run them with ``pytest tests/benchmarks -s`` to print the results.
+"""
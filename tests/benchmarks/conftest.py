@@ -0,0 +1,8 @@
+# Fixtures shared with the unit tests.
+from tests.unit_tests.utils.test_async_substrate_interface import (  # noqa: F401
+    fake_rpc_server,
+)
+from tests.unit_tests.test_synapse import (  # noqa: F401
+    header_plan_synapse,
+    sized_synapse,
+)
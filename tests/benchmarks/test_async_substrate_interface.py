@@ -0,0 +1,24 @@
+import time
+
+import pytest
+
+from bittensor.utils import async_substrate_interface
+
+
+@pytest.mark.asyncio
+async def test_websocket_retrieve_latency(fake_rpc_server):
+    """Sequential round trips, formerly bound to a 100 ms polling interval."""
+    ws = async_substrate_interface.Websocket(fake_rpc_server, shutdown_timer=0)
+    round_trips = 200
+
+    async with ws:
+        start = time.perf_counter()
+        for i in range(round_trips):
+            item_id = await ws.send(
+                {"jsonrpc": "2.0", "method": "system_health", "params": [i]}
+            )
+            await ws.retrieve(item_id)
+        elapsed = time.perf_counter() - start
+
+    await ws.shutdown()
+    print(f"\nwebsocket round trip: {elapsed / round_trips * 1000:.3f} ms")
@@ -0,0 +1,69 @@
+import time
+
+import httpx
+import pytest
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from bittensor.core.axon import Axon, AxonMiddleware
+from bittensor.core.synapse import Synapse
+from tests.unit_tests.test_axon import MockHotkey, MockWallet
+
+
+class BaseHTTPAxonMiddleware(BaseHTTPMiddleware):
+    """The Axon pipeline run as a Starlette ``BaseHTTPMiddleware``, as a baseline for the ASGI middleware."""
+
+    def __init__(self, app, axon):
+        super().__init__(app)
+        self.pipeline = AxonMiddleware(app, axon)
+
+    async def dispatch(self, request, call_next):
+        response = None
+
+        async def call_next_headers(request):
+            nonlocal response
+            response = await call_next(request)
+            return response.headers
+
+        error_response = await self.pipeline.dispatch(request, call_next_headers)
+        return error_response or response
+
+
+async def benchmark_middleware(middleware_cls, requests=50) -> tuple[float, float]:
+    axon = Axon(
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    axon.app.user_middleware.clear()
+    axon.app.add_middleware(middleware_cls, axon=axon)
+    axon.verify_fns["Synapse"] = None
+    synapse = Synapse()
+
+    latencies = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=axon.app), base_url="http://axon"
+    ) as client:
+        start = time.perf_counter()
+        for _ in range(requests):
+            request_start = time.perf_counter()
+            response = await client.post(
+                "/Synapse",
+                json=synapse.model_dump(),
+                headers={"computed_body_hash": synapse.body_hash},
+            )
+            latencies.append(time.perf_counter() - request_start)
+            assert response.status_code == 200
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return requests / elapsed, latencies[int(0.99 * requests) - 1]
+
+
+@pytest.mark.asyncio
+async def test_asgi_middleware_benchmark():
+    baseline_rps, baseline_p99 = await benchmark_middleware(BaseHTTPAxonMiddleware)
+    rps, p99 = await benchmark_middleware(AxonMiddleware)
+    print(
+        f"\nBaseHTTPMiddleware: {baseline_rps:.1f} req/s, p99 {baseline_p99 * 1000:.2f} ms | "
+        f"ASGI: {rps:.1f} req/s, p99 {p99 * 1000:.2f} ms"
+    )
@@ -0,0 +1,25 @@
+import time
+
+import pytest
+
+from bittensor.utils import compression
+from tests.unit_tests.utils.test_compression import _tensor_payload, _text_payload
+
+
+@pytest.mark.parametrize("payload", [_text_payload, _tensor_payload])
+def test_compression_benchmark(payload):
+    """Reports the bytes on the wire and the compression latency for typical payload sizes."""
+    for size in (1024, 64 * 1024, 1024 * 1024):
+        data = payload(size)
+        for encoding in compression.available_encodings():
+            start = time.perf_counter()
+            compressed = compression.compress(data, encoding)
+            compress_time = time.perf_counter() - start
+            start = time.perf_counter()
+            assert compression.decompress(compressed, encoding) == data
+            decompress_time = time.perf_counter() - start
+            print(
+                f"\n{payload.__name__} {len(data):>8} bytes, {encoding}: {len(compressed):>8} bytes on the wire "
+                f"({len(compressed) / len(data):.0%}), compress {compress_time * 1000:.2f} ms, "
+                f"decompress {decompress_time * 1000:.2f} ms"
+            )
@@ -0,0 +1,67 @@
+import time
+
+from bittensor.core.synapse import Synapse, TerminalInfo
+from tests.unit_tests.test_synapse import SizedSynapse, legacy_to_headers
+
+
+def test_to_headers_benchmark(header_plan_synapse):
+    """Compares `to_headers` with the schema based implementation it replaced."""
+    iterations = 20
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        legacy_to_headers(header_plan_synapse)
+    legacy_time = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        header_plan_synapse.to_headers()
+    plan_time = (time.perf_counter() - start) / iterations
+
+    print(
+        f"\nto_headers: schema based {legacy_time * 1e6:.1f} us, "
+        f"compiled plan {plan_time * 1e6:.1f} us ({legacy_time / plan_time:.1f}x)"
+    )
+
+
+def test_estimate_size_benchmark(sized_synapse, monkeypatch):
+    """Compares the size accounting modes on a synapse with large list and dict fields."""
+    timings = {}
+    for mode in ("deep", "serialized", "sampled"):
+        monkeypatch.setattr(SizedSynapse, "size_accounting", mode)
+        start = time.perf_counter()
+        for _ in range(10):
+            sized_synapse.get_total_size()
+        timings[mode] = (time.perf_counter() - start) / 10
+    print(
+        "\nsize accounting: "
+        + ", ".join(
+            f"{mode} {duration * 1e6:.0f} us" for mode, duration in timings.items()
+        )
+    )
+
+
+def test_terminal_info_parse_headers_benchmark():
+    """Compares reading the terminal information from the headers with building a synapse from them."""
+    synapse = Synapse(
+        axon=TerminalInfo(status_code=200, process_time=0.1, hotkey="axon"),
+        dendrite=TerminalInfo(ip="127.0.0.1", port=8091, nonce=1, hotkey="dendrite"),
+    )
+    headers = synapse.to_headers()
+    iterations = 200
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Synapse.from_headers(headers)
+    synapse_time = (time.perf_counter() - start) / iterations
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        TerminalInfo.parse_headers(headers, "axon")
+        TerminalInfo.parse_headers(headers, "dendrite")
+    terminal_time = (time.perf_counter() - start) / iterations
+
+    print(
+        f"\nfrom_headers: synapse {synapse_time * 1e6:.1f} us, "
+        f"terminal information {terminal_time * 1e6:.1f} us ({synapse_time / terminal_time:.1f}x)"
+    )
@@ -1,6 +1,8 @@
 import pytest
 from aioresponses import aioresponses
 
+from bittensor.utils import networking
+
 
 @pytest.fixture
 def force_legacy_torch_compatible_api(monkeypatch):
@@ -11,3 +13,12 @@ def force_legacy_torch_compatible_api(monkeypatch):
 def mock_aio_response():
     with aioresponses() as m:
         yield m
+
+
+@pytest.fixture(autouse=True)
+def isolate_external_ip_cache(monkeypatch, tmp_path):
+    """Keeps the external ip resolved by a test out of the other tests and of the user's cache file."""
+    monkeypatch.setattr(networking, "_external_ip_cache", None)
+    monkeypatch.setattr(
+        networking, "EXTERNAL_IP_CACHE_FILE", str(tmp_path / "external_ip.json")
+    )
@@ -16,32 +16,46 @@
 # DEALINGS IN THE SOFTWARE.
 
 
+import asyncio
+import json
 import re
 import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Optional, Tuple
+from typing import Any, ClassVar, Optional, Tuple
 from unittest import IsolatedAsyncioTestCase
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import fastapi
 import netaddr
+import numpy as np
 import pydantic
 import pytest
+from bittensor_wallet import Keypair
 from fastapi.testclient import TestClient
 from starlette.requests import Request
 
 from bittensor.core.axon import AxonMiddleware, Axon
-from bittensor.core.errors import RunException
+from bittensor.core.nonce_store import MemoryNonceStore
+from bittensor.core.errors import PriorityException, RunException
+from bittensor.core.scheduler import AdmissionController, PriorityScheduler
 from bittensor.core.settings import version_as_int
 from bittensor.core.stream import StreamingSynapse
 from bittensor.core.synapse import Synapse
+from bittensor.core.tensor import Tensor
 from bittensor.core.threadpool import PriorityThreadPoolExecutor
+from bittensor.core import wire_format
 from bittensor.utils.axon_utils import (
     allowed_nonce_window_ns,
     calculate_diff_seconds,
     ALLOWED_DELTA,
     NANOSECONDS_IN_SECOND,
+    NONCE_TTL_NS,
+    keypair_from_ss58,
+    verify_signature,
 )
+from bittensor.utils import compression
 
 
 def test_attach_initial():
@@ -201,6 +215,13 @@ class AxonMock:
         self.forward_fns = {}
         self.verify_fns = {}
         self.thread_pool = PriorityThreadPoolExecutor(max_workers=1)
+        self.crypto_executor = None
+        self.signing_executor = None
+        self.scheduler = None
+        self.admission = None
+        self.hotkey_rate_limiter = None
+        self.ip_rate_limiter = None
+        self.metrics = None
 
 
 class SynapseMock(Synapse):
@@ -479,6 +500,9 @@ class TestAxonMiddleware(IsolatedAsyncioTestCase):
         # Create a mock axon
         self.mock_axon = MagicMock()
         self.mock_axon.uuid = "1234"
+        self.mock_axon.signing_executor = None
+        self.mock_axon.scheduler = None
+        self.mock_axon.admission = None
         self.mock_axon.forward_class_types = {
             "request_name": Synapse,
         }
@@ -492,14 +516,15 @@ class TestAxonMiddleware(IsolatedAsyncioTestCase):
         # Mock the request
         request = MagicMock(spec=Request)
         request.url.path = "/request_name"
-        request.client.port = "5000"
+        request.client.port = 5000
         request.client.host = "192.168.0.1"
         request.headers = {}
+        request.body = AsyncMock(return_value=b"")
 
         synapse = await self.axon_middleware.preprocess(request)
 
         # Check if the preprocess function fills the axon information into the synapse
-        assert synapse.axon.version == str(version_as_int)
+        assert synapse.axon.version == version_as_int
         assert synapse.axon.uuid == "1234"
         assert synapse.axon.nonce is not None
         assert synapse.axon.status_message is None
@@ -507,7 +532,7 @@ class TestAxonMiddleware(IsolatedAsyncioTestCase):
         assert synapse.axon.signature == "0xaabbccdd"
 
         # Check if the preprocess function fills the dendrite information into the synapse
-        assert synapse.dendrite.port == "5000"
+        assert synapse.dendrite.port == 5000
         assert synapse.dendrite.ip == "192.168.0.1"
 
         # Check if the preprocess function sets the request name correctly
@@ -554,8 +579,11 @@ class TestAxonHTTPAPIResponses:
         """
 
         bt_header_axon_process_time: float = pydantic.Field(gt=0, lt=30)
+        bt_header_axon_nonce: int = pydantic.Field(gt=0)
+        bt_header_axon_uuid: str
+        bt_header_axon_signature: str = pydantic.Field(pattern=r"^0x[\da-f]+$")
         timeout: float = pydantic.Field(gt=0, lt=30)
-        header_size: int = pydantic.Field(None, gt=10, lt=400)
+        header_size: int = pydantic.Field(None, gt=10, lt=1000)
         total_size: int = pydantic.Field(gt=100, lt=10000)
         content_length: Optional[int] = pydantic.Field(
             None, alias="content-length", gt=100, lt=10000
@@ -596,6 +624,25 @@ class TestAxonHTTPAPIResponses:
             },
         )
 
+    async def test_response_serializes_without_warnings(self, http_client, axon):
+        axon.verify_fns["Synapse"] = self.no_verify_fn
+        with warnings.catch_warnings():
+            # Such as the serializer warnings of fields holding values of the wrong type.
+            warnings.simplefilter("error")
+            response = http_client.post_synapse(Synapse())
+        assert response.status_code == 200
+
+    async def test_endpoint_requires_middleware_synapse(self, axon):
+        (endpoint,) = [
+            route.endpoint
+            for route in axon.app.router.routes
+            if route.path == "/Synapse"
+        ]
+        request = Request({"type": "http", "path": "/Synapse", "headers": []})
+
+        with pytest.raises(RuntimeError, match="AxonMiddleware"):
+            await endpoint(request)
+
     async def test_ping__without_verification(self, http_client, axon):
         axon.verify_fns["Synapse"] = self.no_verify_fn
         request_synapse = Synapse()
@@ -606,6 +653,9 @@ class TestAxonHTTPAPIResponses:
         self.assert_headers(
             response,
             {
+                "bt_header_axon_version": str(version_as_int),
+                "bt_header_dendrite_ip": "testclient",
+                "bt_header_dendrite_port": "50000",
                 "computed_body_hash": "a7ffc6f8bf1ed76651c14756a061d662f580ff4de43b49fa82d80a4b80f8434a",
                 "content-type": "application/json",
                 "name": "Synapse",
@@ -785,3 +835,652 @@ def test_nonce_within_allowed_window(nonce_offset_seconds, expected_result):
                 "computed_body_hash": "a7ffc6f8bf1ed76651c14756a061d662f580ff4de43b49fa82d80a4b80f8434a",
             },
         )
+
+
+def signed_synapse(
+    keypair: Keypair, axon_hotkey: str, nonce: Optional[int] = None
+) -> SynapseMock:
+    synapse = SynapseMock()
+    synapse.dendrite.hotkey = keypair.ss58_address
+    synapse.dendrite.uuid = "uuid"
+    synapse.dendrite.version = version_as_int
+    synapse.dendrite.nonce = time.time_ns() if nonce is None else nonce
+    message = f"{synapse.dendrite.nonce}.{keypair.ss58_address}.{axon_hotkey}.uuid.{synapse.computed_body_hash}"
+    synapse.dendrite.signature = f"0x{keypair.sign(message).hex()}"
+    return synapse
+
+
+@pytest.mark.asyncio
+async def test_default_verify_rejects_replayed_nonce():
+    nonce_store = MemoryNonceStore()
+    axon = Axon(
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+        nonce_store=nonce_store,
+    )
+    keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+    synapse = signed_synapse(keypair, "A")
+
+    await axon.default_verify(synapse)
+    assert nonce_store.get(f"{keypair.ss58_address}:uuid") == synapse.dendrite.nonce
+
+    with pytest.raises(Exception, match="a newer one was last processed"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "version, timeout, match",
+    [
+        (version_as_int, 12.0, "Nonce is too old"),
+        # The timeout header is not signed, raising it must not widen the nonce window.
+        (version_as_int, 3600.0, "Nonce is too old"),
+        # Neither is the version header, claiming an old version must not skip the freshness check.
+        (7001000, 12.0, "Dendrite version is too old"),
+        (None, 12.0, "Dendrite version is too old"),
+    ],
+)
+async def test_default_verify_rejects_expired_nonce_replay(version, timeout, match):
+    # The nonce of the replayed request has expired from the store.
+    config = Axon.config()
+    config.axon.reject_legacy_nonces = True
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+        nonce_store=MemoryNonceStore(),
+    )
+    keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+    synapse = signed_synapse(
+        keypair, "A", nonce=time.time_ns() - NONCE_TTL_NS - NANOSECONDS_IN_SECOND
+    )
+    synapse.dendrite.version = version
+    synapse.timeout = timeout
+
+    with pytest.raises(Exception, match=match):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("version", [7001000, None])
+async def test_default_verify_legacy_nonces(version):
+    # By default, the dendrites older than v7.2.0 only need increasing nonces.
+    axon = Axon(
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+        nonce_store=MemoryNonceStore(),
+    )
+    keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+    synapse = signed_synapse(keypair, "A", nonce=1)
+    synapse.dendrite.version = version
+
+    await axon.default_verify(synapse)
+    with pytest.raises(Exception, match="a newer one was last processed"):
+        await axon.default_verify(synapse)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_with_crypto_workers():
+    config = Axon.config()
+    config.axon.crypto_workers = 2
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    assert isinstance(axon.crypto_executor, ThreadPoolExecutor)
+    assert axon.signing_executor is axon.crypto_executor
+
+    keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+    await axon.default_verify(signed_synapse(keypair, "A"))
+
+    forged = signed_synapse(keypair, "A")
+    forged.dendrite.signature = signed_synapse(keypair, "other").dendrite.signature
+    with pytest.raises(Exception, match="Signature mismatch"):
+        await axon.default_verify(forged)
+
+
+@pytest.mark.asyncio
+async def test_default_verify_accepts_concurrent_copies_once():
+    config = Axon.config()
+    config.axon.crypto_workers = 4
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+    synapse = signed_synapse(keypair, "A")
+
+    results = await asyncio.gather(
+        *(axon.default_verify(synapse.model_copy()) for _ in range(8)),
+        return_exceptions=True,
+    )
+
+    assert sum(result is None for result in results) == 1
+    assert all(
+        "a newer one was last processed" in str(result)
+        for result in results
+        if result is not None
+    )
+
+
+def test_stop_shuts_crypto_executors_down():
+    config = Axon.config()
+    config.axon.crypto_workers = 2
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    executor = axon.crypto_executor
+    axon.fast_server = MagicMock()
+
+    axon.stop()
+    assert executor._shutdown
+    assert axon.crypto_executor is None
+
+    axon.start()
+    assert isinstance(axon.crypto_executor, ThreadPoolExecutor)
+    axon.stop()
+
+
+def test_keypair_from_ss58_is_cached():
+    keypair = Keypair.create_from_mnemonic(Keypair.generate_mnemonic())
+    assert keypair_from_ss58(keypair.ss58_address) is keypair_from_ss58(
+        keypair.ss58_address
+    )
+    assert verify_signature(
+        keypair.ss58_address, "message", f"0x{keypair.sign('message').hex()}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_priority_scheduling_runs_sync_forward_off_loop():
+    config = Axon.config()
+    config.axon.priority_scheduling = True
+    config.axon.max_workers = 2
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    assert axon.scheduler.max_concurrency == 2
+
+    class SlowSynapse(Synapse):
+        pass
+
+    def slow_forward(synapse: SlowSynapse) -> SlowSynapse:
+        time.sleep(0.01)
+        return synapse
+
+    def priority(synapse: SlowSynapse) -> float:
+        return 1.0
+
+    axon.attach(slow_forward, priority_fn=priority)
+    axon.verify_fns["SlowSynapse"] = None
+
+    response = SynapseHTTPClient(axon.app).post_synapse(SlowSynapse())
+    assert response.status_code == 200
+    stats = axon.scheduler.stats()
+    assert stats["admitted"] == 1
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_priority_scheduling_times_out_queued_request(middleware):
+    middleware.axon.scheduler = PriorityScheduler(max_concurrency=1)
+    await middleware.axon.scheduler.acquire()
+    call_next = AsyncMock()
+    synapse = SynapseMock(timeout=0.01)
+
+    with pytest.raises(PriorityException):
+        await middleware.run(
+            synapse,
+            call_next,
+            MagicMock(),
+            priority=1.0,
+            deadline=time.time() + synapse.timeout,
+        )
+    assert synapse.axon.status_code == 408
+    call_next.assert_not_called()
+    assert middleware.axon.scheduler.stats()["expired"] == 1
+
+
+@pytest.mark.parametrize(
+    "service_time, sent_ago, expected_status",
+    [
+        (0.1, 0.0, None),
+        (0.1, 20.0, 408),
+        (15.0, 0.0, 503),
+    ],
+    ids=["admitted", "expired", "overloaded"],
+)
+def test_admit_sheds_requests_by_deadline(
+    middleware, service_time, sent_ago, expected_status
+):
+    middleware.axon.admission = AdmissionController(concurrency=1)
+    middleware.axon.admission.record("SynapseMock", service_time)
+    middleware.axon.forward_class_types = {"SynapseMock": SynapseMock}
+    synapse = SynapseMock(timeout=12.0)
+    synapse.dendrite.version = version_as_int
+    synapse.dendrite.nonce = time.time_ns() - int(sent_ago * NANOSECONDS_IN_SECOND)
+    # Only the headers are read, the body is not received yet.
+    request = Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "path": "/SynapseMock",
+            "headers": [
+                (name.lower().encode(), value.encode())
+                for name, value in synapse.to_headers().items()
+            ],
+            "query_string": b"",
+        }
+    )
+
+    if expected_status is None:
+        assert middleware.admit(request, time.time())
+        assert middleware.axon.admission.in_flight == 1
+    else:
+        with pytest.raises(PriorityException) as exc_info:
+            middleware.admit(request, time.time())
+        assert exc_info.value.synapse.axon.status_code == expected_status
+        assert middleware.axon.admission.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_load_shedding_rejects_before_forward():
+    config = Axon.config()
+    config.axon.load_shedding = True
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    axon.verify_fns["Synapse"] = None
+    client = SynapseHTTPClient(axon.app)
+    synapse = Synapse(timeout=12.0)
+
+    def post():
+        return client.post(
+            "/Synapse",
+            json=synapse.model_dump(),
+            headers={"computed_body_hash": synapse.body_hash, "timeout": "12.0"},
+        )
+
+    assert post().status_code == 200
+    assert axon.admission.stats()["admitted"] == 1
+    assert axon.admission.in_flight == 0
+
+    axon.admission.record("Synapse", 60.0)
+    assert post().status_code == 503
+    assert axon.admission.stats()["shed"] == 1
+
+    # Shed before the body is decoded.
+    response = client.post(
+        "/Synapse",
+        content=b"not json",
+        headers={"computed_body_hash": synapse.body_hash, "timeout": "12.0"},
+    )
+    assert response.status_code == 503
+    assert axon.admission.stats()["shed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_asgi_middleware_passes_through_other_scopes():
+    app = AsyncMock()
+    middleware = AxonMiddleware(app, AxonMock())
+    scope = {"type": "lifespan"}
+    receive, send = AsyncMock(), AsyncMock()
+
+    await middleware(scope, receive, send)
+    app.assert_awaited_once_with(scope, receive, send)
+
+
+@pytest.mark.asyncio
+async def test_asgi_middleware_keeps_started_response_on_error():
+    async def failing_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        raise RuntimeError("Stream broken")
+
+    axon = AxonMock()
+    axon.forward_class_types = {"Synapse": Synapse}
+    axon.uuid = "1234"
+    axon.wallet = MagicMock()
+    axon.wallet.hotkey.sign.return_value = bytes.fromhex("aabbccdd")
+    middleware = AxonMiddleware(failing_app, axon)
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/Synapse",
+        "headers": [(b"computed_body_hash", Synapse().body_hash.encode())],
+        "client": ("127.0.0.1", 1234),
+        "query_string": b"",
+    }
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    await middleware(scope, receive, send)
+    assert [message["type"] for message in messages] == ["http.response.start"]
+
+
+@pytest.mark.asyncio
+async def test_request_synapse_is_decoded_once():
+    axon = Axon(
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    seen = []
+
+    class PayloadSynapse(Synapse):
+        payload: str = ""
+        required_hash_fields: ClassVar[tuple[str, ...]] = ("payload",)
+
+    def forward(synapse: PayloadSynapse) -> PayloadSynapse:
+        seen.append(synapse)
+        synapse.payload = synapse.payload.upper()
+        return synapse
+
+    def blacklist(synapse: PayloadSynapse) -> Tuple[bool, str]:
+        seen.append(synapse)
+        return False, ""
+
+    def verify(synapse: PayloadSynapse) -> None:
+        seen.append(synapse)
+
+    axon.attach(forward, blacklist_fn=blacklist, verify_fn=verify)
+    client = SynapseHTTPClient(axon.app)
+
+    with patch.object(
+        PayloadSynapse, "model_validate", wraps=PayloadSynapse.model_validate
+    ) as model_validate:
+        response = client.post_synapse(PayloadSynapse(payload="hello"))
+    assert response.status_code == 200
+    assert response.json()["payload"] == "HELLO"
+    assert model_validate.call_count == 1
+    assert len(seen) == 3
+    assert seen[0] is seen[1] is seen[2]
+
+    # A body which does not match the signed body hash never reaches forward.
+    seen.clear()
+    response = client.post(
+        "/PayloadSynapse",
+        json=PayloadSynapse(payload="tampered").model_dump(),
+        headers={"computed_body_hash": PayloadSynapse(payload="hello").body_hash},
+    )
+    assert response.status_code == 500
+    assert len(seen) == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_rejects_before_preprocess():
+    config = Axon.config()
+    config.axon.rate_limit = 1.0
+    config.axon.ip_rate_limit = 100.0
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    axon.verify_fns["Synapse"] = None
+    client = SynapseHTTPClient(axon.app)
+    synapse = Synapse()
+
+    def post(hotkey):
+        return client.post(
+            "/Synapse",
+            json=synapse.model_dump(),
+            headers={
+                "computed_body_hash": synapse.body_hash,
+                "bt_header_dendrite_hotkey": hotkey,
+            },
+        )
+
+    assert post("hotkey-1").status_code == 200
+    with patch.object(AxonMiddleware, "preprocess") as preprocess:
+        response = post("hotkey-1")
+    assert response.status_code == 429
+    assert response.json() == {
+        "message": "Too many requests. Rate limit exceeded for hotkey hotkey-1."
+    }
+    preprocess.assert_not_called()
+
+    assert post("hotkey-2").status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_compression_negotiated_with_dendrite():
+    config = Axon.config()
+    config.axon.compression = True
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+
+    class PayloadSynapse(Synapse):
+        payload: str = ""
+        required_hash_fields: ClassVar[tuple[str, ...]] = ("payload",)
+
+    def forward(synapse: PayloadSynapse) -> PayloadSynapse:
+        synapse.payload = synapse.payload.upper()
+        return synapse
+
+    axon.attach(forward)
+    axon.verify_fns["PayloadSynapse"] = None
+    client = SynapseHTTPClient(axon.app)
+    synapse = PayloadSynapse(payload="hello " * 1000)
+    body = json.dumps(synapse.model_dump()).encode()
+
+    response = client.post(
+        "/PayloadSynapse",
+        content=compression.compress(body, "gzip"),
+        headers={
+            "computed_body_hash": synapse.body_hash,
+            "content-type": "application/json",
+            compression.CONTENT_ENCODING_HEADER: "gzip",
+            compression.ACCEPT_ENCODING_HEADER: "gzip",
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers[compression.CONTENT_ENCODING_HEADER] == "gzip"
+    assert "gzip" in response.headers[compression.ACCEPT_ENCODING_HEADER]
+    assert int(response.headers["content-length"]) < len(body)
+    payload = json.loads(compression.decompress(response.content, "gzip"))
+    assert payload["payload"] == "HELLO " * 1000
+
+    # Dendrites which do not accept compression get a plain body.
+    response = client.post(
+        "/PayloadSynapse",
+        content=body,
+        headers={
+            "computed_body_hash": synapse.body_hash,
+            "content-type": "application/json",
+        },
+    )
+    assert response.status_code == 200
+    assert compression.CONTENT_ENCODING_HEADER not in response.headers
+    assert response.json()["payload"] == "HELLO " * 1000
+
+    # Bodies below the threshold are not compressed.
+    small = PayloadSynapse(payload="hello")
+    response = client.post(
+        "/PayloadSynapse",
+        json=small.model_dump(),
+        headers={
+            "computed_body_hash": small.body_hash,
+            compression.ACCEPT_ENCODING_HEADER: "gzip",
+        },
+    )
+    assert response.status_code == 200
+    assert compression.CONTENT_ENCODING_HEADER not in response.headers
+    assert response.json()["payload"] == "HELLO"
+
+
+@pytest.mark.parametrize(
+    "enabled, encoding, body_size, status_code",
+    [
+        (False, "gzip", 1024, 415),
+        (True, "br", 1024, 415),
+        (True, "gzip", 64 * 1024, 413),
+        (True, "gzip", 1024, 200),
+    ],
+)
+def test_compressed_request_limits(enabled, encoding, body_size, status_code):
+    config = Axon.config()
+    config.axon.compression = enabled
+    config.axon.max_decompressed_size = 16 * 1024
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    axon.verify_fns["Synapse"] = None
+    client = SynapseHTTPClient(axon.app)
+    synapse = Synapse()
+    body = json.dumps(synapse.model_dump()).encode().ljust(body_size)
+
+    response = client.post(
+        "/Synapse",
+        content=compression.compress(body, "gzip"),
+        headers={
+            "computed_body_hash": synapse.body_hash,
+            "content-type": "application/json",
+            compression.CONTENT_ENCODING_HEADER: encoding,
+        },
+    )
+    assert response.status_code == status_code
+
+
+@pytest.mark.asyncio
+async def test_msgpack_wire_format():
+    axon = Axon(
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+
+    class TensorSynapse(Synapse):
+        tensor: Optional[Tensor] = None
+        required_hash_fields: ClassVar[tuple[str, ...]] = ("tensor",)
+
+    def forward(synapse: TensorSynapse) -> TensorSynapse:
+        synapse.tensor = Tensor.serialize(synapse.tensor.numpy() * 2)
+        return synapse
+
+    axon.attach(forward)
+    axon.verify_fns["TensorSynapse"] = None
+    client = SynapseHTTPClient(axon.app)
+    synapse = TensorSynapse(tensor=Tensor.serialize(np.arange(100, dtype=np.float32)))
+
+    response = client.post(
+        "/TensorSynapse",
+        content=wire_format.packb(synapse),
+        headers={
+            "computed_body_hash": synapse.body_hash,
+            "content-type": wire_format.MSGPACK_MEDIA_TYPE,
+            "accept": wire_format.MSGPACK_MEDIA_TYPE,
+        },
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == wire_format.MSGPACK_MEDIA_TYPE
+    result = TensorSynapse.model_validate(wire_format.unpackb(response.content))
+    np.testing.assert_array_equal(result.tensor.numpy(), np.arange(100) * 2)
+
+    # A JSON request only gets msgpack back if asked for it.
+    response = client.post(
+        "/TensorSynapse",
+        json=synapse.model_dump(),
+        headers={"computed_body_hash": synapse.body_hash},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    # The body hash is checked against the decoded msgpack body too.
+    response = client.post(
+        "/TensorSynapse",
+        content=wire_format.packb(
+            TensorSynapse(tensor=Tensor.serialize(np.zeros(100, dtype=np.float32)))
+        ),
+        headers={
+            "computed_body_hash": synapse.body_hash,
+            "content-type": wire_format.MSGPACK_MEDIA_TYPE,
+        },
+    )
+    assert response.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint():
+    config = Axon.config()
+    config.axon.metrics = True
+    axon = Axon(
+        config=config,
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    axon.verify_fns["Synapse"] = None
+    client = SynapseHTTPClient(axon.app)
+    synapse = Synapse()
+
+    assert (
+        client.post(
+            "/Synapse",
+            json=synapse.model_dump(),
+            headers={"computed_body_hash": synapse.body_hash},
+        ).status_code
+        == 200
+    )
+    assert client.post("/Unknown", json={}).status_code == 404
+
+    # The metrics route is served without going through the synapse pipeline.
+    with patch.object(AxonMiddleware, "dispatch") as dispatch:
+        response = client.get("/metrics")
+    dispatch.assert_not_called()
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    metrics = response.text
+    assert (
+        'bittensor_axon_requests_total{synapse="Synapse",status_code="200"} 1.0'
+        in metrics
+    )
+    assert (
+        'bittensor_axon_requests_total{synapse="unknown",status_code="404"} 1.0'
+        in metrics
+    )
+    for stage in ("preprocess", "blacklist", "verify", "priority", "forward"):
+        assert (
+            f'bittensor_axon_stage_duration_seconds_count{{synapse="Synapse",stage="{stage}"}} 1'
+            in metrics
+        )
+    assert "bittensor_axon_requests_in_flight 0" in metrics
+    assert 'bittensor_axon_thread_pool_queue_depth{pool="priority"} 0' in metrics
+
+
+def test_metrics_endpoint_disabled_by_default():
+    axon = Axon(
+        ip="192.0.2.1",
+        external_ip="192.0.2.1",
+        wallet=MockWallet(MockHotkey("A"), MockHotkey("B"), MockHotkey("PUB")),
+    )
+    assert axon.metrics is None
+    assert SynapseHTTPClient(axon.app).get("/metrics").status_code == 404
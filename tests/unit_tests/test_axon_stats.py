@@ -0,0 +1,122 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from types import SimpleNamespace
+
+import pytest
+
+from bittensor.core import axon_stats
+from bittensor.core.axon_stats import AxonStatsTracker
+
+
+def make_axon(port: int = 8091, hotkey: str = "hotkey"):
+    return SimpleNamespace(ip="127.0.0.1", port=port, hotkey=hotkey)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(axon_stats.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_latency_and_success_rate():
+    tracker = AxonStatsTracker(alpha=0.5)
+    axon = make_axon()
+    assert tracker.stats(axon) is None
+
+    tracker.record(axon, 1.0, success=True)
+    tracker.record(axon, 2.0, success=True)
+    tracker.record(axon, 12.0, success=False)
+
+    stats = tracker.stats(axon)
+    assert stats["hotkey"] == "hotkey"
+    assert (stats["requests"], stats["successes"]) == (3, 2)
+    assert stats["latency"] == pytest.approx(1.5)
+    assert stats["latency_p95"] > stats["latency"]
+    assert stats["success_rate"] == pytest.approx(0.5)
+    assert list(tracker.snapshot()) == ["127.0.0.1:8091"]
+
+
+def test_adaptive_timeout():
+    tracker = AxonStatsTracker(timeout_multiplier=2.0, min_timeout=1.0, min_samples=3)
+    axon = make_axon()
+    for _ in range(2):
+        tracker.record(axon, 2.0, success=True)
+    assert tracker.timeout(axon, 12.0) == 12.0
+
+    tracker.record(axon, 2.0, success=True)
+    assert tracker.timeout(axon, 12.0) == pytest.approx(4.0)
+    # Clamped to the requested timeout and to the minimum timeout.
+    assert tracker.timeout(axon, 3.0) == 3.0
+    for _ in range(50):
+        tracker.record(axon, 0.01, success=True)
+    assert tracker.timeout(axon, 12.0) == 1.0
+
+
+def test_adaptive_timeout_widens_after_timeouts():
+    tracker = AxonStatsTracker()
+    axon = make_axon()
+    for _ in range(5):
+        tracker.record(axon, 0.4, success=True)
+    assert tracker.timeout(axon, 12.0) == 1.0
+
+    # Timed out requests count as lasting at least their timeout.
+    for _ in range(50):
+        tracker.record(axon, 0.5, success=False, timeout=tracker.timeout(axon, 12.0))
+    assert tracker.timeout(axon, 12.0) == 12.0
+    assert tracker.stats(axon)["successes"] == 5
+
+
+def test_circuit_breaker(clock):
+    tracker = AxonStatsTracker(failure_threshold=2, backoff=10.0, max_backoff=15.0)
+    axon = make_axon()
+
+    tracker.record(axon, 0.1, success=False, connection_failed=True)
+    assert tracker.allow(axon)
+    tracker.record(axon, 0.1, success=False, connection_failed=True)
+    assert not tracker.allow(axon)
+    assert tracker.stats(axon)["circuit_open"]
+
+    # A single probe is let through after the backoff.
+    clock[0] += 10.0
+    assert tracker.allow(axon)
+    assert not tracker.allow(axon)
+
+    # The failed probe doubles the backoff, up to the maximum.
+    tracker.record(axon, 0.1, success=False, connection_failed=True)
+    clock[0] += 10.0
+    assert not tracker.allow(axon)
+    clock[0] += 5.0
+    assert tracker.allow(axon)
+
+    # A cancelled probe frees the probe slot, a successful one closes the circuit.
+    tracker.cancel(axon)
+    assert tracker.allow(axon)
+    tracker.record(axon, 0.1, success=True)
+    assert tracker.allow(axon)
+    assert tracker.allow(axon)
+    assert tracker.stats(axon)["consecutive_failures"] == 0
+
+
+def test_max_keys():
+    tracker = AxonStatsTracker(max_keys=2)
+    for port in range(3):
+        tracker.record(make_axon(port), 0.1, success=True)
+
+    assert len(tracker) == 2
+    assert tracker.stats(make_axon(0)) is None
@@ -18,6 +18,8 @@
 # DEALINGS IN THE SOFTWARE.
 
 import asyncio
+import json
+import time
 import typing
 from unittest.mock import MagicMock, Mock
 
@@ -34,6 +36,11 @@ from bittensor.core.synapse import TerminalInfo
 from tests.helpers import get_mock_wallet
 from bittensor.core.synapse import Synapse
 from bittensor.core.chain_data import AxonInfo
+from bittensor.utils.compression import (
+    CONTENT_ENCODING_HEADER,
+    DecompressedSizeError,
+    compress,
+)
 
 
 class SynapseDummy(Synapse):
@@ -72,6 +79,9 @@ def setup_axon():
     axon = Axon(wallet)
     axon.attach(forward_fn=dummy)
     axon.start()
+    # The first queries would race the server binding its port.
+    while not axon.fast_server.started:
+        time.sleep(1e-3)
     yield axon
     del axon
 
@@ -94,8 +104,35 @@ def test_close(setup_dendrite, setup_axon):
     axon = setup_axon
     # Query the axon to open a session
     setup_dendrite.query(axon, SynapseDummy(input=1))
-    # Session should be automatically closed after query
-    assert setup_dendrite._session is None
+    # The session of the synchronous queries is kept for the next ones
+    assert setup_dendrite._loop_session is not None
+    setup_dendrite.query(axon, SynapseDummy(input=1))
+    assert setup_dendrite.pool_stats()["reused"] == 1
+    # Until the dendrite is closed
+    setup_dendrite.close_session()
+    assert setup_dendrite._loop_session is None
+    assert setup_dendrite._loop is None
+
+
+def test_del_does_not_wait_for_the_loop(setup_axon):
+    d = Dendrite(get_mock_wallet())
+    d.query(setup_axon, SynapseDummy(input=1))
+    loop, thread = d._loop, d._loop_thread
+
+    d.__del__()
+    assert d._loop is None
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    loop.close()
+
+    # At interpreter exit, the thread may be gone while the loop is still flagged as running.
+    loop = d._get_loop()
+    thread, d._loop_thread = d._loop_thread, Mock(is_alive=Mock(return_value=False))
+    d.__del__()
+    assert loop.is_running() and not loop.is_closed()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
 
 
 @pytest.mark.asyncio
@@ -146,6 +183,199 @@ async def test_forward_many():
     assert len([resp]) == 1
 
 
+@pytest.mark.asyncio
+async def test_forward_iter():
+    d = Dendrite(wallet=get_mock_wallet())
+    cancelled = []
+
+    async def call(target_axon, synapse, timeout, deserialize, broadcast=None):
+        try:
+            await asyncio.sleep(target_axon)
+        except asyncio.CancelledError:
+            cancelled.append(target_axon)
+            raise
+        synapse.dendrite.status_code = 200
+        return synapse
+
+    d._call = call
+    delays = [0.3, 0.1, 0.2]
+
+    results = [
+        (index, axon)
+        async for index, axon, _ in d.forward_iter(delays, deserialize=False)
+    ]
+    assert results == [(1, 0.1), (2, 0.2), (0, 0.3)]
+
+    delays.append(5)
+    results = [
+        (index, response.is_success)
+        async for index, _, response in d.forward_iter(
+            delays, deserialize=False, quorum=2
+        )
+    ]
+    assert results == [(1, True), (2, True)]
+    assert sorted(cancelled) == [0.3, 5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency, expected", [(None, 10), (3, 3)])
+async def test_forward_max_concurrency(max_concurrency, expected):
+    d = Dendrite(wallet=get_mock_wallet(), max_concurrency=max_concurrency)
+    concurrency = [0, 0]
+
+    async def call(*args, **kwargs):
+        concurrency[0] += 1
+        concurrency[1] = max(concurrency)
+        await asyncio.sleep(0.01)
+        concurrency[0] -= 1
+
+    d.call = call
+    await d.forward([MagicMock() for _ in range(10)])
+
+    assert concurrency[1] == expected
+
+
+@pytest.mark.asyncio
+async def test_session_connection_pool():
+    d = Dendrite(
+        wallet=get_mock_wallet(),
+        connection_limit=8,
+        connection_limit_per_host=2,
+        ipv4_only=True,
+    )
+    session = await d.session
+
+    assert session.connector.limit == 8
+    assert session.connector.limit_per_host == 2
+    assert d.max_concurrency is None
+    assert d.pool_stats() == {
+        "open": 0,
+        "idle": 0,
+        "waiting": 0,
+        "created": 0,
+        "reused": 0,
+        "reuse_ratio": 0.0,
+    }
+    await d.aclose_session()
+
+
+class FailingSession:
+    """Session whose requests fail with ``error``, recording the timeouts they were given."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.timeouts: list[aiohttp.ClientTimeout] = []
+
+    def post(self, url, timeout, **kwargs):
+        self.timeouts.append(timeout)
+        request = MagicMock()
+        request.__aenter__.side_effect = self.error
+        return request
+
+
+@pytest.mark.asyncio
+async def test_call_adaptive_timeout_widens_after_timeouts(axon_info):
+    d = Dendrite(wallet=get_mock_wallet(), adaptive_timeout=True)
+    d._session = session = FailingSession(asyncio.TimeoutError())
+    for _ in range(5):
+        d.axon_stats.record(axon_info, 0.4, success=True)
+
+    for _ in range(30):
+        response = await d.call(axon_info, Synapse(), timeout=12.0, deserialize=False)
+        assert response.dendrite.status_code == 408
+
+    totals = [timeout.total for timeout in session.timeouts]
+    assert totals[0] == 1.0
+    assert totals == sorted(totals)
+    assert totals[-1] == 12.0
+    assert d.axon_stats.stats(axon_info)["consecutive_failures"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error, trips",
+    [
+        (
+            getattr(aiohttp, "ConnectionTimeoutError", aiohttp.ServerTimeoutError)(
+                "Connection timeout to host"
+            ),
+            True,
+        ),
+        (aiohttp.ClientConnectionError(), True),
+        (asyncio.TimeoutError(), False),
+    ],
+)
+async def test_call_circuit_breaker(axon_info, error, trips):
+    d = Dendrite(wallet=get_mock_wallet(), circuit_breaker=True)
+    d._session = session = FailingSession(error)
+
+    for _ in range(3):
+        await d.call(axon_info, Synapse(), timeout=12.0, deserialize=False)
+    response = await d.call(axon_info, Synapse(), timeout=12.0, deserialize=False)
+
+    assert session.timeouts[0].sock_connect == 6.0
+    assert len(session.timeouts) == (3 if trips else 4)
+    assert response.dendrite.status_message.startswith("Circuit breaker open") is trips
+    assert d.axon_stats.stats(axon_info)["circuit_open"] is trips
+
+
+@pytest.mark.asyncio
+async def test_call_propagates_cancellation(axon_info):
+    d = Dendrite(wallet=get_mock_wallet())
+    d._session = FailingSession(asyncio.CancelledError())
+
+    with pytest.raises(asyncio.CancelledError):
+        await d.call(axon_info, Synapse(), timeout=12.0, deserialize=False)
+
+    # Cancelled requests are not counted against the axon.
+    assert d.axon_stats.stats(axon_info) is None
+
+
+@pytest.mark.asyncio
+async def test_read_response_limits_decompressed_size(axon_info):
+    d = Dendrite(wallet=get_mock_wallet(), compression=True)
+    body = json.dumps({"data": "0" * 1024 * 1024}).encode()
+    response = MagicMock()
+    response.headers = {CONTENT_ENCODING_HEADER: "gzip"}
+    response.content_type = "application/json"
+
+    async def read():
+        return compress(body, "gzip")
+
+    response.read = read
+    assert await d._read_response_json(axon_info, response) == json.loads(body)
+
+    d.max_decompressed_size = 1024
+    with pytest.raises(DecompressedSizeError):
+        await d._read_response_json(axon_info, response)
+
+
+def test_synapse_history():
+    d = Dendrite(wallet=get_mock_wallet(), history_size=2)
+    for i in range(3):
+        synapse = SynapseDummy(input=i)
+        synapse.dendrite.status_code = 200
+        synapse.dendrite.process_time = 0.5
+        synapse.axon.hotkey = f"hot{i}"
+        d._record_history(synapse)
+
+    assert [record.axon_hotkey for record in d.synapse_history] == ["hot1", "hot2"]
+    record = d.synapse_history[-1]
+    assert (record.name, record.status_code, record.process_time) == (
+        "SynapseDummy",
+        200,
+        0.5,
+    )
+
+    d = Dendrite(wallet=get_mock_wallet(), history_size=0)
+    d._record_history(SynapseDummy(input=1))
+    assert not d.synapse_history
+
+    d = Dendrite(wallet=get_mock_wallet(), history_sample_rate=0.0)
+    d._record_history(SynapseDummy(input=1))
+    assert not d.synapse_history
+
+
 def test_pre_process_synapse():
     d = Dendrite(wallet=get_mock_wallet())
     s = Synapse()
@@ -168,6 +398,27 @@ def test_pre_process_synapse():
     assert synapse.dendrite.signature
 
 
+def test_pre_process_synapse_rehashes_mutated_body():
+    class ItemsSynapse(Synapse):
+        items: list[int] = []
+        required_hash_fields: typing.ClassVar[tuple[str, ...]] = ("items",)
+
+    d = Dendrite(wallet=get_mock_wallet())
+    target_axon_info = Axon(wallet=get_mock_wallet()).info()
+    synapse = ItemsSynapse(items=[1])
+    first_hash = synapse.body_hash
+
+    # Mutated in place between two calls, so not through ``__setattr__``.
+    synapse.items.append(2)
+    synapse = d.preprocess_synapse_for_request(target_axon_info, synapse)
+
+    body_hash = ItemsSynapse(items=[1, 2]).body_hash
+    assert body_hash != first_hash
+    assert synapse.body_hash == body_hash
+    message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{body_hash}"
+    assert d.keypair.verify(message, synapse.dendrite.signature)
+
+
 # Helper functions for casting, assuming they exist and work correctly.
 def cast_int(value: typing.Any) -> int:
     return int(value)
@@ -320,6 +571,57 @@ async def test_dendrite__call__success_response(
     assert synapse.dendrite.process_time >= 0
 
 
+@pytest.mark.asyncio
+async def test_dendrite_forward_broadcast(axon_info, setup_dendrite, mock_aio_response):
+    input_synapse = SynapseDummy(input=1)
+    expected_synapse = SynapseDummy(
+        **(input_synapse.model_dump() | dict(output=2, axon=TerminalInfo()))
+    )
+    mock_aio_response.post(
+        f"http://127.0.0.1:666/SynapseDummy",
+        body=expected_synapse.json(),
+        repeat=True,
+    )
+    encode_request = Mock(wraps=setup_dendrite._encode_request)
+    setup_dendrite._encode_request = encode_request
+
+    synapses = await setup_dendrite.forward(
+        [axon_info] * 3, input_synapse, deserialize=False, broadcast=True
+    )
+
+    # The body is serialized once, each request is still signed separately.
+    encode_request.assert_called_once()
+    assert len({synapse.dendrite.nonce for synapse in synapses}) == 3
+    for synapse in synapses:
+        assert synapse is not input_synapse
+        assert synapse.output == 2
+        assert synapse.dendrite.status_code == 200
+        assert synapse.dendrite.signature is not None
+    assert input_synapse.dendrite.signature is None
+
+
+def test_build_request_broadcast_timeout_per_axon(axon_info, setup_dendrite):
+    broadcast = setup_dendrite._broadcast_request(SynapseDummy(input=1), 12.0)
+
+    # With adaptive timeouts, each axon is given its own timeout.
+    requests = [
+        setup_dendrite._build_request(
+            axon_info,
+            setup_dendrite.preprocess_synapse_for_request(
+                axon_info,
+                broadcast.synapse.model_copy(),
+                timeout,
+                body_hash=broadcast.body_hash,
+            ),
+            broadcast,
+        )
+        for timeout in (3.0, 7.5)
+    ]
+
+    assert [request["headers"]["timeout"] for request in requests] == ["3.0", "7.5"]
+    assert requests[0]["data"] is requests[1]["data"]
+
+
 @pytest.mark.asyncio
 async def test_dendrite__call__handles_http_error_response(
     axon_info, setup_dendrite, mock_aio_response
@@ -408,3 +710,32 @@ def test_process_error_message(
     # Assert
     assert result.dendrite.status_code == expected_status_code
     assert expected_message in result.dendrite.status_message
+
+
+def test_process_server_response_merges_terminal_headers(setup_dendrite):
+    synapse = SynapseDummy(input=1)
+    synapse.dendrite = TerminalInfo(ip="127.0.0.1", nonce=1, hotkey="dendrite")
+    synapse.axon = TerminalInfo(ip="127.0.0.2", port=8091, hotkey="axon")
+    server_response = Mock(status=200)
+    server_response.headers = {
+        **TerminalInfo(status_code=200, status_message="Success").to_headers("axon"),
+        "bt_header_axon_process_time": "0.25",
+        "bt_header_dendrite_ip": "127.0.0.3",
+    }
+
+    json_response = {
+        "input": 1,
+        "output": 2,
+        "axon": {"port": 8091},
+        "dendrite": {"hotkey": "dendrite"},
+    }
+
+    setup_dendrite.process_server_response(server_response, json_response, synapse)
+
+    assert synapse.output == 2
+    assert synapse.axon.status_code == 200
+    assert synapse.axon.process_time == 0.25
+    assert synapse.axon.port == 8091
+    assert synapse.dendrite.ip == "127.0.0.3"
+    assert synapse.dendrite.hotkey == "dendrite"
+    assert synapse.dendrite.status_code == 200
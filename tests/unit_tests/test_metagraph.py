@@ -18,12 +18,16 @@
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 
+import dataclasses
+
 import numpy as np
 import pytest
 import copy
 
 from bittensor.core import settings
+from bittensor.core.chain_data import AxonInfo, NeuronInfoLite
 from bittensor.core.metagraph import Metagraph
+from bittensor.utils.balance import Balance
 
 
 @pytest.fixture
@@ -269,3 +273,127 @@ def test_copy(mock_environment):
         metagraph.neurons, copied_metagraph.neurons
     ):
         assert original_neuron is copied_neuron
+
+
+def _lite_neuron(uid: int, **kwargs) -> NeuronInfoLite:
+    hotkey = f"hotkey_{uid}"
+    stake = Balance.from_tao(uid + 1)
+    return dataclasses.replace(
+        NeuronInfoLite.get_null_neuron(),
+        **{
+            "uid": uid,
+            "netuid": 1,
+            "hotkey": hotkey,
+            "stake": stake,
+            "total_stake": stake,
+            "rank": uid / 10,
+            "last_update": 50,
+            "axon_info": AxonInfo(
+                version=1,
+                ip="127.0.0.1",
+                port=8000 + uid,
+                ip_type=4,
+                hotkey=hotkey,
+                coldkey="coldkey",
+            ),
+            "is_null": False,
+            **kwargs,
+        },
+    )
+
+
+@pytest.fixture
+def incremental_subtensor(mock_subtensor):
+    """Mocks the storages read by an incremental sync at block 105, after a full sync at block 100."""
+    neurons = [_lite_neuron(uid) for uid in range(10)]
+    mock_subtensor.neurons_lite.return_value = neurons
+    mock_subtensor.get_current_block.return_value = 105
+
+    storages = {
+        "BlocksSinceLastStep": 20,
+        "LastUpdate": [50, 50, 103, 50, 50, 50, 50, 50, 50, 50],
+    }
+    maps = {
+        "BlockAtRegistration": [(MagicMock(value=4), MagicMock(value=104))]
+        + [(MagicMock(value=uid), MagicMock(value=1)) for uid in (0, 1)],
+        "Axons": [
+            (MagicMock(value="hotkey_6"), MagicMock(value={"block": 104})),
+            (MagicMock(value="hotkey_7"), MagicMock(value={"block": 90})),
+        ],
+        "Prometheus": [
+            (MagicMock(value="hotkey_5"), MagicMock(value={"block": 102})),
+            (MagicMock(value="hotkey_6"), MagicMock(value={"block": 80})),
+        ],
+    }
+    mock_subtensor.query_subtensor.side_effect = lambda name, block, params: (
+        MagicMock(value=storages[name])
+    )
+    mock_subtensor.query_map_subtensor.side_effect = lambda name, block, params: maps[
+        name
+    ]
+    mock_subtensor.get_total_stake_for_hotkeys.side_effect = lambda *hotkeys, block: {
+        hotkey: Balance.from_tao(100 if hotkey == "hotkey_8" else uid + 1)
+        for uid, hotkey in enumerate(hotkeys)
+    }
+    mock_subtensor.neuron_for_uid_lite.side_effect = lambda uid, netuid, block: (
+        _lite_neuron(uid, rank=0.9, last_update=103, stake=Balance.from_tao(100))
+    )
+    mock_subtensor.storages = storages
+    return mock_subtensor
+
+
+def test_sync_incremental(incremental_subtensor):
+    metagraph = Metagraph(netuid=1, sync=False)
+    metagraph.sync(block=100, subtensor=incremental_subtensor)
+    ranks = metagraph.ranks
+
+    metagraph.sync(subtensor=incremental_subtensor, incremental=True)
+
+    # Only the neurons which set weights, registered, served their axon or prometheus or changed stake are downloaded.
+    incremental_subtensor.neurons_lite.assert_called_once()
+    assert sorted(
+        call.kwargs["uid"]
+        for call in incremental_subtensor.neuron_for_uid_lite.call_args_list
+    ) == [2, 4, 5, 6, 8]
+    assert metagraph.block.item() == 105
+    assert metagraph.ranks is ranks
+    np.testing.assert_allclose(
+        np.asarray(metagraph.ranks),
+        [0.9 if uid in (2, 4, 5, 6, 8) else uid / 10 for uid in range(10)],
+        rtol=1e-6,
+    )
+    assert metagraph.stake[8] == 100
+    assert metagraph.last_update[2] == 103
+    assert metagraph.neurons[6].rank == 0.9
+    assert metagraph.axons[4] == metagraph.neurons[4].axon_info
+
+
+@pytest.mark.parametrize(
+    "blocks_since_epoch, last_update",
+    [
+        (1, [50] * 10),  # The subnet ran its epoch at block 104.
+        (20, [50] * 11),  # A neuron registered.
+        (20, [103] * 10),  # Every neuron changed.
+    ],
+)
+def test_sync_incremental_falls_back_to_full_sync(
+    incremental_subtensor, blocks_since_epoch, last_update
+):
+    metagraph = Metagraph(netuid=1, sync=False)
+    metagraph.sync(block=100, subtensor=incremental_subtensor)
+    incremental_subtensor.storages["BlocksSinceLastStep"] = blocks_since_epoch
+    incremental_subtensor.storages["LastUpdate"] = last_update
+
+    metagraph.sync(subtensor=incremental_subtensor, incremental=True)
+
+    assert incremental_subtensor.neurons_lite.call_count == 2
+    incremental_subtensor.neuron_for_uid_lite.assert_not_called()
+    assert metagraph.block.item() == 105
+
+
+def test_sync_incremental_without_previous_sync(incremental_subtensor):
+    metagraph = Metagraph(netuid=1, sync=False)
+    metagraph.sync(subtensor=incremental_subtensor, incremental=True)
+
+    incremental_subtensor.neurons_lite.assert_called_once()
+    incremental_subtensor.query_subtensor.assert_not_called()
@@ -0,0 +1,78 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+from types import SimpleNamespace
+
+from bittensor.core.metrics import AxonMetrics, Counter, Histogram
+from bittensor.core.scheduler import PriorityScheduler
+from bittensor.core.threadpool import PriorityThreadPoolExecutor
+
+
+def test_counter_render():
+    counter = Counter("requests_total", "Requests.", ("synapse", "status_code"))
+    counter.inc("Synapse", "200")
+    counter.inc("Synapse", "200")
+    counter.inc('Quote"d', "500", amount=3)
+    assert counter.value("Synapse", "200") == 2
+    assert counter.render() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{synapse="Quote\\"d",status_code="500"} 3.0',
+        'requests_total{synapse="Synapse",status_code="200"} 2.0',
+    ]
+
+
+def test_histogram_render():
+    histogram = Histogram("duration_seconds", "Durations.", ("stage",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, "forward")
+    assert histogram.count("forward") == 4
+    assert histogram.count("verify") == 0
+    assert histogram.render() == [
+        "# HELP duration_seconds Durations.",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{stage="forward",le="0.1"} 2',
+        'duration_seconds_bucket{stage="forward",le="1.0"} 3',
+        'duration_seconds_bucket{stage="forward",le="+Inf"} 4',
+        'duration_seconds_sum{stage="forward"} 2.65',
+        'duration_seconds_count{stage="forward"} 4',
+    ]
+
+
+def test_axon_metrics_render():
+    axon = SimpleNamespace(
+        forward_class_types={"Synapse": None},
+        thread_pool=PriorityThreadPoolExecutor(max_workers=1),
+        forward_executor=None,
+        scheduler=PriorityScheduler(max_concurrency=2),
+        admission=None,
+    )
+    metrics = AxonMetrics(axon)
+    metrics.observe_request("Synapse", 200)
+    metrics.observe_request("../etc/passwd", 404)
+    metrics.observe_stage("Synapse", "verify", 0.002)
+
+    rendered = metrics.render()
+    assert rendered.endswith("\n")
+    assert 'synapse="unknown",status_code="404"' in rendered
+    assert (
+        'bittensor_axon_stage_duration_seconds_bucket{synapse="Synapse",stage="verify",le="0.0025"} 1'
+        in rendered
+    )
+    assert "bittensor_axon_scheduler_queue_depth 0" in rendered
+    assert "bittensor_axon_requests_shed_total" not in rendered
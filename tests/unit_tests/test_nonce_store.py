@@ -0,0 +1,162 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import threading
+
+import pytest
+
+from bittensor.core.errors import NonceStoreFullError
+from bittensor.core.nonce_store import DiskNonceStore, MemoryNonceStore
+from bittensor.utils.axon_utils import (
+    ALLOWED_DELTA,
+    MAX_NONCE_TIMEOUT,
+    NONCE_TTL_NS,
+    allowed_nonce_window_ns,
+)
+
+
+@pytest.fixture(params=["memory", "disk"])
+def nonce_store(request, tmp_path):
+    if request.param == "memory":
+        store = MemoryNonceStore(max_size=8, shards=2)
+    else:
+        store = DiskNonceStore(path=str(tmp_path / "nonces.db"), max_size=8)
+    yield store
+    store.close()
+
+
+def test_set_and_get(nonce_store):
+    assert nonce_store.get("hotkey:uuid") is None
+    assert "hotkey:uuid" not in nonce_store
+
+    nonce_store["hotkey:uuid"] = 1
+    nonce_store.set("hotkey:uuid", 2)
+
+    assert nonce_store.get("hotkey:uuid") == 2
+    assert nonce_store["hotkey:uuid"] == 2
+    assert "hotkey:uuid" in nonce_store
+    assert len(nonce_store) == 1
+
+
+def test_advance(nonce_store):
+    assert nonce_store.advance("hotkey:uuid", 2)
+    assert not nonce_store.advance("hotkey:uuid", 2)
+    assert not nonce_store.advance("hotkey:uuid", 1)
+    assert nonce_store.advance("hotkey:uuid", 3)
+    assert nonce_store.get("hotkey:uuid") == 3
+
+    # An expired nonce does not block older ones, they fail the freshness check instead.
+    nonce_store.set("hotkey:uuid", 4, ttl_ns=0)
+    assert nonce_store.advance("hotkey:uuid", 1)
+
+
+def test_advance_is_atomic():
+    store = MemoryNonceStore()
+    barrier = threading.Barrier(8)
+    accepted = []
+
+    def verify():
+        barrier.wait()
+        accepted.append(store.advance("hotkey:uuid", 1))
+
+    threads = [threading.Thread(target=verify) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(accepted) == [False] * 7 + [True]
+
+
+def test_missing_key_raises(nonce_store):
+    with pytest.raises(KeyError):
+        nonce_store["missing"]
+
+
+def test_ttl_eviction(nonce_store):
+    nonce_store.set("expired", 1, ttl_ns=0)
+    nonce_store.set("alive", 2, ttl_ns=60 * 10**9)
+
+    assert nonce_store.get("expired") is None
+    assert nonce_store.get("alive") == 2
+    assert list(nonce_store) == ["alive"]
+
+
+def test_memory_store_size_bound():
+    store = MemoryNonceStore(max_size=4, shards=1)
+    for i in range(4):
+        store.set(f"key{i}", i)
+
+    # Live entries are never evicted, new keys are refused instead.
+    with pytest.raises(NonceStoreFullError):
+        store.set("key4", 4)
+    store.set("key0", 10)
+    assert store.keys() == ["key1", "key2", "key3", "key0"]
+
+    # Expired entries make room.
+    store.set("key1", 11, ttl_ns=0)
+    store.set("key4", 4)
+    assert store.keys() == ["key2", "key3", "key0", "key4"]
+
+
+def test_memory_store_concurrent_access():
+    store = MemoryNonceStore(max_size=10_000)
+
+    def writer(offset):
+        for i in range(500):
+            store.set(f"{offset}:{i}", i)
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store) == 4000
+
+
+def test_disk_store_survives_restart(tmp_path):
+    path = str(tmp_path / "nonces.db")
+    store = DiskNonceStore(path=path)
+    store.set("hotkey:uuid", 42)
+    store.close()
+
+    reopened = DiskNonceStore(path=path)
+    assert reopened.get("hotkey:uuid") == 42
+    reopened.close()
+
+
+def test_disk_store_size_bound(tmp_path):
+    store = DiskNonceStore(path=str(tmp_path / "nonces.db"), max_size=4)
+    for i in range(4):
+        store.set(f"key{i}", i)
+
+    with pytest.raises(NonceStoreFullError):
+        store.set("key4", 4)
+    store.set("key0", 10)
+    assert store.get("key0") == 10
+
+    store.set("key1", 11, ttl_ns=0)
+    store.set("key4", 4)
+    assert sorted(store) == ["key0", "key2", "key3", "key4"]
+    store.close()
+
+
+def test_nonce_ttl_covers_widest_nonce_window():
+    assert NONCE_TTL_NS == ALLOWED_DELTA + MAX_NONCE_TIMEOUT * 10**9
+    # The timeout header cannot widen the window past the time nonces are kept.
+    assert allowed_nonce_window_ns(NONCE_TTL_NS, 3600.0) == 0
@@ -0,0 +1,83 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import numpy as np
+import pytest
+
+from bittensor.core import rate_limiter as rate_limiter_module
+from bittensor.core.rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_allows_burst_then_refills(clock):
+    limiter = TokenBucketRateLimiter(rate=2, burst=3)
+    assert [limiter.allow("hotkey") for _ in range(4)] == [True, True, True, False]
+
+    clock[0] += 0.5
+    assert limiter.allow("hotkey")
+    assert not limiter.allow("hotkey")
+
+    # Buckets never hold more than the burst.
+    clock[0] += 60
+    assert [limiter.allow("hotkey") for _ in range(4)] == [True, True, True, False]
+
+
+def test_keys_have_separate_buckets(clock):
+    limiter = TokenBucketRateLimiter(rate=1)
+    assert limiter.burst == 1
+    assert limiter.allow("a")
+    assert not limiter.allow("a")
+    assert limiter.allow("b")
+
+
+def test_bounded_number_of_buckets(clock):
+    limiter = TokenBucketRateLimiter(rate=1, max_keys=2)
+    for key in ["a", "b", "c"]:
+        limiter.allow(key)
+    assert len(limiter) == 2
+
+
+def test_stake_weights_scale_buckets(clock):
+    limiter = TokenBucketRateLimiter(rate=1, burst=2)
+    limiter.set_stake_weights(
+        ["whale", "average", "minnow"], np.array([10.0, 1.0, 0.0])
+    )
+    assert limiter.weight("whale") == pytest.approx(10 / (11 / 3))
+    assert limiter.weight("average") == 1.0
+    assert limiter.weight("minnow") == 1.0
+    assert limiter.weight("unknown") == 1.0
+
+    whale_allowed = sum(limiter.allow("whale") for _ in range(10))
+    minnow_allowed = sum(limiter.allow("minnow") for _ in range(10))
+    assert (whale_allowed, minnow_allowed) == (5, 2)
+
+    limiter.set_stake_weights(["whale"], [100.0], max_weight=3.0)
+    assert limiter.weight("whale") == 1.0
+
+    limiter.set_stake_weights(["whale", "minnow"], [100.0, 0.0], max_weight=1.5)
+    assert limiter.weight("whale") == 1.5
+
+
+def test_rejects_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0)
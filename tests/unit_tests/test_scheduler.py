@@ -0,0 +1,179 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import time
+
+import pytest
+
+from bittensor.core.scheduler import AdmissionController, PriorityScheduler
+
+
+async def run_call(scheduler, order, name, priority=0.0, deadline=None, hold=0.01):
+    async with scheduler.slot(priority=priority, deadline=deadline):
+        order.append(name)
+        await asyncio.sleep(hold)
+
+
+@pytest.mark.asyncio
+async def test_admits_waiting_calls_by_priority():
+    scheduler = PriorityScheduler(max_concurrency=1)
+    order = []
+    first = asyncio.create_task(run_call(scheduler, order, "first"))
+    await asyncio.sleep(0)
+
+    waiting = [
+        asyncio.create_task(run_call(scheduler, order, name, priority))
+        for name, priority in [
+            ("low", 1.0),
+            ("high", 10.0),
+            ("mid", 5.0),
+            ("mid2", 5.0),
+        ]
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 4
+    assert scheduler.in_flight == 1
+
+    await asyncio.gather(first, *waiting)
+    assert order == ["first", "high", "mid", "mid2", "low"]
+    assert scheduler.in_flight == 0
+    assert scheduler.queue_depth == 0
+
+    stats = scheduler.stats()
+    assert stats["admitted"] == 5
+    assert stats["expired"] == 0
+    assert stats["max_wait_time"] >= stats["mean_wait_time"] > 0
+
+
+@pytest.mark.asyncio
+async def test_runs_up_to_max_concurrency():
+    scheduler = PriorityScheduler(max_concurrency=3)
+    order = []
+    start = time.time()
+    await asyncio.gather(*[run_call(scheduler, order, i, hold=0.05) for i in range(3)])
+    assert time.time() - start < 0.1
+    assert scheduler.stats()["max_wait_time"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_drops_calls_past_their_deadline():
+    scheduler = PriorityScheduler(max_concurrency=1)
+    order = []
+    first = asyncio.create_task(run_call(scheduler, order, "first", hold=0.1))
+    await asyncio.sleep(0)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await run_call(scheduler, order, "late", deadline=time.time() + 0.01)
+    await first
+
+    assert order == ["first"]
+    assert scheduler.stats()["expired"] == 1
+    assert scheduler.in_flight == 0
+
+    # The slot of the dropped call is not leaked.
+    await run_call(scheduler, order, "next")
+    assert order == ["first", "next"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    scheduler = PriorityScheduler(max_concurrency=1)
+    order = []
+    first = asyncio.create_task(run_call(scheduler, order, "first", hold=0.02))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(run_call(scheduler, order, "cancelled"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await first
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await asyncio.wait_for(run_call(scheduler, order, "next"), timeout=1)
+    assert order == ["first", "next"]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_waiters_leave_the_queue():
+    scheduler = PriorityScheduler(max_concurrency=1)
+    order = []
+    first = asyncio.create_task(run_call(scheduler, order, "first", hold=0.1))
+    await asyncio.sleep(0)
+
+    expired = await asyncio.gather(
+        *[
+            run_call(scheduler, order, i, deadline=time.time() + 0.01)
+            for i in range(100)
+        ],
+        return_exceptions=True,
+    )
+    assert all(isinstance(e, asyncio.TimeoutError) for e in expired)
+    await asyncio.sleep(0)
+    # Neither counted as queued, nor kept in the heap.
+    assert scheduler.queue_depth == 0
+    assert len(scheduler._waiters) <= 1
+
+    waiting = asyncio.create_task(run_call(scheduler, order, "waiting"))
+    await asyncio.sleep(0)
+    assert scheduler.queue_depth == 1
+    await asyncio.gather(first, waiting)
+    assert order == ["first", "waiting"]
+    assert scheduler.queue_depth == 0
+
+
+def test_rejects_invalid_concurrency():
+    with pytest.raises(ValueError):
+        PriorityScheduler(max_concurrency=0)
+
+
+def test_admission_estimates_delay_from_service_times():
+    controller = AdmissionController(concurrency=2, alpha=0.5)
+    assert controller.estimated_delay("Slow") == 0.0
+    assert controller.admit("Slow", remaining=1.0)
+
+    controller.record("Slow", 1.0)
+    controller.record("Slow", 3.0)
+    assert controller.service_time("Slow") == 2.0
+    assert controller.service_time("Fast") == 0.0
+
+    # One request in flight, spread over two workers, plus the own service time.
+    assert controller.estimated_delay("Slow") == pytest.approx(1.0 + 2.0)
+    assert controller.estimated_delay("Fast") == pytest.approx(1.0)
+
+    controller.release()
+    assert controller.in_flight == 0
+    assert controller.estimated_delay("Slow") == 2.0
+
+
+def test_admission_sheds_requests_past_their_deadline():
+    controller = AdmissionController(concurrency=1)
+    controller.record("Synapse", 1.0)
+
+    assert not controller.admit("Synapse", remaining=0.5)
+    assert not controller.admit("Synapse", remaining=-1.0)
+    assert controller.admit("Synapse", remaining=1.5)
+    # The admitted request now delays the next ones.
+    assert not controller.admit("Synapse", remaining=1.5)
+    assert controller.in_flight == 1
+
+    assert controller.stats() == {
+        "in_flight": 1,
+        "admitted": 1,
+        "shed": 3,
+        "service_times": {"Synapse": 1.0},
+    }
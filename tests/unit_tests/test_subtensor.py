@@ -135,18 +135,20 @@ def test_serve_axon_with_external_port_set():
     )
 
     with mock.patch(
-        "bittensor.utils.networking.get_external_ip", return_value=external_ip
+        "bittensor.utils.networking.get_cached_external_ip", return_value=external_ip
     ):
-        # mock the get_external_ip function to return the external ip
+        # mock the get_cached_external_ip function to return the external ip
         mock_subtensor.serve_axon(
             netuid=-1,
             axon=mock_axon_with_external_port_set,
         )
 
-    mock_serve_axon.assert_called_once()
-    # verify that the axon is served to the network with the external port
-    _, kwargs = mock_serve_axon.call_args
-    axon_info = kwargs["axon"].info()
+        mock_serve_axon.assert_called_once()
+        # verify that the axon is served to the network with the external port
+        _, kwargs = mock_serve_axon.call_args
+        # The external ip is resolved when the axon info is first built.
+        axon_info = kwargs["axon"].info()
+    assert axon_info.ip == external_ip
     assert axon_info.port == external_port
 
 
@@ -1431,6 +1433,84 @@ def test_neuron_for_uid_success(subtensor, mocker):
     assert result == mocked_neuron_from_vec_u8.return_value
 
 
+def test_neuron_for_uid_lite_success(subtensor, mocker):
+    """Test neuron_for_uid_lite successful call."""
+    # Prep
+    fake_uid = 1
+    fake_netuid = 2
+    fake_block = 123
+    mocked_neuron_from_vec_u8 = mocker.patch.object(
+        subtensor_module.NeuronInfoLite, "from_vec_u8"
+    )
+
+    # Call
+    result = subtensor.neuron_for_uid_lite(
+        uid=fake_uid, netuid=fake_netuid, block=fake_block
+    )
+
+    # Asserts
+    subtensor.substrate.get_block_hash.assert_called_once_with(fake_block)
+    subtensor.substrate.rpc_request.assert_called_once_with(
+        method="neuronInfo_getNeuronLite",
+        params=[fake_netuid, fake_uid, subtensor.substrate.get_block_hash.return_value],
+    )
+
+    mocked_neuron_from_vec_u8.assert_called_once_with(
+        subtensor.substrate.rpc_request.return_value.get.return_value
+    )
+    assert result == mocked_neuron_from_vec_u8.return_value
+
+
+def test_neuron_for_uid_lite_response_none(subtensor, mocker):
+    """Test neuron_for_uid_lite returns a null neuron when the neuron does not exist."""
+    # Prep
+    mocked_null_neuron = mocker.patch.object(
+        subtensor_module.NeuronInfoLite, "get_null_neuron"
+    )
+    subtensor.substrate.rpc_request.return_value.get.return_value = None
+
+    # Call
+    result = subtensor.neuron_for_uid_lite(uid=1, netuid=2)
+
+    # Asserts
+    subtensor.substrate.get_block_hash.assert_not_called()
+    subtensor.substrate.rpc_request.assert_called_once_with(
+        method="neuronInfo_getNeuronLite", params=[2, 1]
+    )
+    assert result == mocked_null_neuron.return_value
+
+
+def test_get_total_stake_for_hotkeys(subtensor, mocker):
+    """Test get_total_stake_for_hotkeys queries every hotkey in a single request."""
+    # Prep
+    fake_hotkeys = ["hotkey_1", "hotkey_2"]
+    fake_block = 123
+    subtensor.substrate.create_storage_key.side_effect = (
+        lambda pallet, storage_function, params: mocker.Mock(params=params)
+    )
+    subtensor.substrate.query_multi.side_effect = lambda storage_keys, block_hash: [
+        (storage_keys[0], mocker.Mock(value=5)),
+        (storage_keys[1], None),
+    ]
+
+    # Call
+    result = subtensor.get_total_stake_for_hotkeys(*fake_hotkeys, block=fake_block)
+
+    # Asserts
+    subtensor.substrate.create_storage_key.assert_has_calls(
+        [
+            mocker.call("SubtensorModule", "TotalHotkeyStake", [hotkey])
+            for hotkey in fake_hotkeys
+        ]
+    )
+    subtensor.substrate.query_multi.assert_called_once()
+    assert result == {
+        "hotkey_1": Balance.from_rao(5),
+        "hotkey_2": Balance.from_rao(0),
+    }
+    assert subtensor.get_total_stake_for_hotkeys() == {}
+
+
 @pytest.mark.parametrize(
     ["fake_call_params", "expected_call_function"],
     [
@@ -17,11 +17,16 @@
 
 import base64
 import json
+import sys
 from typing import Optional, ClassVar
+from unittest.mock import patch
 
 import pytest
+from pydantic import BaseModel, Field
 
-from bittensor.core.synapse import Synapse
+from bittensor.core import synapse as synapse_module
+from bittensor.core.synapse import Synapse, TerminalInfo, estimate_size, get_size
+from bittensor.utils import get_hash
 
 
 def test_parse_headers_to_inputs():
@@ -94,6 +99,58 @@ def test_from_headers():
     assert synapse.total_size == 111
 
 
+def test_parse_headers_to_inputs_lookup():
+    class Test(Synapse):
+        camelCase: list[int]
+
+    encoded = base64.b64encode(json.dumps([1, 2]).encode("utf-8")).decode("utf-8")
+    # HTTP servers may lower case the header names.
+    headers = {
+        "bt_header_input_obj_camelcase": encoded,
+        "bt_header_axon_unknown": "1",
+        "bt_header_input_obj_unknown": encoded,
+        "x_bt_header_axon_ip": "1.1.1.1",
+        "bt_header_input_obj_axon": encoded,
+    }
+
+    inputs_dict = Test.parse_headers_to_inputs(headers)
+    assert inputs_dict["camelCase"] == [1, 2]
+    assert inputs_dict["axon"] == {}
+    assert "unknown" not in inputs_dict
+    # Subclasses do not share their lookup table.
+    assert "bt_header_input_obj_camelcase" not in Synapse._header_decoder
+
+
+def test_terminal_info_parse_headers():
+    terminal = TerminalInfo(
+        status_code=200, process_time=0.5, ip="127.0.0.1", port=8091, nonce=1
+    )
+    headers = {**terminal.to_headers("axon"), "bt_header_dendrite_port": "1"}
+
+    values = TerminalInfo.parse_headers(headers, "axon")
+    # The values are the ones validation produces.
+    assert values == terminal.model_dump(exclude_none=True)
+    assert TerminalInfo(**values) == terminal
+    assert TerminalInfo.parse_headers(headers, "dendrite") == {"port": 1}
+
+    with pytest.raises(ValueError):
+        TerminalInfo.parse_headers({"bt_header_axon_port": "port"}, "axon")
+
+
+def test_terminal_info_parse_headers_matches_from_headers():
+    synapse = Synapse(
+        axon=TerminalInfo(status_code=200, process_time=0.1, hotkey="axon"),
+        dendrite=TerminalInfo(ip="127.0.0.1", port=8091, nonce=1, hotkey="dendrite"),
+    )
+    headers = synapse.to_headers()
+
+    parsed = Synapse.from_headers(headers)
+    for terminal in ("axon", "dendrite"):
+        assert TerminalInfo.parse_headers(headers, terminal) == getattr(
+            parsed, terminal
+        ).model_dump(exclude_none=True)
+
+
 def test_synapse_create():
     # Create an instance of Synapse
     synapse = Synapse()
@@ -267,3 +324,212 @@ def test_synapse_body_hash(synapse_cls):
     # Different hashed values should result in different body hashes
     synapse_different = synapse_cls(a=1, b=2)
     assert synapse_instance.body_hash != synapse_different.body_hash
+
+
+class HeaderPlanItem(BaseModel):
+    value: int = 0
+
+
+class HeaderPlanSynapse(Synapse):
+    text: str
+    numbers: list[int]
+    item: HeaderPlanItem
+    mapping: dict[str, float]
+    aliased: str = Field(alias="other")
+    optional: Optional[str] = None
+    with_default: list[str] = []
+
+
+def legacy_to_headers(synapse: Synapse) -> dict:
+    """The former implementation of `to_headers`, which generated the JSON schema for every field."""
+    headers = {"name": synapse.name, "timeout": str(synapse.timeout)}
+    if synapse.axon:
+        headers.update(
+            {
+                f"bt_header_axon_{k}": str(v)
+                for k, v in synapse.axon.model_dump().items()
+                if v is not None
+            }
+        )
+    if synapse.dendrite:
+        headers.update(
+            {
+                f"bt_header_dendrite_{k}": str(v)
+                for k, v in synapse.dendrite.model_dump().items()
+                if v is not None
+            }
+        )
+    for field, value in synapse.model_dump().items():
+        required = synapse.__class__.model_json_schema().get("required", [])
+        if field in headers or value is None:
+            continue
+        elif required and field in required:
+            headers[f"bt_header_input_obj_{field}"] = base64.b64encode(
+                json.dumps(value.__class__.__call__()).encode()
+            ).decode("utf-8")
+    headers["header_size"] = str(sys.getsizeof(headers))
+    headers["total_size"] = str(synapse.get_total_size())
+    headers["computed_body_hash"] = synapse.body_hash
+    return headers
+
+
+@pytest.fixture
+def header_plan_synapse():
+    return HeaderPlanSynapse(
+        text="hello",
+        numbers=[1, 2, 3],
+        item=HeaderPlanItem(value=1),
+        mapping={"a": 1.0},
+        other="aliased",
+        dendrite=TerminalInfo(ip="127.0.0.1", port=8091, hotkey="hotkey"),
+        axon=TerminalInfo(ip="127.0.0.2", port=8092),
+    )
+
+
+def test_required_header_fields_are_compiled_per_class():
+    assert Synapse.get_required_fields(Synapse()) == []
+    assert HeaderPlanSynapse._required_header_fields == (
+        "text",
+        "numbers",
+        "item",
+        "mapping",
+    )
+
+    class Child(HeaderPlanSynapse):
+        extra: int
+
+    assert Child._required_header_fields[-1] == "extra"
+    assert HeaderPlanSynapse._required_header_fields[-1] == "mapping"
+
+
+def test_to_headers_matches_schema_based_headers(header_plan_synapse):
+    headers = header_plan_synapse.to_headers()
+    expected = legacy_to_headers(header_plan_synapse)
+    # The total size accounts for the total_size value set by the previous call.
+    headers.pop("total_size")
+    expected.pop("total_size")
+    assert headers == expected
+
+
+def test_to_headers_not_json_serializable():
+    class SetSynapse(Synapse):
+        values: set[int]
+
+    with pytest.raises(ValueError, match="json serializable"):
+        SetSynapse(values={1}).to_headers()
+
+
+def test_terminal_info_to_headers():
+    terminal = TerminalInfo(ip="127.0.0.1", port=8091, nonce=1)
+
+    assert terminal.to_headers("dendrite") == {
+        "bt_header_dendrite_ip": "127.0.0.1",
+        "bt_header_dendrite_port": "8091",
+        "bt_header_dendrite_nonce": "1",
+    }
+    headers = Synapse(dendrite=terminal).to_headers()
+    assert terminal.to_headers("dendrite").items() <= headers.items()
+
+
+def test_body_hash_is_cached_until_a_hash_field_is_assigned():
+    synapse_instance = HashedSynapse(a=1, b=2, d=["foobar"])
+    body_hash = synapse_instance.body_hash
+
+    with patch.object(
+        synapse_module, "get_hash", wraps=synapse_module.get_hash
+    ) as hash_fn:
+        assert synapse_instance.body_hash == body_hash
+        hash_fn.assert_not_called()
+
+        # Fields outside of required_hash_fields do not invalidate the hash.
+        synapse_instance.c = 3
+        synapse_instance.timeout = 5.0
+        assert synapse_instance.body_hash == body_hash
+        hash_fn.assert_not_called()
+
+        # Only the assigned field is hashed again.
+        synapse_instance.a = 5
+        assert synapse_instance.body_hash != body_hash
+        assert hash_fn.call_count == 2
+
+    assert synapse_instance.body_hash == HashedSynapse(a=5, b=2, d=["foobar"]).body_hash
+
+
+def test_body_hash_of_model_copy():
+    synapse_instance = HashedSynapse(a=1, b=2)
+    body_hash = synapse_instance.body_hash
+
+    assert synapse_instance.model_copy().body_hash == body_hash
+    updated = synapse_instance.model_copy(update={"b": 3})
+    assert updated.body_hash == HashedSynapse(a=1, b=3).body_hash
+    assert synapse_instance.body_hash == body_hash
+
+
+def test_equality_ignores_cached_body_hash():
+    synapse_instance = HashedSynapse(a=1, b=2)
+    other = HashedSynapse(a=1, b=2)
+    synapse_instance.body_hash
+
+    assert synapse_instance == other
+    assert synapse_instance != HashedSynapse(a=1, b=3)
+    assert synapse_instance != Synapse()
+
+
+def test_body_hash_matches_dumped_fields():
+    class ModelSynapse(Synapse):
+        text: str = ""
+        item: Optional[HeaderPlanItem] = None
+        items: list[HeaderPlanItem] = []
+        required_hash_fields: ClassVar[tuple[str, ...]] = ("text", "item", "items")
+
+    synapse_instance = ModelSynapse(
+        text="hello", item=HeaderPlanItem(value=1), items=[HeaderPlanItem(value=2)]
+    )
+    dumped = synapse_instance.model_dump()
+    assert synapse_instance.body_hash == get_hash(
+        "".join(get_hash(str(dumped[field])) for field in ("text", "item", "items"))
+    )
+
+
+class SizedSynapse(Synapse):
+    texts: list[str] = []
+    scores: dict[str, float] = {}
+    item: Optional[HeaderPlanItem] = None
+
+
+@pytest.fixture
+def sized_synapse():
+    return SizedSynapse(
+        texts=[f"completion {i} " * (i % 7 + 1) for i in range(2000)],
+        scores={f"uid{i}": i / 3 for i in range(500)},
+        item=HeaderPlanItem(value=3),
+    )
+
+
+def test_total_size_is_serialized_length(sized_synapse):
+    serialized_size = len(sized_synapse.model_dump_json())
+    assert sized_synapse.get_total_size() == serialized_size
+    assert sized_synapse.total_size == serialized_size
+    # An already serialized body is not measured again.
+    assert sized_synapse.get_total_size(body_size=123) == 123
+    assert sized_synapse.to_headers(body_size=456)["total_size"] == "456"
+
+
+def test_total_size_sampled(sized_synapse, monkeypatch):
+    monkeypatch.setattr(SizedSynapse, "size_accounting", "sampled")
+    serialized_size = len(sized_synapse.model_dump_json())
+    assert abs(sized_synapse.get_total_size() - serialized_size) < 0.1 * serialized_size
+
+
+def test_total_size_deep(sized_synapse, monkeypatch):
+    monkeypatch.setattr(SizedSynapse, "size_accounting", "deep")
+    deep_size = get_size(sized_synapse)
+    assert sized_synapse.get_total_size(body_size=123) == deep_size
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, True, False, 12, 1.5, "text", [], {}, [1, 2, 3], {"a": [1, "b"], "c": None}],
+)
+def test_estimate_size_of_small_values_is_exact(value):
+    assert estimate_size(value) == len(json.dumps(value, separators=(",", ":")))
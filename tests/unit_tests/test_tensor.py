@@ -15,6 +15,8 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import warnings
+
 import numpy
 import numpy as np
 import pytest
@@ -243,3 +245,84 @@ def test_serialize_all_types_equality_torch(force_legacy_torch_compatible_api):
 
     torchtensor = torch.randn([100], dtype=torch.float32) < 0.5
     assert torch.all(Tensor.serialize(torchtensor).tensor() == torchtensor)
+
+
+def test_deserialize_is_cached_and_read_only():
+    data = np.arange(12, dtype=np.float32).reshape(3, 4)
+    tensor = Tensor.serialize(data)
+
+    first = tensor.deserialize()
+    assert np.shares_memory(first, tensor.numpy())
+    assert not first.flags.writeable
+    assert np.array_equal(first, data)
+    with pytest.raises(ValueError):
+        first[0, 0] = 1.0
+
+
+def test_deserialize_torch_in_place_keeps_cache(force_legacy_torch_compatible_api):
+    tensor = Tensor.serialize(torch.zeros(4))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        tensor.tensor().add_(1)
+    assert torch.equal(tensor.tensor(), torch.zeros(4))
+
+
+def test_equality_ignores_decoded_array():
+    data = np.array([1.0, 2.0], dtype=np.float32)
+    tensor = Tensor.serialize(data)
+    other = Tensor.serialize(data)
+    tensor.deserialize()
+
+    assert tensor == other
+    assert tensor != Tensor.serialize(data + 1)
+
+
+@pytest.mark.parametrize("codec", ["fp16", "int8+gzip"])
+def test_serialize_with_codec(codec):
+    data = np.random.default_rng(0).standard_normal((8, 16)).astype(np.float32)
+    tensor = Tensor.serialize(data, codec=codec)
+
+    assert tensor.codec == codec
+    assert tensor.dtype == "float32"
+    decoded = tensor.deserialize()
+    assert decoded.dtype == np.float32
+    assert decoded.shape == (8, 16)
+    np.testing.assert_allclose(decoded, data, atol=0.05)
+    assert Tensor.model_validate(tensor.model_dump()) == tensor
+
+
+def test_plain_tensor_dump_has_no_codec(example_tensor):
+    assert "codec" not in example_tensor.model_dump()
+    with pytest.raises(ValueError):
+        Tensor(buffer=example_tensor.buffer, dtype="int64", shape=[4], codec="fp8")
+
+
+def test_with_codec_field():
+    from typing import Annotated, Optional
+
+    from bittensor.core.synapse import Synapse
+    from bittensor.core.tensor import with_codec
+
+    class Embeddings(Synapse):
+        embeddings: Annotated[Optional[Tensor], with_codec("fp16")] = None
+
+    data = np.arange(6, dtype=np.float32).reshape(2, 3)
+    synapse = Embeddings(embeddings=Tensor.serialize(data))
+    assert synapse.embeddings.codec == "fp16"
+    np.testing.assert_array_equal(synapse.embeddings.numpy(), data)
+
+    # The receiving side keeps the codec of the sender.
+    received = Embeddings.model_validate(synapse.model_dump())
+    assert received.embeddings == synapse.embeddings
+    assert received.body_hash == synapse.body_hash
+
+
+def test_deserialize_rejects_data_larger_than_shape():
+    tensor = Tensor.serialize(np.zeros(1024 * 1024, dtype=np.float32), codec="gzip")
+    forged = Tensor(
+        buffer=tensor.buffer, dtype=tensor.dtype, shape=[16], codec=tensor.codec
+    )
+
+    with pytest.raises(ValueError):
+        forged.deserialize()
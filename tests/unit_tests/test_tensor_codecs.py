@@ -0,0 +1,142 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import msgpack
+import msgpack_numpy
+import numpy as np
+import pytest
+
+from bittensor.core import tensor_codecs
+from bittensor.utils import compression
+
+
+def _codecs() -> list[str]:
+    lossless = [
+        encoding
+        for encoding in tensor_codecs.LOSSLESS_CODECS
+        if encoding in compression.available_encodings()
+    ]
+    return (
+        list(tensor_codecs.LOSSY_CODECS)
+        + lossless
+        + [f"{lossy}+{lossless[0]}" for lossy in tensor_codecs.LOSSY_CODECS]
+    )
+
+
+@pytest.fixture
+def array():
+    return np.random.default_rng(0).standard_normal((64, 256)).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    "codec, expected",
+    [
+        (None, (None, None)),
+        ("", (None, None)),
+        ("fp16", ("fp16", None)),
+        ("gzip", (None, "gzip")),
+        ("int8+gzip", ("int8", "gzip")),
+    ],
+)
+def test_parse_codec(codec, expected):
+    assert tensor_codecs.parse_codec(codec) == expected
+
+
+@pytest.mark.parametrize(
+    "codec", ["fp8", "gzip+fp16", "fp16+bf16", "gzip+gzip", "fp16+", "int8+br"]
+)
+def test_parse_codec_invalid(codec):
+    with pytest.raises(ValueError):
+        tensor_codecs.parse_codec(codec)
+
+
+@pytest.mark.parametrize("codec", _codecs())
+def test_roundtrip(array, codec):
+    decoded = tensor_codecs.decode(tensor_codecs.encode(array, codec), codec)
+    assert decoded.shape == array.shape
+    if tensor_codecs.parse_codec(codec)[0] is None:
+        np.testing.assert_array_equal(decoded, array)
+
+
+@pytest.mark.parametrize(
+    "codec, relative_error", [("fp16", 1e-3), ("bf16", 8e-3), ("int8", 8e-3)]
+)
+def test_lossy_error_bound(array, codec, relative_error):
+    decoded = tensor_codecs.decode(tensor_codecs.encode(array, codec), codec)
+    max_abs = np.abs(array).max()
+    assert np.abs(decoded.astype(np.float32) - array).max() <= relative_error * max_abs
+
+
+def test_plain_encoding_is_msgpack_numpy(array):
+    # Without codec, the buffers remain readable by the versions predating codecs.
+    assert tensor_codecs.encode(array) == msgpack.packb(
+        array, default=msgpack_numpy.encode
+    )
+
+
+def test_bf16_keeps_range_and_special_values():
+    array = np.array([3e38, -1e-30, np.inf, -np.inf, np.nan, 0.0], dtype=np.float32)
+    decoded = tensor_codecs.decode(tensor_codecs.encode(array, "bf16"), "bf16")
+    assert decoded.dtype == np.float32
+    np.testing.assert_allclose(decoded[:2], array[:2], rtol=8e-3)
+    assert decoded[2] == np.inf and decoded[3] == -np.inf
+    assert np.isnan(decoded[4])
+    assert decoded[5] == 0.0
+
+
+def test_int8_zeros_and_non_finite():
+    zeros = np.zeros(8, dtype=np.float32)
+    np.testing.assert_array_equal(
+        tensor_codecs.decode(tensor_codecs.encode(zeros, "int8"), "int8"), zeros
+    )
+    with pytest.raises(ValueError):
+        tensor_codecs.encode(np.array([1.0, np.nan], dtype=np.float32), "int8")
+
+
+@pytest.mark.parametrize("codec", tensor_codecs.LOSSY_CODECS)
+def test_lossy_codec_rejects_non_float_data(codec):
+    with pytest.raises(ValueError):
+        tensor_codecs.encode(np.arange(10), codec)
+
+
+@pytest.mark.parametrize(
+    "codec", [c for c in _codecs() if tensor_codecs.parse_codec(c)[0] is not None]
+)
+def test_lossy_codec_size(array, codec):
+    # Every lossy codec at least halves float32 data.
+    plain_size = len(tensor_codecs.encode(array))
+    assert len(tensor_codecs.encode(array, codec)) <= 0.55 * plain_size
+
+
+@pytest.mark.parametrize("codec", ["gzip", "fp16+gzip"])
+def test_decode_limits_size_to_shape(codec):
+    array = np.zeros(1024 * 1024, dtype=np.float32)
+    data = tensor_codecs.encode(array, codec)
+    assert len(data) < 0.01 * array.nbytes
+    decoded = tensor_codecs.decode(data, codec, shape=[1024 * 1024], itemsize=4)
+    assert decoded.size == array.size
+
+    # A small declared shape does not let the data decompress to more than it can take.
+    with pytest.raises(compression.DecompressedSizeError):
+        tensor_codecs.decode(data, codec, shape=[16], itemsize=4)
+    with pytest.raises(ValueError, match="elements"):
+        tensor_codecs.decode(data, codec, shape=[1024 * 1024 + 1], itemsize=4)
+
+
+def test_decode_accepts_scalars():
+    data = tensor_codecs.encode(np.float32(1.5), "gzip")
+    assert tensor_codecs.decode(data, "gzip", shape=[0], itemsize=4) == 1.5
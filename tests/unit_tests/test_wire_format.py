@@ -0,0 +1,131 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import datetime
+import json
+import uuid
+from typing import ClassVar, Optional
+
+import numpy as np
+import pytest
+
+from bittensor.core import wire_format
+from bittensor.core.synapse import Synapse
+from bittensor.core.tensor import Tensor
+
+
+class TensorSynapse(Synapse):
+    text: str = ""
+    tensor: Optional[Tensor] = None
+    tensors: list[Tensor] = []
+    scores: dict[str, float] = {}
+    required_hash_fields: ClassVar[tuple[str, ...]] = ("text", "tensor", "tensors")
+
+
+@pytest.fixture
+def synapse():
+    rng = np.random.default_rng(0)
+    return TensorSynapse(
+        text="hello",
+        tensor=Tensor.serialize(rng.standard_normal((16, 64)).astype(np.float32)),
+        tensors=[Tensor.serialize(np.arange(10)), Tensor.serialize(np.array([]))],
+        scores={"a": 0.5},
+    )
+
+
+def test_roundtrip_matches_json(synapse):
+    body = wire_format.unpackb(wire_format.packb(synapse))
+    assert body == json.loads(json.dumps(synapse.model_dump()))
+
+    decoded = TensorSynapse.model_validate(body)
+    assert decoded.body_hash == synapse.body_hash
+    np.testing.assert_array_equal(decoded.tensor.numpy(), synapse.tensor.numpy())
+    np.testing.assert_array_equal(decoded.tensors[0].numpy(), np.arange(10))
+
+
+def test_tensors_travel_as_raw_bytes(synapse):
+    msgpack_size = len(wire_format.packb(synapse))
+    json_size = len(json.dumps(synapse.model_dump()).encode())
+    # The base64 encoding of the buffers inflates them by a third.
+    assert msgpack_size < 0.8 * json_size
+
+
+def test_roundtrip_without_tensor():
+    synapse = TensorSynapse(text="hello")
+    decoded = TensorSynapse.model_validate(
+        wire_format.unpackb(wire_format.packb(synapse))
+    )
+    assert decoded.tensor is None
+    assert decoded.body_hash == synapse.body_hash
+
+
+def test_roundtrip_json_only_types():
+    class RichSynapse(Synapse):
+        created: datetime.datetime
+        request_id: uuid.UUID
+        tags: set[str]
+        by_uid: dict[int, Tensor]
+
+    synapse = RichSynapse(
+        created=datetime.datetime(2024, 1, 1, 12, 30),
+        request_id=uuid.UUID(int=1),
+        tags={"a"},
+        by_uid={3: Tensor.serialize(np.arange(4))},
+    )
+    packed = wire_format.packb(synapse)
+    body = wire_format.unpackb(packed)
+    assert body == json.loads(synapse.model_dump_json())
+    # Tensors under keys converted to strings still travel as raw bytes.
+    assert b"buffer" not in packed
+
+    decoded = RichSynapse.model_validate(body)
+    assert decoded.created == synapse.created
+    assert decoded.request_id == synapse.request_id
+    assert decoded.tags == {"a"}
+    np.testing.assert_array_equal(decoded.by_uid[3].numpy(), np.arange(4))
+
+
+@pytest.mark.parametrize("data", [b"\xc1", b"\x93\x01\x02\x03"])
+def test_unpackb_invalid_body(data):
+    with pytest.raises(ValueError):
+        wire_format.unpackb(data)
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/msgpack; q=1.0, application/json", True),
+        ("application/json, Application/MsgPack", True),
+    ],
+)
+def test_accepts_msgpack(accept, expected):
+    assert wire_format.accepts_msgpack(accept) == expected
+
+
+def test_roundtrip_with_codec():
+    data = np.random.default_rng(0).standard_normal((16, 64)).astype(np.float32)
+    synapse = TensorSynapse(tensor=Tensor.serialize(data, codec="int8+gzip"))
+    body = wire_format.unpackb(wire_format.packb(synapse))
+    assert body == json.loads(json.dumps(synapse.model_dump()))
+
+    decoded = TensorSynapse.model_validate(body)
+    assert decoded.tensor == synapse.tensor
+    assert decoded.body_hash == synapse.body_hash
@@ -1,5 +1,7 @@
 import pytest
+import pytest_asyncio
 import asyncio
+import json
 from bittensor.utils import async_substrate_interface
 from typing import Any
 
@@ -36,3 +38,61 @@ async def test_wait_for_block_async_return():
     )
 
     assert isinstance(result, asyncio.Task)
+
+
+@pytest_asyncio.fixture
+async def fake_rpc_server():
+    """Local JSON-RPC websocket server answering every request immediately."""
+    from websockets.asyncio.server import serve
+
+    async def handler(connection):
+        async for message in connection:
+            request = json.loads(message)
+            await connection.send(
+                json.dumps(
+                    {"jsonrpc": "2.0", "id": request["id"], "result": request["params"]}
+                )
+            )
+            if request["method"] == "chain_subscribeNewHeads":
+                await connection.send(
+                    json.dumps(
+                        {
+                            "jsonrpc": "2.0",
+                            "params": {"subscription": "sub-1", "result": {"n": 1}},
+                        }
+                    )
+                )
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        yield f"ws://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_websocket_retrieve_sequential(fake_rpc_server):
+    ws = async_substrate_interface.Websocket(fake_rpc_server, shutdown_timer=0)
+
+    async with ws:
+        for i in range(5):
+            item_id = await ws.send(
+                {"jsonrpc": "2.0", "method": "system_health", "params": [i]}
+            )
+            response = await ws.retrieve(item_id)
+            assert response["result"] == [i]
+
+    await ws.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_websocket_retrieve_subscription(fake_rpc_server):
+    ws = async_substrate_interface.Websocket(fake_rpc_server, shutdown_timer=0)
+
+    async with ws:
+        item_id = await ws.send(
+            {"jsonrpc": "2.0", "method": "chain_subscribeNewHeads", "params": []}
+        )
+        results = await asyncio.gather(ws.retrieve(item_id), ws.retrieve("sub-1"))
+
+    await ws.shutdown()
+    assert results[0]["id"] == item_id
+    assert results[1]["params"]["result"] == {"n": 1}
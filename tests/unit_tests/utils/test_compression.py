@@ -0,0 +1,102 @@
+# The MIT License (MIT)
+# Copyright © 2024 Opentensor Foundation
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+
+import json
+import random
+
+import numpy as np
+import pytest
+
+from bittensor.core.tensor import Tensor
+from bittensor.utils import compression
+
+
+@pytest.mark.parametrize("encoding", compression.available_encodings())
+def test_compress_roundtrip(encoding):
+    data = b"bittensor " * 1000
+    compressed = compression.compress(data, encoding)
+    assert len(compressed) < len(data)
+    assert compression.decompress(compressed, encoding) == data
+
+
+def test_compress_unsupported_encoding():
+    with pytest.raises(ValueError):
+        compression.compress(b"data", "br")
+    with pytest.raises(ValueError):
+        compression.decompress(b"data", "br")
+
+
+def test_decompress_rejects_oversized_data():
+    compressed = compression.compress(b"\0" * 1_000_000, "gzip")
+    with pytest.raises(ValueError, match="exceeds"):
+        compression.decompress(compressed, "gzip", max_size=1000)
+    assert compression.decompress(compressed, "gzip", max_size=1_000_000) == (
+        b"\0" * 1_000_000
+    )
+
+
+def test_decompress_rejects_truncated_data():
+    compressed = compression.compress(b"bittensor " * 1000, "gzip")
+    with pytest.raises(ValueError, match="Truncated"):
+        compression.decompress(compressed[:-10], "gzip")
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, []),
+        ("", []),
+        ("gzip", ["gzip"]),
+        ("ZSTD, gzip", ["zstd", "gzip"]),
+        (" gzip ,, br", ["gzip", "br"]),
+    ],
+)
+def test_parse_encodings(header, expected):
+    assert compression.parse_encodings(header) == expected
+
+
+def test_negotiate_encoding():
+    assert compression.negotiate_encoding(["br", "gzip"]) == "gzip"
+    assert compression.negotiate_encoding(["br"]) is None
+    assert compression.negotiate_encoding([]) is None
+    assert (
+        compression.negotiate_encoding(["gzip", "zstd"])
+        == compression.available_encodings()[0]
+    )
+
+
+def _text_payload(size: int) -> bytes:
+    words = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "miner"]
+    rng = random.Random(0)
+    text = " ".join(rng.choice(words) for _ in range(size // 5))
+    return json.dumps({"completion": text[:size]}).encode()
+
+
+def _tensor_payload(size: int) -> bytes:
+    array = np.random.default_rng(0).standard_normal(size // 4).astype(np.float32)
+    return json.dumps({"tensor": Tensor.serialize(array).model_dump()}).encode()
+
+
+@pytest.mark.parametrize("encoding", compression.available_encodings())
+@pytest.mark.parametrize("payload", [_text_payload, _tensor_payload])
+def test_compress_typical_payloads(payload, encoding):
+    data = payload(64 * 1024)
+    compressed = compression.compress(data, encoding)
+    # Text compresses well, base64 encoded floats at least lose the base64 overhead.
+    assert len(compressed) < len(data)
+    assert compression.decompress(compressed, encoding) == data
@@ -130,6 +130,60 @@ def test_get_external_ip_os_request_urllib_broken():
                 assert utils.networking.get_external_ip()
 
 
+@pytest.fixture
+def external_ip_cache(monkeypatch, tmp_path):
+    """Isolates the external ip caches, returns the mocked resolution."""
+    monkeypatch.delenv(utils.networking.EXTERNAL_IP_ENV, raising=False)
+    monkeypatch.setattr(utils.networking, "_external_ip_cache", None)
+    monkeypatch.setattr(
+        utils.networking, "EXTERNAL_IP_CACHE_FILE", str(tmp_path / "external_ip.json")
+    )
+    get_external_ip = MagicMock(return_value="192.0.2.1")
+    monkeypatch.setattr(utils.networking, "get_external_ip", get_external_ip)
+    return get_external_ip
+
+
+def test_get_cached_external_ip(external_ip_cache, monkeypatch):
+    """Test the external IP address is resolved once per TTL."""
+    assert utils.networking.get_cached_external_ip() == "192.0.2.1"
+    assert utils.networking.get_cached_external_ip() == "192.0.2.1"
+    external_ip_cache.assert_called_once()
+
+    # Another process reads the cache file.
+    monkeypatch.setattr(utils.networking, "_external_ip_cache", None)
+    assert utils.networking.get_cached_external_ip() == "192.0.2.1"
+    external_ip_cache.assert_called_once()
+
+    external_ip_cache.return_value = "192.0.2.2"
+    assert utils.networking.get_cached_external_ip(ttl=0) == "192.0.2.2"
+
+
+def test_get_cached_external_ip_env_override(external_ip_cache, monkeypatch):
+    """Test the environment variable takes precedence over the resolution."""
+    monkeypatch.setenv(utils.networking.EXTERNAL_IP_ENV, "198.51.100.1")
+    assert utils.networking.get_cached_external_ip() == "198.51.100.1"
+    external_ip_cache.assert_not_called()
+
+
+def test_get_cached_external_ip_ignores_invalid_cache_file(external_ip_cache):
+    """Test a corrupted cache file is ignored and replaced."""
+    with open(utils.networking.EXTERNAL_IP_CACHE_FILE, "w") as f:
+        f.write("{")
+    assert utils.networking.get_cached_external_ip() == "192.0.2.1"
+    external_ip_cache.assert_called_once()
+
+
+def test_axon_resolves_external_ip_lazily(external_ip_cache):
+    """Test creating an axon does not resolve the external IP address."""
+    from bittensor.core.axon import Axon
+    from bittensor_wallet.mock import get_mock_wallet
+
+    axon = Axon(wallet=get_mock_wallet())
+    external_ip_cache.assert_not_called()
+    assert axon.info().ip == "192.0.2.1"
+    external_ip_cache.assert_called_once()
+
+
 # Test formatting WebSocket endpoint URL
 @pytest.mark.parametrize(
     "url, expected",